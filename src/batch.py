@@ -0,0 +1,86 @@
+"""Solves one puzzle for every input file in a directory, using all CPU cores.
+
+Every input is solved in a pool of worker processes; results are printed as JSON lines
+as soon as they're ready (so not necessarily in order), e.g.:
+{"input": "inputs/alice", "module": "day15a", "answer": 423, "parse_time": 0.01, ...}
+Inputs whose solution failed get an "error" instead of an "answer".
+Within the workers, solutions using parallel.parallel_map run serially.
+
+Usage: python src/batch.py day15a DIRECTORY [--workers N] [--pattern GLOB]
+"""
+import argparse
+import json
+import os
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+import runner
+from checkpoint import RESUME_ENV
+
+
+def solve_file(module: str, path: Path) -> dict[str, Any]:
+    """Solves a single input, returning the result as a JSON-serializable dict"""
+    record: dict[str, Any] = {"input": str(path), "module": module}
+
+    try:
+        result = runner.run_file(module, path, trace_memory=False)
+    except Exception as e:
+        record["error"] = "".join(traceback.format_exception_only(type(e), e)).strip()
+        return record
+
+    record["answer"] = result.answer
+    record["parse_time"] = result.parse_time
+    record["solve_time"] = result.solve_time
+    return record
+
+
+def input_files(directory: Path, pattern: str = "*") -> list[Path]:
+    return sorted(p for p in directory.glob(pattern) if p.is_file())
+
+
+def solve_all(module: str, paths: Iterable[Path], workers: Optional[int] = None) \
+        -> Iterable[dict[str, Any]]:
+    """Solves all inputs in a process pool (of os.cpu_count() workers by default),
+    yielding the results as they are ready.
+    """
+    # Import the solution once per worker, rather than once per input
+    with ProcessPoolExecutor(workers or os.cpu_count(), initializer=runner.load,
+                             initargs=(module,)) as executor:
+        futures = [executor.submit(solve_file, module, path) for path in paths]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.partition("\n\n")[0])
+    arg_parser.add_argument("module", help="solution to run, e.g. day15a")
+    arg_parser.add_argument("directory", type=Path, help="directory with the input files")
+    arg_parser.add_argument("--workers", type=int,
+                            help="number of processes (default: number of CPUs)")
+    arg_parser.add_argument("--pattern", default="*",
+                            help="glob selecting the input files in the directory")
+    arg_parser.add_argument("--resume", action="store_true",
+                            help="continue long solutions from their checkpoints "
+                                 "(saved to AOC_CHECKPOINT_DIR)")
+    args = arg_parser.parse_args(argv)
+
+    if args.resume:
+        os.environ[RESUME_ENV] = "1"
+
+    if not runner.MODULE_NAME.match(args.module):
+        arg_parser.error(f"not a solution module: {args.module!r}")
+
+    failed = False
+    for record in solve_all(args.module, input_files(args.directory, args.pattern),
+                            args.workers):
+        print(json.dumps(record, default=str), flush=True)
+        failed = failed or "error" in record
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
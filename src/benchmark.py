@@ -0,0 +1,183 @@
+"""Benchmarks how the solutions scale with the size of their input.
+
+Every solution with an input generator (see generators.py) is run on synthetic inputs
+of increasing sizes; the report shows how time and memory grow from one size to another.
+The "exp" column estimates k in O(n^k): ~1 for linear solutions, ~2 for quadratic ones.
+
+Every measurement happens in a fresh interpreter, so that caches (like the memoized DFS
+of day21b) and memory allocated by previous runs don't skew the results.
+
+Results are also appended to a history file, see history.py for detecting regressions.
+
+Usage: python src/benchmark.py [day01a day14a ...] [--scales 1 10 100] [--timeout 300]
+                               [--no-history]
+"""
+import argparse
+import json
+import math
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional
+
+import history
+import runner
+from generators import GENERATORS, write_input
+
+SCALES = [1, 10, 100]
+
+
+class Measurement(NamedTuple):
+    module: str
+    size: int
+    parse_time: float
+    solve_time: float
+    max_rss: int  # in KiB
+
+    @property
+    def time(self) -> float:
+        return self.parse_time + self.solve_time
+
+    def to_record(self, revision: Optional[str]) -> history.Record:
+        return history.Record(day_of(self.module), self.module[-1], self.size, self.time,
+                              self.max_rss, revision, time.time())
+
+
+def day_of(module: str) -> int:
+    m = runner.MODULE_NAME.match(module)
+    if not m:
+        raise ValueError(f"not a solution module: {module!r}")
+    return int(m[1])
+
+
+def benchmarkable_modules() -> list[str]:
+    return [m for m in runner.all_modules() if day_of(m) in GENERATORS]
+
+
+def measure_in_process(module: str, path: str) -> None:
+    """Runs a solution and prints the Measurement as JSON to stdout.
+    Meant to be run in a fresh interpreter, see measure().
+    """
+    r = runner.run_file(module, Path(path), trace_memory=False)
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"parse_time": r.parse_time, "solve_time": r.solve_time,
+                      "max_rss": max_rss}))
+
+
+def measure(module: str, path: Path, size: int, timeout: Optional[float] = None) \
+        -> Measurement:
+    """Measures a solution in a separate interpreter.
+    Raises subprocess.TimeoutExpired if the solution takes more than timeout seconds.
+    """
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, benchmark; benchmark.measure_in_process(sys.argv[1], sys.argv[2])",
+            module,
+            str(path),
+        ],
+        cwd=runner.SRC_DIR,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+
+    if process.returncode != 0:
+        raise RuntimeError(f"{module} failed on {path}:\n{process.stderr}")
+
+    data = json.loads(process.stdout.splitlines()[-1])
+    return Measurement(module, size, data["parse_time"], data["solve_time"], data["max_rss"])
+
+
+def growth_exponent(before: Measurement, after: Measurement) -> float:
+    """Estimates k in O(n^k), given two measurements on different input sizes"""
+    if before.time <= 0 or after.time <= 0:
+        return math.nan
+    return math.log(after.time / before.time) / math.log(after.size / before.size)
+
+
+def benchmark(modules: Iterable[str], scales: list[int], workdir: Path,
+              timeout: Optional[float] = None) -> Iterable[Measurement]:
+    """Measures every module on inputs of every scale (relative to default generator size).
+    Bigger inputs of a module are skipped after it exceeds the timeout.
+    """
+    for module in modules:
+        day = day_of(module)
+        _, default_size = GENERATORS[day]
+
+        for scale in scales:
+            size = default_size * scale
+
+            # Inputs are shared between parts, so only generate each once
+            path = workdir / f"{day:02}-{size}"
+            if not path.exists():
+                with path.open("w") as f:
+                    write_input(day, size, f)
+
+            try:
+                yield measure(module, path, size, timeout)
+            except subprocess.TimeoutExpired:
+                print(f"{module} exceeded {timeout} s with {size} items", file=sys.stderr)
+                break
+
+
+def recorded(measurements: Iterable[Measurement], history_path: Path) \
+        -> Iterable[Measurement]:
+    """Appends measurements to the history file, as they are made"""
+    revision = history.git_revision()
+    for m in measurements:
+        history.append([m.to_record(revision)], history_path)
+        yield m
+
+
+def print_report(measurements: Iterable[Measurement], file=sys.stdout) -> None:
+    print(f"{'module':<8} {'size':>10} {'parse [s]':>10} {'solve [s]':>10} "
+          f"{'RSS [MiB]':>10} {'time x':>8} {'RSS x':>7} {'exp':>5}", file=file)
+
+    previous: Optional[Measurement] = None
+    for m in measurements:
+        line = (f"{m.module:<8} {m.size:>10} {m.parse_time:>10.4f} {m.solve_time:>10.4f} "
+                f"{m.max_rss / 1024:>10.1f}")
+
+        if previous and previous.module == m.module:
+            time_growth = m.time / previous.time if previous.time else math.nan
+            line += (f" {time_growth:>8.1f} {m.max_rss / previous.max_rss:>7.2f} "
+                     f"{growth_exponent(previous, m):>5.2f}")
+
+        print(line, file=file, flush=True)
+        previous = m
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.partition("\n\n")[0])
+    arg_parser.add_argument("modules", nargs="*", help="modules to benchmark (default: all)")
+    arg_parser.add_argument("--scales", type=int, nargs="+", default=SCALES,
+                            help="input sizes, relative to the default generator sizes")
+    arg_parser.add_argument("--timeout", type=float, default=300.0,
+                            help="max time of a single run, in seconds")
+    arg_parser.add_argument("--history", type=Path, default=history.HISTORY_PATH,
+                            help="file to append the results to")
+    arg_parser.add_argument("--no-history", action="store_const", const=None, dest="history",
+                            help="don't store the results")
+    args = arg_parser.parse_args(argv)
+
+    modules = args.modules or benchmarkable_modules()
+    for module in modules:
+        if day_of(module) not in GENERATORS:
+            arg_parser.error(f"{module} has no input generator")
+
+    with tempfile.TemporaryDirectory(prefix="aoc-bench-") as workdir:
+        measurements = benchmark(modules, args.scales, Path(workdir), args.timeout)
+        if args.history:
+            measurements = recorded(measurements, args.history)
+        print_report(measurements)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
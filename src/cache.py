@@ -0,0 +1,128 @@
+"""On-disk cache of solution answers.
+
+Answers are keyed by the hash of the input file, the hash of the solution's source code
+(including all the other modules from src/ it uses) and the solution module name (day & part).
+Changing the code of a solution makes its old answers unreachable - those are removed
+on the next lookup. Apart from that, the cache keeps at most `max_entries`
+least-recently-used answers.
+"""
+import hashlib
+import importlib
+import json
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, NamedTuple, Optional
+
+SRC_DIR = Path(__file__).parent
+CACHE_DIR = SRC_DIR.parent / ".aoc-cache"
+MAX_ENTRIES = 512
+
+
+class Key(NamedTuple):
+    module: str
+    input_hash: str
+    source_hash: str
+
+    def file_name(self) -> str:
+        return f"{self.module}-{self.input_hash[:32]}-{self.source_hash[:32]}.json"
+
+
+def file_hash(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(1 << 20):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def is_local(module: ModuleType) -> bool:
+    file = getattr(module, "__file__", None)
+    return file is not None and Path(file).parent == SRC_DIR
+
+
+def local_dependencies(module: ModuleType) -> list[ModuleType]:
+    """Finds all modules from src/ which the given module (transitively) uses,
+    either by importing them or by importing something from them.
+    """
+    found: dict[str, ModuleType] = {}
+    to_check: list[ModuleType] = [module]
+
+    while to_check:
+        m = to_check.pop()
+        if m.__name__ in found:
+            continue
+        found[m.__name__] = m
+
+        for value in vars(m).values():
+            if isinstance(value, ModuleType):
+                dependency = value
+            else:
+                defined_in = getattr(value, "__module__", None)
+                dependency = sys.modules.get(defined_in) if isinstance(defined_in, str) else None
+
+            if dependency is not None and is_local(dependency):
+                to_check.append(dependency)
+
+    return [found[name] for name in sorted(found)]
+
+
+def source_hash(module: ModuleType) -> str:
+    h = hashlib.sha256()
+    for dependency in local_dependencies(module):
+        h.update(dependency.__name__.encode())
+        h.update(b"\0")
+        h.update(Path(dependency.__file__).read_bytes())  # type: ignore
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class ResultCache:
+    def __init__(self, directory: Path = CACHE_DIR, max_entries: int = MAX_ENTRIES) -> None:
+        self.directory: Path = directory
+        self.max_entries: int = max_entries
+
+    def key(self, module: str, input_path: Path) -> Key:
+        return Key(module, file_hash(input_path),
+                   source_hash(importlib.import_module(module)))
+
+    def get(self, key: Key) -> Optional[Any]:
+        """Returns the cached answer, or None if there's no answer for the given key"""
+        path = self.directory / key.file_name()
+
+        try:
+            with path.open() as f:
+                answer = json.load(f)["answer"]
+        except FileNotFoundError:
+            self._remove_stale(key)
+            return None
+
+        # Mark the entry as recently used
+        os.utime(path)
+        return answer
+
+    def put(self, key: Key, answer: Any) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / key.file_name()
+
+        # Write to a temporary file first, so that concurrent readers never see half an entry
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_path.open("w") as f:
+            json.dump({"module": key.module, "answer": answer}, f)
+        tmp_path.replace(path)
+
+        self._remove_stale(key)
+        self._evict()
+
+    def _remove_stale(self, key: Key) -> None:
+        """Removes entries of the same solution made with a different version of its code"""
+        for path in self.directory.glob(f"{key.module}-*.json"):
+            if not path.name.endswith(f"-{key.source_hash[:32]}.json"):
+                path.unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        """Removes least-recently-used entries above the max_entries limit"""
+        entries = sorted(self.directory.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        for path in entries[:-self.max_entries or None]:
+            path.unlink(missing_ok=True)
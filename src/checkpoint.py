@@ -0,0 +1,79 @@
+"""Checkpoints of long-running solutions, which they can be resumed from.
+
+Saving is enabled with the AOC_CHECKPOINT_DIR environment variable, resuming with
+AOC_RESUME=1 (or --resume of the runner and batch.py).
+"""
+import hashlib
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+CHECKPOINT_DIR_ENV = "AOC_CHECKPOINT_DIR"
+RESUME_ENV = "AOC_RESUME"
+
+# State is saved at most once per this many seconds
+CHECKPOINT_INTERVAL = 10.0
+
+
+class Checkpoint:
+    """Periodically saved state of a long-running solution, which it can continue from
+    after being interrupted. The state is pickled together with a key of the input,
+    so that state saved for one input is never resumed with another one.
+    Without a path, nothing is saved or loaded.
+    """
+
+    def __init__(self, path: Optional[Path], key: str, resume: bool = False,
+                 interval: float = CHECKPOINT_INTERVAL) -> None:
+        self.path = path
+        self.key = key
+        self.resume = resume
+        self.interval = interval
+        self.saved_at = time.monotonic()
+
+    def load(self) -> Optional[Any]:
+        """Returns the last saved state, None if there's none (or resuming is off)"""
+        if self.path is None or not self.resume:
+            return None
+
+        try:
+            with self.path.open("rb") as f:
+                key, state = pickle.load(f)
+        except FileNotFoundError:
+            return None
+
+        return state if key == self.key else None
+
+    def save(self, state: Any, force: bool = False) -> None:
+        """Saves the state, unless it was saved less than `interval` seconds ago"""
+        if self.path is None or (not force and time.monotonic() - self.saved_at < self.interval):
+            return
+
+        # Write to a temporary file first, so that an interrupted save keeps the previous state
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_path.open("wb") as f:
+            pickle.dump((self.key, state), f, pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(self.path)
+        self.saved_at = time.monotonic()
+
+    def clear(self) -> None:
+        """Removes the saved state, once the solution is done"""
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+
+
+def checkpoint(name: str, *inputs: Any) -> Checkpoint:
+    """Returns the checkpoint of `name` for the given (picklable) inputs.
+    Saving is enabled with the AOC_CHECKPOINT_DIR environment variable,
+    resuming from the saved state with AOC_RESUME=1.
+    """
+    directory = os.environ.get(CHECKPOINT_DIR_ENV)
+    if not directory:
+        return Checkpoint(None, "")
+
+    # Every input has its own file, so that e.g. batch.py workers don't overwrite each other's
+    key = hashlib.sha256(pickle.dumps(inputs)).hexdigest()
+    resume = os.environ.get(RESUME_ENV, "") not in ("", "0")
+    return Checkpoint(Path(directory) / f"{name}-{key[:16]}.checkpoint", key, resume)
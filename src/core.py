@@ -1,7 +1,25 @@
-from typing import Callable, Generator, Iterable, TypeVar
+import mmap
+import os
+import re
+import stat
+import sys
+from array import array
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import (TYPE_CHECKING, Any, Callable, Generator, Hashable, Iterable,
+                    Iterator, NamedTuple, Optional, Sequence, Sized, TypeVar, Union)
+
+# Imports needed only by some solutions are deferred to the functions using them,
+# as every solution pays for core's imports on startup (see importtime.py)
+if TYPE_CHECKING:
+    import numpy
 
 _T = TypeVar("_T")
 _K = TypeVar("_K")
+_R = TypeVar("_R")
+_V = TypeVar("_V")
 
 
 def empty_str(t: str) -> bool:
@@ -27,6 +45,39 @@ def split_on(seq: Iterable[_T], pred: Callable[[_T], bool]) -> list[list[_T]]:
     return after_split
 
 
+def _group_until(first: _T, rest: Iterator[_T], pred: Callable[[_T], bool]) \
+        -> Generator[_T, None, None]:
+    yield first
+    for elem in rest:
+        if pred(elem):
+            return
+        yield elem
+
+
+def isplit_on(seq: Iterable[_T], pred: Callable[[_T], bool]) \
+        -> Generator[Iterator[_T], None, None]:
+    """Lazy version of split_on - yields groups of elements as they are found in seq.
+    Like with itertools.groupby, every group is an iterator over the shared seq,
+    so a group is no longer valid after the next one is requested.
+    """
+    it = iter(seq)
+
+    while True:
+        # Skip over the separators
+        for elem in it:
+            if not pred(elem):
+                break
+        else:
+            return
+
+        group = _group_until(elem, it, pred)
+        yield group
+
+        # Skip over whatever wasn't consumed from the group
+        for _ in group:
+            pass
+
+
 def aggregate_by(iterable: Iterable[_T], key: Callable[[_T], _K]) -> dict[_K, list[_T]]:
     """Groups elements from an iterable by key(elem).
     Analogous to itertools.group_by; however this function doesn't care about the order
@@ -38,6 +89,46 @@ def aggregate_by(iterable: Iterable[_T], key: Callable[[_T], _K]) -> dict[_K, li
     return d
 
 
+def count_by(iterable: Iterable[_T], key: Callable[[_T], _K]) -> dict[_K, int]:
+    """Counts elements from an iterable by key(elem), like
+    {k: len(v) for k, v in aggregate_by(iterable, key).items()} - without keeping the elements.
+    """
+    d: dict[_K, int] = {}
+    for elem in iterable:
+        k = key(elem)
+        d[k] = d.get(k, 0) + 1
+    return d
+
+
+def reduce_by(iterable: Iterable[_T], key: Callable[[_T], _K], fn: Callable[[_R, _T], _R],
+              initial: _R) -> dict[_K, _R]:
+    """Folds elements with the same key(elem) into fn(fn(initial, elem0), elem1)...,
+    like functools.reduce on every group of aggregate_by, as elements arrive.
+    fn should return a new value rather than modify its first argument,
+    as `initial` is shared by all keys.
+    """
+    d: dict[_K, _R] = {}
+    for elem in iterable:
+        k = key(elem)
+        d[k] = fn(d.get(k, initial), elem)
+    return d
+
+
+def intersect_by(iterable: Iterable[Iterable[_V]], key: Callable[[Iterable[_V]], _K]) \
+        -> dict[_K, set[_V]]:
+    """Intersects elements (collections) with the same key(elem), keeping only
+    a single set per key.
+    """
+    d: dict[_K, set[_V]] = {}
+    for elem in iterable:
+        k = key(elem)
+        if k in d:
+            d[k].intersection_update(elem)
+        else:
+            d[k] = set(elem)
+    return d
+
+
 def iterate(f: Callable[[_T], _T], x: _T = 0) -> Generator[_T, None, None]:
     """Iterate produces an infinite sequence of x, f(x), f(f(x)), ...
     See Clojure's iterate.
@@ -45,3 +136,553 @@ def iterate(f: Callable[[_T], _T], x: _T = 0) -> Generator[_T, None, None]:
     while True:
         yield x
         x = f(x)
+
+
+class Cycle(NamedTuple):
+    start: int  # index of the first element of the cycle
+    length: int
+
+
+def _identity(x: _T) -> _T:
+    return x
+
+
+def find_cycle(f: Callable[[_T], _T], x: _T, key: Callable[[_T], Hashable] = _identity,
+               limit: Optional[int] = None) -> Optional[Cycle]:
+    """Finds the cycle in the sequence x, f(x), f(f(x)), ... using Brent's algorithm.
+    States are compared by key(state). Gives up (returning None) after `limit` steps
+    without finding a repeated state; without a limit, it doesn't terminate
+    if the sequence never repeats.
+
+    f must not modify its argument - the algorithm keeps references to older states.
+    A fixed point is reported as a cycle of length 1.
+    """
+    # Find the cycle length - by moving the tortoise to the hare
+    # on every power of 2, until the hare catches up with it
+    power = length = steps = 1
+    tortoise = x
+    hare = f(x)
+
+    while key(tortoise) != key(hare):
+        if limit is not None and steps >= limit:
+            return None
+        if power == length:
+            tortoise = hare
+            power *= 2
+            length = 0
+        hare = f(hare)
+        length += 1
+        steps += 1
+
+    # Find the start of the cycle - move 2 pointers, `length` apart, until they meet
+    tortoise = hare = x
+    for _ in range(length):
+        hare = f(hare)
+
+    start = 0
+    while key(tortoise) != key(hare):
+        tortoise = f(tortoise)
+        hare = f(hare)
+        start += 1
+
+    return Cycle(start, length)
+
+
+def nth(f: Callable[[_T], _T], x: _T, n: int, key: Callable[[_T], Hashable] = _identity) -> _T:
+    """Returns the nth element of the x, f(x), f(f(x)), ... sequence.
+    For large n, full cycles of the sequence are skipped over (see find_cycle),
+    if it repeats within its first n elements.
+    """
+    # Finding the cycle costs a few times its length in steps - not worth it for small n.
+    # If it isn't found within n steps, it couldn't save more than it cost.
+    cycle = find_cycle(f, x, key, limit=n) if n > 1024 else None
+    if cycle is None or n <= cycle.start:
+        steps = n
+    else:
+        steps = cycle.start + (n - cycle.start) % cycle.length
+
+    for _ in range(steps):
+        x = f(x)
+    return x
+
+
+# Translation table (see bytes.maketrans) for grids of digits
+DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+# Neighbour directions, in the order of Grid.neighbors - first the 4 orthogonal ones:
+# east, south, west, north; then the diagonal ones: south-east, south-west, north-west, north-east
+_DIRECTIONS: list[tuple[int, int]] = [
+    (1, 0), (0, 1), (-1, 0), (0, -1),
+    (1, 1), (-1, 1), (-1, -1), (1, -1),
+]
+_ORTHOGONAL = _DIRECTIONS[:4]
+
+
+@dataclass
+class Grid:
+    """A 2D grid of small (0-255) values, stored row by row in a flat bytearray.
+
+    Cells are addressed by their flat index (y * width + x), and so are their neighbours
+    - so walking the grid doesn't allocate any coordinate tuples.
+    """
+    width: int
+    height: int
+    cells: bytearray
+    wrap: bool = False  # whether the opposite edges of the grid are adjacent
+
+    def __post_init__(self) -> None:
+        if len(self.cells) != self.width * self.height:
+            raise ValueError(f"expected {self.width * self.height} cells, "
+                             f"got {len(self.cells)}")
+
+    @classmethod
+    def filled(cls, width: int, height: int, value: int = 0, wrap: bool = False) -> "Grid":
+        return cls(width, height, bytearray([value]) * (width * height), wrap)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], table: bytes = DIGITS, wrap: bool = False) \
+            -> "Grid":
+        """Loads a grid from (stripped) lines of text; characters are converted
+        to cell values with a translation table (see bytes.maketrans).
+        """
+        cells = bytearray()
+        width = 0
+        height = 0
+
+        for line in lines:
+            row = line.encode("ascii").translate(table)
+            if height and len(row) != width:
+                raise ValueError(f"row {height} has {len(row)} cells, expected {width}")
+
+            width = len(row)
+            height += 1
+            cells += row
+
+        return cls(width, height, cells, wrap)
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __getitem__(self, i: int) -> int:
+        return self.cells[i]
+
+    def __setitem__(self, i: int, value: int) -> None:
+        self.cells[i] = value
+
+    def __str__(self) -> str:
+        return "\n".join("".join(map(str, row)) for row in self.rows())
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def coords(self, i: int) -> tuple[int, int]:
+        y, x = divmod(i, self.width)
+        return x, y
+
+    def rows(self) -> Iterator[bytearray]:
+        for start in range(0, len(self.cells), self.width):
+            yield self.cells[start:start+self.width]
+
+    def copy(self) -> "Grid":
+        return Grid(self.width, self.height, self.cells.copy(), self.wrap)
+
+    def padded(self, n: int, fill: int = 0) -> "Grid":
+        """Returns a copy of the grid with n extra rows and columns of `fill` on every side"""
+        width = self.width + 2 * n
+        cells = bytearray([fill]) * (width * n)
+
+        for row in self.rows():
+            cells += bytearray([fill]) * n
+            cells += row
+            cells += bytearray([fill]) * n
+
+        cells += bytearray([fill]) * (width * n)
+        return Grid(width, self.height + 2 * n, cells, self.wrap)
+
+    def neighbors(self, i: int, diagonal: bool = False) -> list[int]:
+        """Returns the indices of the neighbours of the cell at index i.
+
+        Neighbours are ordered east, south, west, north, and with diagonal=True,
+        followed by south-east, south-west, north-west and north-east.
+        Cells outside of the grid are skipped, unless the grid wraps around - then every
+        cell has all of its neighbours, and their position in the list gives their direction.
+        """
+        width, height = self.width, self.height
+        y, x = divmod(i, width)
+        directions = _DIRECTIONS if diagonal else _ORTHOGONAL
+
+        if self.wrap:
+            return [(y + dy) % height * width + (x + dx) % width for dx, dy in directions]
+        return [i + dy * width + dx for dx, dy in directions
+                if 0 <= x + dx < width and 0 <= y + dy < height]
+
+    def array(self) -> "numpy.ndarray[Any, Any]":
+        """Returns a (height, width) NumPy view of the cells; requires NumPy to be installed"""
+        import numpy
+
+        return numpy.frombuffer(self.cells, dtype=numpy.uint8).reshape(self.height, self.width)
+
+
+# Inputs are parsed in chunks of this many bytes, to bound the memory used for temporaries
+CHUNK_SIZE = 1 << 20
+
+# NumPy is only worth importing for inputs bigger than this many bytes
+NUMPY_MIN_SIZE = 1 << 20
+
+_SIGN = ord("-")
+
+
+def cli_input() -> str:
+    """Returns the input file given on the command line, "-" (stdin) if there's none"""
+    return sys.argv[1] if len(sys.argv) > 1 else "-"
+
+
+NUMPY_ENV = "AOC_NUMPY"
+
+# auto - use NumPy if it's installed (and the input is big enough, see below),
+# numpy - always use it, python - never use it
+BACKENDS = ("auto", "numpy", "python")
+
+# Every NumPy call has an overhead of microseconds, for small inputs plain loops are faster
+NUMPY_MIN_ELEMENTS = 256
+
+# Importing NumPy takes about as long as a pure-Python loop over this many elements, so
+# (in auto mode) it's only imported for inputs this big - unless something else already did
+NUMPY_IMPORT_MIN_ELEMENTS = 1 << 17
+
+
+def numpy_backend(size: Optional[int] = None) -> Optional[ModuleType]:
+    """Returns the numpy module if solutions should use their vectorized implementations
+    (functions named *_numpy), None if they should use the pure-Python ones.
+    The backend is selected by the AOC_NUMPY environment variable, see BACKENDS;
+    size is the number of elements (numbers, cells, ...) the solution works on.
+    """
+    backend = os.environ.get(NUMPY_ENV) or "auto"
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown {NUMPY_ENV} backend: {backend!r} (expected one of {BACKENDS})")
+
+    if backend == "python":
+        return None
+    if backend == "auto" and size is not None:
+        imported = "numpy" in sys.modules
+        if size < (NUMPY_MIN_ELEMENTS if imported else NUMPY_IMPORT_MIN_ELEMENTS):
+            return None
+
+    try:
+        import numpy
+    except ImportError:
+        if backend == "numpy":
+            raise
+        return None
+    return numpy
+
+
+@contextmanager
+def backend(name: str) -> Iterator[None]:
+    """Selects the backend of numpy_backend within the block"""
+    if name not in BACKENDS:
+        raise ValueError(f"unknown backend: {name!r} (expected one of {BACKENDS})")
+
+    previous = os.environ.get(NUMPY_ENV)
+    os.environ[NUMPY_ENV] = name
+    try:
+        yield
+    finally:
+        if previous is None:
+            del os.environ[NUMPY_ENV]
+        else:
+            os.environ[NUMPY_ENV] = previous
+
+
+@contextmanager
+def _mapped(path: Union[str, Path]) -> Iterator[Union[bytes, mmap.mmap]]:
+    """Memory-maps a file, "-" being stdin. Pipes, devices and empty files
+    can't be mapped - those are simply read into memory.
+    """
+    with open(0 if path == "-" else path, "rb", closefd=path != "-") as f:
+        st = os.fstat(f.fileno())
+        if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+            yield f.read()
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            yield m
+
+
+def _chunks(buffer: Union[bytes, mmap.mmap], base: int) -> Iterator[bytes]:
+    """Splits the buffer into chunks of about CHUNK_SIZE bytes, without cutting any numbers"""
+    number_bytes = b"0123456789"[:base] + b"-"
+    start = 0
+
+    while start < len(buffer):
+        end = min(start + CHUNK_SIZE, len(buffer))
+        while end < len(buffer) and buffer[end] in number_bytes:
+            end += 1
+
+        yield buffer[start:end]
+        start = end
+
+
+def _number_pattern(base: int) -> "re.Pattern[bytes]":
+    sign = b"-?" if base == 10 else b""
+    return re.compile(sign + b"[0-" + str(base - 1).encode() + b"]+")
+
+
+def _parse_chunk(chunk: bytes, base: int, pattern: "re.Pattern[bytes]") -> "array[int]":
+    return array("q", [int(token, base) for token in pattern.findall(chunk)])
+
+
+def _parse_chunk_numpy(chunk: bytes, base: int, np: Any) -> "numpy.ndarray[Any, Any]":
+    data = np.frombuffer(chunk, dtype=np.uint8)
+    digits = data - ord("0")  # non-digits wrap around to big numbers
+    is_digit = digits < base
+
+    # Numbers start where a digit follows a non-digit, and end the other way round
+    bounded = np.zeros(len(data) + 2, dtype=np.int8)
+    bounded[1:-1] = is_digit
+    edges = np.diff(bounded)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    lengths = ends - starts
+    if len(starts) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    # Any number with less digits than the max int64 fits in it
+    if lengths.max() >= len(np.base_repr(2 ** 63 - 1, base)):
+        raise ValueError("number doesn't fit in a 64-bit integer")
+
+    # Add up the numbers place by place, starting from their last digits;
+    # that's a few passes over the numbers rather than over all the bytes.
+    values = np.zeros(len(starts), dtype=np.int64)
+    power = 1
+    for place in range(lengths.max()):
+        has_place = lengths > place
+        values[has_place] += digits[ends[has_place] - 1 - place] * np.int64(power)
+        power *= base
+
+    if base == 10:
+        signed = starts > 0
+        negative = np.zeros(len(starts), dtype=bool)
+        negative[signed] = data[starts[signed] - 1] == _SIGN
+        values[negative] *= -1
+
+    return values
+
+
+def load_ints(path: Union[str, Path], base: int = 10) -> "array[int]":
+    """Loads all integers from a file ("-" for stdin), in bulk, without creating
+    a Python string for every line. Numbers may be separated by anything but digits,
+    e.g. by newlines or commas; in base 10, a "-" directly before a number is its sign.
+
+    The file is memory-mapped and parsed in chunks; big files are parsed
+    with NumPy (if available).
+    """
+    with _mapped(path) as buffer:
+        return _parse_buffer(buffer, base)
+
+
+def stream_ints(path: Union[str, Path], base: int = 10) -> Iterator[int]:
+    """Like load_ints, but yields the numbers while reading the file ("-" for stdin),
+    keeping only about CHUNK_SIZE bytes of it in memory - for inputs bigger than memory,
+    or endless ones.
+    """
+    if not 2 <= base <= 10:
+        raise ValueError(f"unsupported base: {base}")
+
+    pattern = _number_pattern(base)
+    number_bytes = b"0123456789"[:base] + b"-"
+
+    with open(0 if path == "-" else path, "rb", closefd=path != "-") as f:
+        rest = b""
+        while block := f.read(CHUNK_SIZE):
+            block = rest + block
+
+            # A number at the end of the block may continue in the next one
+            end = len(block)
+            while end and block[end - 1] in number_bytes:
+                end -= 1
+
+            rest = block[end:]
+            yield from _parse_chunk(block[:end], base, pattern)
+
+        yield from _parse_chunk(rest, base, pattern)
+
+
+def extract_ints(data: Union[str, bytes], base: int = 10) -> "array[int]":
+    """Extracts all integers from a string in a single pass, like load_ints does
+    with files. Numbers may be separated by anything, including other text;
+    e.g. "x=-5..10" gives -5 and 10. Callers reshape them into their own structures.
+    """
+    return _parse_buffer(data.encode() if isinstance(data, str) else data, base)
+
+
+def _parse_buffer(buffer: Union[bytes, mmap.mmap], base: int) -> "array[int]":
+    if not 2 <= base <= 10:
+        raise ValueError(f"unsupported base: {base}")
+
+    numbers = array("q")
+    pattern = _number_pattern(base)
+    np = numpy_backend() if len(buffer) >= NUMPY_MIN_SIZE else None
+
+    for chunk in _chunks(buffer, base):
+        if np is not None:
+            numbers.frombytes(_parse_chunk_numpy(chunk, base, np).tobytes())
+        else:
+            numbers.extend(_parse_chunk(chunk, base, pattern))
+
+    return numbers
+
+
+def grouped(numbers: Sequence[int], n: int) -> Iterator[tuple[int, ...]]:
+    """Splits a flat sequence (e.g. from extract_ints) into tuples of n numbers"""
+    if len(numbers) % n:
+        raise ValueError(f"expected a multiple of {n} numbers, got {len(numbers)}")
+    return zip(*[iter(numbers)] * n)
+
+
+SEARCH_STATS_ENV = "AOC_SEARCH_STATS"
+
+
+def _entry_size(entry: object) -> int:
+    """Estimates the memory used by a queue entry - the object and its direct attributes"""
+    size = sys.getsizeof(entry)
+    if isinstance(entry, tuple):
+        size += sum(sys.getsizeof(i) for i in entry)
+    elif hasattr(entry, "__dict__"):
+        size += sum(sys.getsizeof(i) for i in vars(entry).values())
+    return size
+
+
+@dataclass
+class SearchStats:
+    """Counters of the work done by a search (Dijkstra, A*, DFS, ...).
+    Searches accept an optional SearchStats which they fill in, and return it
+    along with their result - a new one, if none was given.
+    """
+    pushed: int = 0
+    popped: int = 0
+    stale: int = 0  # popped entries for which a cheaper one was already found
+    peak_queue: int = 0
+    peak_frontier_bytes: int = 0  # estimated from the size of the last entry
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    def update_peak(self, queue: Sized, entry: object) -> None:
+        """Records the size of a queue, if it's the biggest one so far;
+        entry is a sample used to estimate the memory used by all of them.
+        """
+        if len(queue) > self.peak_queue:
+            self.peak_queue = len(queue)
+            self.peak_frontier_bytes = sys.getsizeof(queue) + len(queue) * _entry_size(entry)
+
+    def report(self, name: str) -> None:
+        """Prints the stats to stderr, if enabled with the AOC_SEARCH_STATS environment variable"""
+        if os.environ.get(SEARCH_STATS_ENV):
+            counters = ", ".join(f"{k}={v}" for k, v in vars(self).items())
+            print(f"{name}: {counters}", file=sys.stderr)
+
+
+# Points of PointSets are packed into single ints: y in the high 32 bits and x in the low ones,
+# both offset by _BIAS, so that negative coordinates can be packed, too.
+_BIAS = 1 << 31
+_MASK = (1 << 32) - 1
+
+
+def pack_point(x: int, y: int) -> int:
+    return (y + _BIAS) << 32 | (x + _BIAS)
+
+
+def unpack_point(p: int) -> tuple[int, int]:
+    return (p & _MASK) - _BIAS, (p >> 32) - _BIAS
+
+
+class PointSet:
+    """A set of 2D points with 32-bit coordinates.
+
+    Every point is packed into a single int (see pack_point) - that's about half the memory
+    of a tuple, and translating a set only needs a single addition per point.
+    """
+    __slots__ = ("packed",)
+
+    def __init__(self, points: Iterable[tuple[int, int]] = ()) -> None:
+        self.packed: set[int] = {pack_point(x, y) for x, y in points}
+
+    @classmethod
+    def from_packed(cls, packed: Iterable[int]) -> "PointSet":
+        self = cls()
+        self.packed = set(packed)
+        return self
+
+    @classmethod
+    def segment(cls, start: tuple[int, int], end: tuple[int, int]) -> "PointSet":
+        """Returns all points of a horizontal, vertical or diagonal (45°) segment,
+        including both of its ends.
+        """
+        dx = end[0] - start[0]
+        dy = end[1] - start[1]
+        if dx and dy and abs(dx) != abs(dy):
+            raise ValueError("segments must be horizontal, vertical or at 45 degrees")
+
+        # Packed points of a segment are an arithmetic progression
+        step_x = (dx > 0) - (dx < 0)
+        step_y = (dy > 0) - (dy < 0)
+        step = (step_y << 32) + step_x
+        first = pack_point(*start)
+        last = pack_point(*end)
+        return cls.from_packed(range(first, last + step, step) if step else (first, ))
+
+    def __len__(self) -> int:
+        return len(self.packed)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return map(unpack_point, self.packed)
+
+    def __contains__(self, point: object) -> bool:
+        if not isinstance(point, tuple) or len(point) != 2:
+            return False
+        return pack_point(*point) in self.packed
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, PointSet) and self.packed == other.packed
+
+    def __repr__(self) -> str:
+        return f"PointSet({sorted(self)!r})"
+
+    def contains(self, x: int, y: int) -> bool:
+        return pack_point(x, y) in self.packed
+
+    def add(self, x: int, y: int) -> None:
+        self.packed.add(pack_point(x, y))
+
+    def __or__(self, other: "PointSet") -> "PointSet":
+        return PointSet.from_packed(self.packed | other.packed)
+
+    def __and__(self, other: "PointSet") -> "PointSet":
+        return PointSet.from_packed(self.packed & other.packed)
+
+    def __sub__(self, other: "PointSet") -> "PointSet":
+        return PointSet.from_packed(self.packed - other.packed)
+
+    def __ior__(self, other: "PointSet") -> "PointSet":
+        self.packed |= other.packed
+        return self
+
+    def translated(self, dx: int, dy: int) -> "PointSet":
+        delta = (dy << 32) + dx
+        return PointSet.from_packed(p + delta for p in self.packed)
+
+    def folded(self, axis: int, along: int) -> "PointSet":
+        """Mirrors the points beyond the line x=along (axis 0) or y=along (axis 1)
+        onto the other side of it; points on the line are dropped.
+        """
+        shift = 32 * axis
+        folded: set[int] = set()
+
+        for p in self.packed:
+            coordinate = ((p >> shift) & _MASK) - _BIAS
+            if coordinate < along:
+                folded.add(p)
+            elif coordinate > along:
+                folded.add(p + (2 * (along - coordinate) << shift))
+
+        return PointSet.from_packed(folded)
@@ -0,0 +1,198 @@
+"""A long-lived server solving puzzles over a local Unix socket.
+
+The server imports all solutions up front and keeps them (and their caches) warm,
+so a request doesn't pay for the interpreter startup and imports.
+
+Protocol: for every request the client sends a JSON header line, followed by `size` bytes
+of the puzzle input:
+    {"day": 2, "part": "a", "size": 1234}\\n<input>
+and the server replies with a single JSON line:
+    {"answer": 1480518, "parse_time": 0.001, "solve_time": 0.0002}\\n
+or {"error": "..."} if the request or the solution failed.
+A connection may be used for any number of requests. After a malformed header
+(or size) the server replies with an error and closes the connection.
+
+Usage: python src/daemon.py serve [--socket PATH]
+       python src/daemon.py client DAY PART INPUT_FILE [--socket PATH]
+"""
+import argparse
+import asyncio
+import io
+import json
+import os
+import signal
+import socket
+import sys
+import tempfile
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Optional
+
+import runner
+
+SOCKET_PATH = Path(tempfile.gettempdir()) / f"aoc-{os.getuid()}.sock"
+
+MAX_HEADER_SIZE = 4096
+MAX_INPUT_SIZE = 64 << 20
+
+
+class RequestError(Exception):
+    pass
+
+
+class ProtocolError(Exception):
+    """An error after which the rest of the connection's stream can't be understood"""
+
+
+def module_name(header: dict[str, Any]) -> str:
+    try:
+        module = f"day{int(header['day']):02}{header['part']}"
+    except (KeyError, TypeError, ValueError):
+        raise RequestError("header needs a numeric 'day' and a 'part'") from None
+
+    if module not in runner.all_modules():
+        raise RequestError(f"no solution for day {header['day']} part {header['part']}")
+    return module
+
+
+def input_size(header: dict[str, Any]) -> int:
+    size = header.get("size")
+    if not isinstance(size, int) or not 0 <= size <= MAX_INPUT_SIZE:
+        raise RequestError(f"'size' has to be an integer between 0 and {MAX_INPUT_SIZE}")
+    return size
+
+
+def solve(module: str, data: bytes) -> dict[str, Any]:
+    result = runner.run(module, io.StringIO(data.decode()), trace_memory=False)
+    return {"answer": result.answer, "parse_time": result.parse_time,
+            "solve_time": result.solve_time}
+
+
+class Server:
+    def __init__(self) -> None:
+        # Solutions are CPU-bound and not thread-safe (some of them keep global caches),
+        # so they're run one at a time - off the event loop, which keeps accepting requests.
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    def warm_up(self) -> None:
+        for module in runner.all_modules():
+            runner.load(module)
+
+    async def handle_request(self, reader: asyncio.StreamReader) -> Optional[dict[str, Any]]:
+        """Reads and solves a single request; returns None if the client is done"""
+        try:
+            line = await reader.readline()
+        except ValueError:
+            raise ProtocolError(f"header longer than {MAX_HEADER_SIZE} bytes") from None
+
+        if not line:
+            return None
+
+        # Without a valid header, it's unknown where the next request starts
+        try:
+            header = json.loads(line)
+            if not isinstance(header, dict):
+                raise RequestError("header has to be a JSON object")
+            size = input_size(header)
+        except (RequestError, ValueError) as e:
+            raise ProtocolError(str(e)) from None
+
+        # The input is read even if the request is rejected, to get to the next one
+        data = await reader.readexactly(size)
+        try:
+            module = module_name(header)
+        except RequestError as e:
+            return {"error": str(e)}
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self.executor, solve, module, data)
+        except Exception as e:
+            traceback.print_exc()
+            return {"error": "".join(traceback.format_exception_only(type(e), e)).strip()}
+
+    async def handle_connection(self, reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter) -> None:
+        try:
+            while (response := await self.handle_request(reader)) is not None:
+                writer.write(json.dumps(response, default=str).encode() + b"\n")
+                await writer.drain()
+
+        except ProtocolError as e:
+            writer.write(json.dumps({"error": str(e)}).encode() + b"\n")
+
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass  # the client went away
+
+        finally:
+            writer.close()
+
+    async def serve(self, path: Path) -> None:
+        path.unlink(missing_ok=True)
+        # Only the owner may connect - the socket is created with these permissions,
+        # so there's no moment when others could
+        umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(self.handle_connection, path,
+                                                     limit=MAX_HEADER_SIZE)
+        finally:
+            os.umask(umask)
+
+        print(f"Listening on {path}", file=sys.stderr)
+        async with server:
+            await server.serve_forever()
+
+
+def request(day: int, part: str, data: bytes, path: Path = SOCKET_PATH) -> dict[str, Any]:
+    """Sends a single request to the server, returning its response"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(str(path))
+        header = {"day": day, "part": part, "size": len(data)}
+        s.sendall(json.dumps(header).encode() + b"\n" + data)
+
+        with s.makefile("rb") as f:
+            return json.loads(f.readline())
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.partition("\n\n")[0])
+    commands = arg_parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="run the server")
+    client = commands.add_parser("client", help="send a single request to the server")
+    for command in (serve, client):
+        command.add_argument("--socket", type=Path, default=SOCKET_PATH)
+    client.add_argument("day", type=int)
+    client.add_argument("part", choices=["a", "b"])
+    client.add_argument("input", type=Path, help="input file, '-' for stdin")
+    args = arg_parser.parse_args(argv)
+
+    if args.command == "serve":
+        server = Server()
+        server.warm_up()
+
+        # Remove the socket on `kill` as well
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        try:
+            asyncio.run(server.serve(args.socket))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            args.socket.unlink(missing_ok=True)
+        return 0
+
+    data = sys.stdin.buffer.read() if str(args.input) == "-" else args.input.read_bytes()
+    response = request(args.day, args.part, data, args.socket)
+
+    if "error" in response:
+        print(response["error"], file=sys.stderr)
+        return 1
+
+    print(response["answer"])
+    print(f"parse: {response['parse_time']:.4f} s, solve: {response['solve_time']:.4f} s",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
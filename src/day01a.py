@@ -1,14 +1,46 @@
-import fileinput
+from array import array
+from collections import deque
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Union
 
+from core import cli_input, load_ints, stream_ints
 
-def count_increases(samples: list[float]) -> int:
-    return sum(
-        1
-        for a, b in zip(samples[:-1], samples[1:])
-        if b > a
-    )
+
+def count_increases(samples: Iterable[float], window: int = 1) -> int:
+    """Counts the windows (of `window` consecutive samples) with a bigger sum
+    than the previous window.
+
+    Consecutive windows share all but their first and last sample, so comparing their sums
+    is comparing the sample entering the window with the one leaving it. Only the last
+    `window` samples are kept, so samples can be streamed from inputs of any size.
+    """
+    if window < 1:
+        raise ValueError(f"window has to be at least 1, got {window}")
+
+    samples = iter(samples)
+    ring: deque[float] = deque(islice(samples, window), maxlen=window)
+
+    count = 0
+    for sample in samples:
+        if sample > ring[0]:
+            count += 1
+        ring.append(sample)
+
+    return count
+
+
+def parse(lines: Iterable[str]) -> list[int]:
+    return [int(line) for line in lines]
+
+
+def load(path: Union[str, Path]) -> "array[int]":
+    return load_ints(path)
+
+
+def solve(samples: Iterable[int]) -> int:
+    return count_increases(samples)
 
 
 if __name__ == "__main__":
-    result = count_increases([int(line) for line in fileinput.input()])
-    print(result)
+    print(solve(stream_ints(cli_input())))
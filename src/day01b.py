@@ -1,13 +1,15 @@
-import fileinput
+from typing import Iterable
 
-from day01a import count_increases
+from core import cli_input, stream_ints
+# parse and load are shared with part a
+from day01a import count_increases, load, parse  # noqa: F401
 
+WINDOW = 3
 
-def sum_windows(samples: list[float]) -> list[float]:
-    return [sum(window) for window in zip(samples[:-2], samples[1:-1], samples[2:])]
+
+def solve(samples: Iterable[int]) -> int:
+    return count_increases(samples, WINDOW)
 
 
 if __name__ == "__main__":
-    windows = sum_windows([int(line) for line in fileinput.input()])
-    result = count_increases(windows)
-    print(result)
+    print(solve(stream_ints(cli_input())))
@@ -0,0 +1,101 @@
+"""Counts depth increases (see day01a) in huge binary files of samples, on all CPU cores.
+
+The file holds native-endian int32 or int64 samples, back to back. It's split into chunks
+of CHUNK_SAMPLES samples, counted in worker processes (see parallel.parallel_map), with NumPy
+when it's installed. Every sample is compared with the one `window` samples before it,
+which may be in the previous chunk - so chunks overlap by `window` samples.
+The count and the throughput (in samples/s) are printed.
+
+Usage: python src/day01binary.py FILE [--dtype int32|int64] [--window 3] [--workers N]
+"""
+import argparse
+import os
+import sys
+import time
+from array import array
+from functools import partial
+from pathlib import Path
+from typing import Optional, Union
+
+from core import numpy_backend
+from day01a import count_increases
+from parallel import parallel_map
+
+# dtype: array typecode
+DTYPES = {"int32": "i", "int64": "q"}
+
+CHUNK_SAMPLES = 1 << 24
+
+
+def sample_count(path: Union[str, Path], dtype: str) -> int:
+    size = os.path.getsize(path)
+    item_size = array(DTYPES[dtype]).itemsize
+    if size % item_size:
+        raise ValueError(f"{path} isn't a file of {dtype} samples ({size} bytes)")
+    return size // item_size
+
+
+def count_chunk(path: Union[str, Path], dtype: str, window: int, bounds: tuple[int, int]) -> int:
+    """Counts the increases at samples [start, end) of the file"""
+    start, end = bounds
+    # The first `window` samples of the file have nothing to be compared with
+    start = max(start, window)
+    if start >= end:
+        return 0
+
+    np = numpy_backend(end - start)
+    if np is not None:
+        samples = np.memmap(path, dtype=dtype, mode="r", shape=(end - start + window, ),
+                            offset=(start - window) * np.dtype(dtype).itemsize)
+        return int(np.count_nonzero(samples[window:] > samples[:-window]))
+
+    samples = array(DTYPES[dtype])
+    with open(path, "rb") as f:
+        f.seek((start - window) * samples.itemsize)
+        samples.fromfile(f, end - start + window)
+    return count_increases(samples, window)
+
+
+def chunks(samples: int, chunk_samples: int = CHUNK_SAMPLES) -> list[tuple[int, int]]:
+    return [(start, min(start + chunk_samples, samples))
+            for start in range(0, samples, chunk_samples)]
+
+
+def count_increases_in_file(path: Union[str, Path], dtype: str = "int64", window: int = 1,
+                            workers: Optional[int] = None) -> int:
+    if dtype not in DTYPES:
+        raise ValueError(f"unsupported dtype: {dtype!r} (expected one of {list(DTYPES)})")
+    if window < 1:
+        raise ValueError(f"window has to be at least 1, got {window}")
+
+    bounds = chunks(sample_count(path, dtype))
+    return sum(parallel_map(partial(count_chunk, path, dtype, window), bounds,
+                            chunk_size=1, workers=workers))
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.partition("\n\n")[0])
+    arg_parser.add_argument("file", type=Path)
+    arg_parser.add_argument("--dtype", choices=list(DTYPES), default="int64")
+    arg_parser.add_argument("--window", type=int, default=1,
+                            help="number of samples summed together (3 for part b)")
+    arg_parser.add_argument("--workers", type=int,
+                            help="number of processes (default: AOC_WORKERS or CPU count)")
+    args = arg_parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        count = count_increases_in_file(args.file, args.dtype, args.window, args.workers)
+    except ValueError as e:
+        arg_parser.error(str(e))
+    elapsed = time.perf_counter() - start
+
+    samples = sample_count(args.file, args.dtype)
+    print(count)
+    print(f"{samples} samples in {elapsed:.2f} s: {samples / elapsed:,.0f} samples/s",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,28 +1,206 @@
-from fileinput import FileInput
-from typing import Iterable
+from array import array
+from functools import reduce
+from pathlib import Path
+from typing import Any, Iterable, Iterator, NamedTuple, Optional, Sequence, Union
 
+from core import cli_input, extract_ints, numpy_backend
+from parallel import parallel_map
 
-def simulate(instructions: Iterable[str]) -> tuple[int, int]:
-    x: int = 0
-    y: int = 0
+Instruction = tuple[str, int]  # direction, value
 
-    for instruction in instructions:
-        direction, value_str = instruction.split()
-        value = int(value_str)
+DIRECTIONS = {ord(direction[0]): direction for direction in ("forward", "down", "up")}
+_DIRECTION_WORDS = {direction.encode() for direction in DIRECTIONS.values()}
 
-        if direction == "forward":
-            x += value
-        elif direction == "down":
-            y += value
-        elif direction == "up":
-            y -= value
+# Instructions are summarized in chunks of this size, in parallel
+SUMMARY_CHUNK = 1 << 20
+
+# Used to estimate the number of instructions of an input from its size
+AVERAGE_LINE_LENGTH = 8
+
+
+def parse_instruction(line: str) -> Instruction:
+    direction, value_str = line.split()
+    return direction, int(value_str)
+
+
+class Course(NamedTuple):
+    """Instructions, as the initial of every direction & the values"""
+    directions: bytes
+    values: Sequence[int]
+
+    @classmethod
+    def from_buffer(cls, buffer: Any) -> "Course":
+        np = numpy_backend(len(buffer) // AVERAGE_LINE_LENGTH)
+        if np is None:
+            # Lines are "direction value", so the words alternate
+            words = buffer.split()
+            if len(words) % 2:
+                raise ValueError("expected a direction and a value on every line")
+            for word in set(words[::2]) - _DIRECTION_WORDS:
+                raise ValueError("unknown direction: " + word.decode(errors="replace"))
+            return cls(bytes(word[0] for word in words[::2]), array("q", map(int, words[1::2])))
+
+        # Like above, words alternate between directions and values
+        data = np.frombuffer(buffer, dtype=np.uint8)
+        is_space = data <= ord(" ")
+        word_starts = np.flatnonzero(~is_space & np.concatenate(([True], is_space[:-1])))
+        if len(word_starts) % 2:
+            raise ValueError("expected a direction and a value on every line")
+        starts = word_starts[::2]
+        initials = data[starts]
+
+        # Every line has to start with a whole direction, followed by whitespace
+        valid = np.zeros(len(starts), dtype=bool)
+        for direction in DIRECTIONS.values():
+            word = direction.encode()
+            is_direction = initials == word[0]
+            ends = starts[is_direction] + len(word)
+            matches = ends <= len(data)
+            for offset, byte in enumerate(word[1:], 1 - len(word)):
+                matches[matches] = data[ends[matches] + offset] == byte
+            followed = matches & (ends < len(data))
+            matches[followed] = data[ends[followed]] <= ord(" ")
+            valid[is_direction] = matches
+        if not valid.all():
+            word = buffer[starts[valid.argmin()]:].split(maxsplit=1)[0]
+            raise ValueError("unknown direction: " + bytes(word).decode(errors="replace"))
+
+        directions = initials.tobytes()
+        values = extract_ints(buffer)
+
+        if len(directions) != len(values):
+            raise ValueError(f"expected a value in each of {len(directions)} instructions, "
+                             f"got {len(values)} values")
+        return cls(directions, values)
+
+    def instructions(self) -> Iterator[Instruction]:
+        for initial, value in zip(self.directions, self.values):
+            yield DIRECTIONS.get(initial, chr(initial)), value
+
+    def chunks(self, size: int) -> list["Course"]:
+        return [Course(self.directions[i:i + size], self.values[i:i + size])
+                for i in range(0, len(self.directions), size)]
+
+
+class CourseSummary(NamedTuple):
+    """The effect of a run of instructions, relative to where (and with which aim) it starts.
+
+    Every instruction is an affine transform of (x, depth, aim), so their runs compose:
+    summaries of consecutive chunks of instructions combine (associatively) into the summary
+    of all of them, which gives the positions of both parts.
+    """
+    forward: int = 0
+    # Both the change of the aim, and of the depth as day02a understands "down" and "up"
+    aim: int = 0
+    # Change of the depth as day02b understands it, if the run starts with an aim of 0
+    depth: int = 0
+
+    @classmethod
+    def of(cls, instructions: Iterable[Instruction]) -> "CourseSummary":
+        forward = aim = depth = 0
+
+        for direction, value in instructions:
+            if direction == "forward":
+                forward += value
+                depth += value * aim
+            elif direction == "down":
+                aim += value
+            elif direction == "up":
+                aim -= value
+            else:
+                raise ValueError("unknown direction: " + direction)
+
+        return cls(forward, aim, depth)
+
+    @classmethod
+    def of_numpy(cls, course: Course, np: Any) -> "CourseSummary":
+        initials = np.frombuffer(course.directions, dtype=np.uint8)
+        unknown = ~np.isin(initials, list(DIRECTIONS))
+        if unknown.any():
+            raise ValueError("unknown direction: " + chr(initials[unknown.argmax()]))
+
+        values = np.asarray(course.values, dtype=np.int64)
+        forward = np.where(initials == ord("f"), values, 0)
+        aim_change = np.where(initials == ord("d"), values, 0) \
+            - np.where(initials == ord("u"), values, 0)
+        # A prefix scan gives the aim before every instruction
+        aim = np.cumsum(aim_change) - aim_change
+        return cls(int(forward.sum()), int(aim_change.sum()), int((forward * aim).sum()))
+
+    def then(self, other: "CourseSummary") -> "CourseSummary":
+        """Returns the summary of this run of instructions followed by the other one"""
+        # The other run's forwards go deeper by this run's change of the aim
+        return CourseSummary(self.forward + other.forward, self.aim + other.aim,
+                             self.depth + other.depth + self.aim * other.forward)
+
+
+def summarize_chunk(course: Course) -> CourseSummary:
+    np = numpy_backend(len(course.directions))
+    if np is not None:
+        return CourseSummary.of_numpy(course, np)
+    return CourseSummary.of(course.instructions())
+
+
+def summarize(course: Course, workers: Optional[int] = None) -> CourseSummary:
+    """Summarizes chunks of the course in parallel (see parallel.parallel_map),
+    combining their summaries in order.
+    """
+    summaries = parallel_map(summarize_chunk, course.chunks(SUMMARY_CHUNK), workers=workers)
+    return reduce(CourseSummary.then, summaries, CourseSummary())
+
+
+class Submarine:
+    """A submarine following a course given in batches, e.g. as they arrive.
+
+    Only the summary of the instructions applied so far is kept, so positions are
+    answered without replaying them, and a snapshot is the (immutable) summary itself.
+    With `aiming`, "down" and "up" change the aim, as in part b; otherwise the depth.
+    """
+
+    def __init__(self, aiming: bool = False) -> None:
+        self.aiming: bool = aiming
+        self.summary: CourseSummary = CourseSummary()
+
+    def apply(self, batch: Union[Course, Iterable[Instruction]]) -> None:
+        if isinstance(batch, Course):
+            self.summary = self.summary.then(summarize_chunk(batch))
         else:
-            raise ValueError("unknown direction: " + direction)
+            self.summary = self.summary.then(CourseSummary.of(batch))
+
+    def position(self) -> tuple[int, int]:
+        """Returns the horizontal position and the depth"""
+        return self.summary.forward, self.summary.depth if self.aiming else self.summary.aim
+
+    def product(self) -> int:
+        x, depth = self.position()
+        return x * depth
+
+    def snapshot(self) -> CourseSummary:
+        return self.summary
+
+    def restore(self, snapshot: CourseSummary) -> None:
+        self.summary = snapshot
+
+
+def simulate(instructions: Iterable[Instruction]) -> tuple[int, int]:
+    summary = CourseSummary.of(instructions)
+    return summary.forward, summary.aim
+
+
+def parse(lines: Iterable[str]) -> Course:
+    return Course.from_buffer("".join(lines).encode())
+
+
+def load(path: Union[str, Path]) -> Course:
+    with open(0 if path == "-" else path, "rb", closefd=path != "-") as f:
+        data = f.read()
+    return Course.from_buffer(data)
+
 
-    return x, y
+def solve(course: Course) -> int:
+    summary = summarize(course)
+    return summary.forward * summary.aim
 
 
 if __name__ == "__main__":
-    input: "FileInput[str]" = FileInput()
-    x, y = simulate(input)
-    print(x * y)
+    print(solve(load(cli_input())))
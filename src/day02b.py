@@ -1,30 +1,19 @@
-from fileinput import FileInput
 from typing import Iterable
 
+from core import cli_input
+# parse and load are shared with part a
+from day02a import Course, CourseSummary, Instruction, load, parse, summarize  # noqa: F401
 
-def simulate(instructions: Iterable[str]) -> tuple[int, int]:
-    x: int = 0
-    y: int = 0
-    aim: int = 0
 
-    for instruction in instructions:
-        direction, value_str = instruction.split()
-        value = int(value_str)
+def simulate(instructions: Iterable[Instruction]) -> tuple[int, int]:
+    summary = CourseSummary.of(instructions)
+    return summary.forward, summary.depth
 
-        if direction == "forward":
-            x += value
-            y += value * aim
-        elif direction == "down":
-            aim += value
-        elif direction == "up":
-            aim -= value
-        else:
-            raise ValueError("unknown direction: " + direction)
 
-    return x, y
+def solve(course: Course) -> int:
+    summary = summarize(course)
+    return summary.forward * summary.depth
 
 
 if __name__ == "__main__":
-    input: "FileInput[str]" = FileInput()
-    x, y = simulate(input)
-    print(x * y)
+    print(solve(load(cli_input())))
@@ -0,0 +1,121 @@
+"""Converts day 2 courses to a compact binary format once, and solves them from it.
+
+Every instruction is a 5-byte record: the initial of its direction as the opcode
+(b"f", b"d" or b"u") and its value as a little-endian int32. Loading such a file
+doesn't parse any text; with NumPy, the records are memory-mapped and the positions
+of both parts computed with prefix sums (see day02a.CourseSummary).
+The answers of both parts and the throughput (in instructions/s) are printed.
+
+Usage: python src/day02binary.py convert INPUT_FILE OUTPUT_FILE
+       python src/day02binary.py solve FILE [--workers N]
+"""
+import argparse
+import os
+import struct
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import Optional, Union
+
+from core import numpy_backend
+from day02a import DIRECTIONS, Course, CourseSummary, load, summarize
+
+RECORD = struct.Struct("<Bi")
+# The same record as a NumPy dtype
+RECORD_DTYPE = [("opcode", "u1"), ("value", "<i4")]
+
+INT32_RANGE = range(-2 ** 31, 2 ** 31)
+
+
+def record_count(path: Union[str, Path]) -> int:
+    size = os.path.getsize(path)
+    if size % RECORD.size:
+        raise ValueError(f"{path} isn't a file of {RECORD.size}-byte records ({size} bytes)")
+    return size // RECORD.size
+
+
+def save_binary(course: Course, path: Union[str, Path]) -> None:
+    # Courses loaded from text have whole directions checked already (see day02a.Course)
+    for opcode in set(course.directions) - DIRECTIONS.keys():
+        raise ValueError(f"unknown direction opcode: {bytes([opcode])!r}")
+    if len(course.values) and (min(course.values) not in INT32_RANGE
+                               or max(course.values) not in INT32_RANGE):
+        raise ValueError("value doesn't fit in a 32-bit integer")
+
+    np = numpy_backend(len(course.directions))
+    with open(path, "wb") as f:
+        if np is not None:
+            records = np.empty(len(course.directions), dtype=RECORD_DTYPE)
+            records["opcode"] = np.frombuffer(course.directions, dtype=np.uint8)
+            records["value"] = course.values
+            records.tofile(f)
+        else:
+            for opcode, value in zip(course.directions, course.values):
+                f.write(RECORD.pack(opcode, value))
+
+
+def load_binary(path: Union[str, Path]) -> Course:
+    count = record_count(path)
+
+    np = numpy_backend(count)
+    if np is not None:
+        if count == 0:
+            return Course(b"", np.zeros(0, dtype=np.int32))
+        records = np.memmap(path, dtype=RECORD_DTYPE, mode="r", shape=(count, ))
+        return Course(records["opcode"].tobytes(), records["value"])
+
+    with open(path, "rb") as f:
+        data = f.read()
+    values = array("i")
+    directions = bytearray()
+    for opcode, value in RECORD.iter_unpack(data):
+        directions.append(opcode)
+        values.append(value)
+    return Course(bytes(directions), values)
+
+
+def convert(input_path: Union[str, Path], output_path: Union[str, Path]) -> int:
+    """Converts a text course to the binary format, returning the number of instructions"""
+    course = load(input_path)
+    save_binary(course, output_path)
+    return len(course.directions)
+
+
+def answers(summary: CourseSummary) -> tuple[int, int]:
+    """Returns the answers of parts a & b"""
+    return summary.forward * summary.aim, summary.forward * summary.depth
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.partition("\n\n")[0])
+    commands = arg_parser.add_subparsers(dest="command", required=True)
+    convert_command = commands.add_parser("convert", help="convert a text course to records")
+    convert_command.add_argument("input", help="input file, '-' for stdin")
+    convert_command.add_argument("output", type=Path)
+    solve_command = commands.add_parser("solve", help="solve both parts for a converted course")
+    solve_command.add_argument("file", type=Path)
+    solve_command.add_argument("--workers", type=int,
+                               help="number of processes (default: AOC_WORKERS or CPU count)")
+    args = arg_parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        if args.command == "convert":
+            count = convert(args.input, args.output)
+        else:
+            course = load_binary(args.file)
+            count = len(course.directions)
+            for answer in answers(summarize(course, args.workers)):
+                print(answer)
+    except ValueError as e:
+        arg_parser.error(str(e))
+    elapsed = time.perf_counter() - start
+
+    print(f"{count} instructions in {elapsed:.2f} s: {count / elapsed:,.0f} instructions/s",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,16 @@
-import fileinput
+from array import array
 from math import log2
+from pathlib import Path
+from typing import Any, Iterable, Sequence, Union
 
+from core import cli_input, load_ints, numpy_backend
+
+
+def get_rates(numbers: Sequence[int]) -> tuple[int, int]:
+    np = numpy_backend(len(numbers))
+    if np is not None:
+        return get_rates_numpy(numbers, np)
 
-def get_rates(numbers: list[int]) -> tuple[int, int]:
     gamma_rate = 0
     msb = int(log2(max(numbers)))
     mask = 1 << msb
@@ -17,6 +25,32 @@ def get_rates(numbers: list[int]) -> tuple[int, int]:
     return gamma_rate, epsilon_rate
 
 
+def get_rates_numpy(numbers: Sequence[int], np: Any) -> tuple[int, int]:
+    values = np.asarray(numbers, dtype=np.int64)
+    gamma_rate = 0
+    msb = int(values.max()).bit_length() - 1
+
+    for bit in range(msb + 1):
+        ones_count = int(np.count_nonzero(values & (1 << bit)))
+        if ones_count > len(values)//2:
+            gamma_rate |= 1 << bit
+
+    epsilon_rate = gamma_rate ^ ((1 << (msb + 1)) - 1)
+    return gamma_rate, epsilon_rate
+
+
+def parse(lines: Iterable[str]) -> list[int]:
+    return [int(line, 2) for line in lines]
+
+
+def load(path: Union[str, Path]) -> "array[int]":
+    return load_ints(path, 2)
+
+
+def solve(numbers: Sequence[int]) -> int:
+    gamma_rate, epsilon_rate = get_rates(numbers)
+    return gamma_rate * epsilon_rate
+
+
 if __name__ == "__main__":
-    gamma_rate, epsilon_rate = get_rates([int(line, 2) for line in fileinput.input()])
-    print(gamma_rate * epsilon_rate)
+    print(solve(load(cli_input())))
@@ -1,8 +1,12 @@
-import fileinput
 from math import log2
+from typing import Any, Sequence
 
+from core import cli_input, numpy_backend
+# parse and load are shared with part a
+from day03a import load, parse  # noqa: F401
 
-def get_rating(numbers: list[int], follow_most_common: bool = True) -> int:
+
+def get_rating(numbers: Sequence[int], follow_most_common: bool = True) -> int:
     # Start from the MSB
     # bit_idx = int(log2(max(numbers)))
     mask = 1 << int(log2(max(numbers)))
@@ -28,8 +32,33 @@ def get_rating(numbers: list[int], follow_most_common: bool = True) -> int:
     return numbers[0]
 
 
-if __name__ == "__main__":
-    numbers = [int(line, 2) for line in fileinput.input()]
+def get_rating_numpy(numbers: Sequence[int], np: Any, follow_most_common: bool = True) -> int:
+    candidates = np.asarray(numbers, dtype=np.int64)
+    mask = 1 << (int(candidates.max()).bit_length() - 1)
+
+    while len(candidates) > 1:
+        assert mask, "multiple matching numbers"
+        has_one = (candidates & mask) != 0
+        ones_count = int(np.count_nonzero(has_one))
+        keep_ones = ones_count >= len(candidates) - ones_count
+        candidates = candidates[has_one if keep_ones == follow_most_common else ~has_one]
+        mask >>= 1
+
+    assert len(candidates)
+    return int(candidates[0])
+
+
+def solve(numbers: Sequence[int]) -> int:
+    np = numpy_backend(len(numbers))
+    if np is not None:
+        oxygen_rate = get_rating_numpy(numbers, np, True)
+        co2_rate = get_rating_numpy(numbers, np, False)
+        return oxygen_rate * co2_rate
+
     oxygen_rate = get_rating(numbers, True)
     co2_rate = get_rating(numbers, False)
-    print(oxygen_rate * co2_rate)
+    return oxygen_rate * co2_rate
+
+
+if __name__ == "__main__":
+    print(solve(load(cli_input())))
@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from fileinput import FileInput
 from itertools import chain
-from typing import Sequence
+from math import inf
+from typing import Iterable, Iterator, Sequence
 
 import core
 
@@ -40,6 +41,18 @@ class Board:
             if field.number == number:
                 field.is_marked = True
 
+    def winning_turn(self, draw_turns: dict[int, int]) -> float:
+        """Returns the turn (index of the drawn number) after which the board wins,
+        or infinity if it never wins. draw_turns maps drawn numbers to their turns.
+        """
+        lines = self.fields + [self.column(idx) for idx in range(BOARD_SIZE)]
+        return min(max(draw_turns.get(f.number, inf) for f in line) for line in lines)
+
+    def score_after(self, draw_turns: dict[int, int], turn: float) -> int:
+        """Returns the score of the board after the given turn"""
+        return sum(f.number for row in self.fields for f in row
+                   if draw_turns.get(f.number, inf) > turn)
+
     @classmethod
     def from_lines(cls, lines: Sequence[str]) -> "Board":
         fields = [[Field(int(entry)) for entry in line.split()] for line in lines]
@@ -49,21 +62,47 @@ class Board:
         return cls(fields)
 
 
-def main(lines: list[str]) -> int:
-    grouped_lines = core.split_on(lines, core.empty_str)
-    numbers: list[int] = [int(i) for i in grouped_lines[0][0].split(",")]
-    boards: list[Board] = [Board.from_lines(i) for i in grouped_lines[1:]]
+Game = tuple[list[int], list[Board]]  # drawn numbers, boards
+
+
+def read_game(lines: Iterable[str]) -> tuple[list[int], Iterator[Board]]:
+    """Parses the drawn numbers; boards are parsed lazily, as they are consumed -
+    so they can only be solved once, keeping a single board in memory at a time
+    """
+    grouped_lines = core.isplit_on((i.rstrip() for i in lines), core.empty_str)
+    numbers: list[int] = [int(i) for i in next(next(grouped_lines)).split(",")]
+    boards = (Board.from_lines(list(i)) for i in grouped_lines)
+    return numbers, boards
+
+
+def parse(lines: Iterable[str]) -> Game:
+    numbers, boards = read_game(lines)
+    return numbers, list(boards)
+
+
+def solve(game: tuple[list[int], Iterable[Board]]) -> int:
+    # Instead of playing the game on all boards at once, find the turn
+    # in which every board wins - this way only a single board is kept in memory.
+    numbers, boards = game
+    draw_turns = {number: turn for turn, number in enumerate(numbers)}
+
+    best_turn: float = inf
+    best_score: int = 0
+
+    for board in boards:
+        turn = board.winning_turn(draw_turns)
+        if turn < best_turn:
+            best_turn = turn
+            best_score = board.score_after(draw_turns, turn)
+
+    assert best_turn != inf, "no winning board"
+    return numbers[int(best_turn)] * best_score
 
-    for number in numbers:
-        for board in boards:
-            board.mark(number)
-            if board.has_won():
-                return number * board.score()
 
-    assert False, "no winning board"
+def main(lines: Iterable[str]) -> int:
+    return solve(read_game(lines))
 
 
 if __name__ == "__main__":
     input: "FileInput[str]" = FileInput()
-    result = main([i.rstrip() for i in input])
-    print(result)
+    print(main(input))
@@ -1,29 +1,35 @@
 from fileinput import FileInput
+from math import inf
+from typing import Iterable
 
-import core
-from day04a import Board
+# parse is shared with part a
+from day04a import Board, parse, read_game  # noqa: F401
 
 
-def main(lines: list[str]) -> int:
-    grouped_lines = core.split_on(lines, core.empty_str)
-    numbers: list[int] = [int(i) for i in grouped_lines[0][0].split(",")]
-    boards: list[Board] = [Board.from_lines(i) for i in grouped_lines[1:]]
+def solve(game: tuple[list[int], Iterable[Board]]) -> int:
+    # Find the board which wins last - see day04a.solve
+    numbers, boards = game
+    draw_turns = {number: turn for turn, number in enumerate(numbers)}
 
-    for number in numbers:
-        for board in boards:
-            board.mark(number)
+    worst_turn: float = -inf
+    worst_score: int = 0
 
-        # If only one left - and it's won - calculate its score
-        if len(boards) < 2 and boards[0].has_won():
-            return boards[0].score() * number
+    for board in boards:
+        turn = board.winning_turn(draw_turns)
+        assert turn != inf, "a board never wins"
 
-        # Remove winning boards
-        boards = [i for i in boards if not i.has_won()]
+        if turn > worst_turn:
+            worst_turn = turn
+            worst_score = board.score_after(draw_turns, turn)
 
-    assert False, "no winning board"
+    assert worst_turn != -inf, "no boards"
+    return numbers[int(worst_turn)] * worst_score
+
+
+def main(lines: Iterable[str]) -> int:
+    return solve(read_game(lines))
 
 
 if __name__ == "__main__":
     input: "FileInput[str]" = FileInput()
-    result = main([i.rstrip() for i in input])
-    print(result)
+    print(main(input))
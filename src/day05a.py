@@ -1,69 +1,89 @@
 from collections import Counter
-from fileinput import FileInput
-from itertools import chain, cycle
-from typing import Generator, Iterable
+from itertools import chain
+from pathlib import Path
+from typing import Any, Callable, Generator, Iterable, Sequence, Union
+
+from core import PointSet, cli_input, extract_ints, grouped, load_ints, numpy_backend
 
 Point = tuple[int, int]
 Line = tuple[Point, Point]
 
 
-def parse_point(text: str) -> Point:
-    x, _, y = text.partition(",")
-    return int(x), int(y)
-
-
-def parse_line(text: str) -> Line:
-    left_pt, _, right_pt = text.partition(" -> ")
-    return parse_point(left_pt), parse_point(right_pt)
+def lines_from_ints(numbers: Sequence[int]) -> list[Line]:
+    """Groups numbers of the input (x1, y1, x2, y2 for every line) into lines"""
+    return [((x1, y1), (x2, y2)) for x1, y1, x2, y2 in grouped(numbers, 4)]
 
 
 def only_axis_aligned_lines(lines: Iterable[Line]) -> Generator[Line, None, None]:
     yield from filter(lambda line: line[0][0] == line[1][0] or line[0][1] == line[1][1], lines)
 
 
-def points_covered_by_line(line: Line) -> set[Point]:
-    xs: Iterable[int]
-    ys: Iterable[int]
+def points_covered_by_line(line: Line) -> PointSet:
+    if line[0][0] != line[1][0] and line[0][1] != line[1][1]:
+        raise RuntimeError("unaligned lines are not supported")
+    return PointSet.segment(*line)
+
+
+def count_overlaps(lines: Iterable[Line],
+                   covered_by: Callable[[Line], PointSet] = points_covered_by_line) -> int:
+    # Points are counted packed into ints, see core.PointSet
+    counter: Counter[int] = Counter(
+        chain.from_iterable(
+                covered_by(line).packed for line in lines
+            )
+    )
+
+    return sum(1 for count in counter.values() if count > 1)
+
 
-    if line[0][0] == line[1][0]:
-        # Aligned with axis X.
-        # Ensure that the 2nd point's y coord. is bigger
-        if line[0][1] > line[1][1]:
-            line = line[1], line[0]
+def count_overlaps_numpy(lines: Sequence[Line], np: Any) -> int:
+    """Like count_overlaps, for any horizontal, vertical or diagonal (45°) lines"""
+    if not lines:
+        return 0
 
-        xs = cycle((line[0][0], ))
-        ys = range(line[0][1], line[1][1] + 1)
+    x1, y1, x2, y2 = np.array(lines, dtype=np.int64).reshape(-1, 4).T
+    dx = x2 - x1
+    dy = y2 - y1
+    if np.any((dx != 0) & (dy != 0) & (np.abs(dx) != np.abs(dy))):
+        raise ValueError("segments must be horizontal, vertical or at 45 degrees")
 
-    elif line[0][1] == line[1][1]:
-        # Aligned with axis Y
-        # Ensure that 2nd point's x coord. is bigger
-        if line[0][0] > line[1][0]:
-            line = line[1], line[0]
+    # Rasterize all lines at once: point k of a line is start + k * step
+    lengths = np.maximum(np.abs(dx), np.abs(dy)) + 1
+    line_of_point = np.repeat(np.arange(len(lengths)), lengths)
+    k = np.arange(len(line_of_point)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    xs = x1[line_of_point] + k * np.sign(dx)[line_of_point]
+    ys = y1[line_of_point] + k * np.sign(dy)[line_of_point]
 
-        xs = range(line[0][0], line[1][0] + 1)
-        ys = cycle((line[0][1], ))
+    x_min, y_min = int(xs.min()), int(ys.min())
+    width = int(xs.max()) - x_min + 1
+    keys = (ys - y_min) * width + (xs - x_min)
 
+    # Count on a dense grid if it's not much bigger than the points themselves
+    if width * (int(ys.max()) - y_min + 1) <= 4 * len(keys):
+        counts = np.bincount(keys)
     else:
-        raise RuntimeError("unaligned lines are not supported")
+        _, counts = np.unique(keys, return_counts=True)
+    return int(np.count_nonzero(counts > 1))
 
-    return set(zip(xs, ys))
 
+def parse(lines: Iterable[str]) -> list[Line]:
+    return lines_from_ints(extract_ints("".join(lines)))
 
-def count_overlaps(lines: Iterable[Line]) -> int:
-    counter: Counter[Point] = Counter(
-        chain.from_iterable(
-                points_covered_by_line(line) for line in lines
-            )
-    )
 
-    return sum(1 for count in counter.values() if count > 1)
+def load(path: Union[str, Path]) -> list[Line]:
+    return lines_from_ints(load_ints(path))
+
+
+def solve(lines: list[Line]) -> int:
+    np = numpy_backend(len(lines))
+    if np is not None:
+        return count_overlaps_numpy(list(only_axis_aligned_lines(lines)), np)
+
+    return count_overlaps(only_axis_aligned_lines(lines))
 
 
 def main():
-    input: "FileInput[str]" = FileInput()
-    lines = only_axis_aligned_lines(parse_line(line.strip()) for line in input)
-    result = count_overlaps(lines)
-    print(result)
+    print(solve(load(cli_input())))
 
 
 if __name__ == "__main__":
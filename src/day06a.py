@@ -1,5 +1,8 @@
 from collections import Counter
-from fileinput import FileInput
+from pathlib import Path
+from typing import Iterable, Union
+
+from core import cli_input, load_ints
 
 
 def simulate(state: Counter[int], cycles: int) -> int:
@@ -20,9 +23,18 @@ def simulate(state: Counter[int], cycles: int) -> int:
     return sum(state.values())
 
 
+def parse(lines: Iterable[str]) -> Counter[int]:
+    initial_population = map(int, next(iter(lines)).rstrip().split(","))
+    return Counter(initial_population)
+
+
+def load(path: Union[str, Path]) -> Counter[int]:
+    return Counter(load_ints(path))
+
+
+def solve(initial_state: Counter[int]) -> int:
+    return simulate(initial_state, 80)
+
+
 if __name__ == "__main__":
-    input: "FileInput[str]" = FileInput()
-    initial_population = map(int, next(input).rstrip().split(","))
-    initial_state = Counter(initial_population)
-    result = simulate(initial_state, 80)
-    print(result)
+    print(solve(load(cli_input())))
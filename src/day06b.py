@@ -1,11 +1,13 @@
 from collections import Counter
-from fileinput import FileInput
 
-from day06a import simulate
+from core import cli_input
+# parse and load are shared with part a
+from day06a import load, parse, simulate  # noqa: F401
+
+
+def solve(initial_state: Counter[int]) -> int:
+    return simulate(initial_state, 256)
+
 
 if __name__ == "__main__":
-    input: "FileInput[str]" = FileInput()
-    initial_population = map(int, next(input).rstrip().split(","))
-    initial_state = Counter(initial_population)
-    result = simulate(initial_state, 256)
-    print(result)
+    print(solve(load(cli_input())))
@@ -1,17 +1,60 @@
-from fileinput import FileInput
-from typing import Iterable
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Iterable, Sequence, Union
+
+from core import cli_input, load_ints, numpy_backend
+
+FuelCalculator = Callable[[Iterable[int], int], int]
 
 
 def calculate_fuel_needed(positions: Iterable[int], target: int) -> int:
     return sum(abs(target - position) for position in positions)
 
 
-def find_cheapest_position(positions: list[int]) -> int:
+def find_cheapest_position(positions: Sequence[int],
+                           fuel_needed: FuelCalculator = calculate_fuel_needed) -> int:
     bounds = range(min(positions), max(positions)+1)
-    return min(calculate_fuel_needed(positions, bound) for bound in bounds)
+    return min(fuel_needed(positions, bound) for bound in bounds)
+
+
+def position_counts_numpy(positions: Sequence[int], np: Any) -> Any:
+    """Returns the number of crabs at every position, from the lowest to the highest one"""
+    values = np.asarray(positions, dtype=np.int64)
+    return np.bincount(values - values.min())
+
+
+def linear_costs_numpy(counts: Any, np: Any) -> Any:
+    """Returns the fuel needed to move all crabs (counted by position_counts_numpy)
+    to every position, using prefix sums rather than summing over the crabs for each one.
+    """
+    targets = np.arange(len(counts), dtype=np.int64)
+    count_up_to = np.cumsum(counts)
+    sum_up_to = np.cumsum(counts * targets)
+    # Crabs up to the target move right, the rest move left
+    return (targets * count_up_to - sum_up_to
+            + (sum_up_to[-1] - sum_up_to) - targets * (count_up_to[-1] - count_up_to))
+
+
+def parse(lines: Iterable[str]) -> list[int]:
+    return list(map(int, next(iter(lines)).rstrip().split(",")))
+
+
+def load(path: Union[str, Path]) -> "array[int]":
+    return load_ints(path)
+
+
+def search_size(positions: Sequence[int]) -> int:
+    """Returns the number of (crab, target) pairs the pure-Python search goes through"""
+    return len(positions) * (max(positions, default=0) - min(positions, default=0) + 1)
+
+
+def solve(initial_positions: Sequence[int]) -> int:
+    np = numpy_backend(search_size(initial_positions))
+    if np is not None:
+        return int(linear_costs_numpy(position_counts_numpy(initial_positions, np), np).min())
+
+    return find_cheapest_position(initial_positions)
 
 
 if __name__ == "__main__":
-    input: "FileInput[str]" = FileInput()
-    initial_positions = list(map(int, next(input).rstrip().split(",")))
-    print(find_cheapest_position(initial_positions))
+    print(solve(load(cli_input())))
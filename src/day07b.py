@@ -1,7 +1,9 @@
-from fileinput import FileInput
-from typing import Iterable
+from typing import Any, Iterable, Sequence
 
-import day07a
+from core import cli_input, numpy_backend
+# parse and load are shared with part a
+from day07a import (find_cheapest_position, linear_costs_numpy, load, parse,  # noqa: F401
+                    position_counts_numpy, search_size)
 
 
 def single_fuel_needed(delta: int) -> int:
@@ -12,9 +14,25 @@ def calculate_fuel_needed(positions: Iterable[int], target: int) -> int:
     return sum(single_fuel_needed(abs(target - position)) for position in positions)
 
 
-if __name__ == "__main__":
-    day07a.calculate_fuel_needed = calculate_fuel_needed
+def costs_numpy(counts: Any, np: Any) -> Any:
+    """Like day07a.linear_costs_numpy, for costs of d * (d + 1) / 2 = (d² + d) / 2"""
+    # Targets are the same range of positions as those of the crabs
+    positions = np.arange(len(counts), dtype=np.int64)
+    crabs = counts.sum()
+    position_sum = (counts * positions).sum()
+    square_sum = (counts * positions * positions).sum()
+    # Sum of (target - position)² over all crabs, for every target
+    squares = positions * positions * crabs - 2 * positions * position_sum + square_sum
+    return (squares + linear_costs_numpy(counts, np)) // 2
+
+
+def solve(initial_positions: Sequence[int]) -> int:
+    np = numpy_backend(search_size(initial_positions))
+    if np is not None:
+        return int(costs_numpy(position_counts_numpy(initial_positions, np), np).min())
 
-    input: "FileInput[str]" = FileInput()
-    initial_positions = list(map(int, next(input).rstrip().split(",")))
-    print(day07a.find_cheapest_position(initial_positions))
+    return find_cheapest_position(initial_positions, calculate_fuel_needed)
+
+
+if __name__ == "__main__":
+    print(solve(load(cli_input())))
@@ -1,13 +1,21 @@
 from fileinput import FileInput
+from typing import Iterable
+
+
+def parse(lines: Iterable[str]) -> list[list[str]]:
+    """Returns the output words of every display"""
+    return [line.strip().partition(" | ")[2].split() for line in lines]
 
-if __name__ == "__main__":
-    input: "FileInput[str]" = FileInput()
-    sum: int = 0
 
-    for line in input:
-        _, _, outputs = line.strip().partition(" | ")
-        for word in outputs.split():
-            if len(word) in {2, 3, 4, 7}:
-                sum += 1
+def solve(outputs: list[list[str]]) -> int:
+    return sum(
+        1
+        for words in outputs
+        for word in words
+        if len(word) in {2, 3, 4, 7}
+    )
 
-    print(sum)
+
+if __name__ == "__main__":
+    input: "FileInput[str]" = FileInput()
+    print(solve(parse(input)))
@@ -1,12 +1,13 @@
-import operator
 from fileinput import FileInput
-from functools import reduce
 from typing import Iterable
 
-from core import aggregate_by
+from core import reduce_by
 
 Guess = dict[str, set[str]]
 Bins = tuple[Guess, Guess, Guess]
+Digits = tuple[int, frozenset[str]]  # count, segments all of them have in common
+
+ALL_SEGMENTS = frozenset("abcdefg")
 
 
 DIGITS: dict[frozenset[str], str] = {
@@ -61,10 +62,9 @@ def info_from_unique(input: set[str]) -> Guess:
     # len 7 - digit 8 - pointless, doesn't convey any info
 
 
-def info_from_five_segments(five_segment_inputs: Iterable[set[str]]) -> Guess:
-    """Infers possible mappings from all of the inputs of length 5"""
+def info_from_five_segments(intersection: set[str]) -> Guess:
+    """Infers possible mappings from the intersection of all inputs of length 5"""
     # digits 2, 3, 5
-    intersection: set[str] = reduce(operator.and_, five_segment_inputs)
     assert len(intersection) == 3
 
     return {
@@ -74,10 +74,9 @@ def info_from_five_segments(five_segment_inputs: Iterable[set[str]]) -> Guess:
     }
 
 
-def info_from_six_segments(six_segment_inputs: Iterable[set[str]]) -> Guess:
-    """Infers possible mappings from all of the inputs of length 5"""
+def info_from_six_segments(intersection: set[str]) -> Guess:
+    """Infers possible mappings from the intersection of all inputs of length 6"""
     # digits 0, 6, 9
-    intersection: set[str] = reduce(operator.and_, six_segment_inputs)
     assert len(intersection) == 4
 
     return {
@@ -144,27 +143,35 @@ def simplify_solution(guess: Guess) -> dict[str, str]:
     return solution
 
 
+def add_digit(digits: Digits, input: str) -> Digits:
+    count, common = digits
+    return count + 1, common.intersection(input)
+
+
 def find_mapping(inputs: Iterable[str]) -> dict[str, str]:
     # Start by assuming that every input could map to every output
     guess: dict[str, set[str]] = {segment: set("abcdefg") for segment in "abcdefg"}
-    inputs_by_length: dict[int, list[set[str]]] = aggregate_by(map(set, inputs), len)
+
+    # Only the number of inputs of every length and the segments they have in common matter
+    by_length = reduce_by(inputs, len, add_digit, (0, ALL_SEGMENTS))
+    common_by_length = {length: set(common) for length, (_, common) in by_length.items()}
 
     # Assert correct groupings
-    assert len(inputs_by_length[2]) == 1
-    assert len(inputs_by_length[3]) == 1
-    assert len(inputs_by_length[4]) == 1
-    assert len(inputs_by_length[5]) == 3
-    assert len(inputs_by_length[6]) == 3
-    assert len(inputs_by_length[7]) == 1
+    assert by_length[2][0] == 1
+    assert by_length[3][0] == 1
+    assert by_length[4][0] == 1
+    assert by_length[5][0] == 3
+    assert by_length[6][0] == 3
+    assert by_length[7][0] == 1
 
     # Infer info from unique-length digits
-    update_guess(guess, info_from_unique(inputs_by_length[2][0]))
-    update_guess(guess, info_from_unique(inputs_by_length[3][0]))
-    update_guess(guess, info_from_unique(inputs_by_length[4][0]))
+    update_guess(guess, info_from_unique(common_by_length[2]))
+    update_guess(guess, info_from_unique(common_by_length[3]))
+    update_guess(guess, info_from_unique(common_by_length[4]))
 
     # Infer info from five- and six-segment digits
-    update_guess(guess, info_from_five_segments(inputs_by_length[5]))
-    update_guess(guess, info_from_six_segments(inputs_by_length[6]))
+    update_guess(guess, info_from_five_segments(common_by_length[5]))
+    update_guess(guess, info_from_six_segments(common_by_length[6]))
 
     return simplify_solution(guess)
 
@@ -186,6 +193,14 @@ def decode_line(line: str) -> int:
     return decode_number(outputs.split(), reversed_mapping)
 
 
+def parse(lines: Iterable[str]) -> list[str]:
+    return [line.strip() for line in lines]
+
+
+def solve(lines: list[str]) -> int:
+    return sum(decode_line(line) for line in lines)
+
+
 if __name__ == "__main__":
     input: "FileInput[str]" = FileInput()
-    print(sum(decode_line(line.strip()) for line in input))
+    print(solve(parse(input)))
@@ -1,40 +1,44 @@
 from fileinput import FileInput
-from typing import Iterable
+from typing import Any, Iterable
 
-Point = tuple[int, int]
+from core import Grid, numpy_backend
 
 
-def maybe_neighbors(pt: Point) -> Iterable[Point]:
-    yield pt[0] - 1, pt[1]
-    yield pt[0] + 1, pt[1]
-    yield pt[0], pt[1] - 1
-    yield pt[0], pt[1] + 1
+def find_low_points(heightmap: Grid) -> Iterable[tuple[int, int]]:
+    """Yields (index, value) of every cell lower than all of its neighbours"""
+    np = numpy_backend(len(heightmap))
+    if np is not None:
+        yield from find_low_points_numpy(heightmap, np)
+        return
 
+    for i, value in enumerate(heightmap.cells):
+        if all(heightmap[n] > value for n in heightmap.neighbors(i)):
+            yield i, value
 
-def neighbors(pt: Point, height: int, width: int) -> Iterable[Point]:
-    for x, y in maybe_neighbors(pt):
-        if 0 <= x < height and 0 <= y < width:
-            yield x, y
 
+def find_low_points_numpy(heightmap: Grid, np: Any) -> Iterable[tuple[int, int]]:
+    # Cells outside of the map are higher than any height
+    heights = np.pad(heightmap.array(), 1, constant_values=10)
+    middle = heights[1:-1, 1:-1]
+    low = ((middle < heights[:-2, 1:-1]) & (middle < heights[2:, 1:-1])
+           & (middle < heights[1:-1, :-2]) & (middle < heights[1:-1, 2:]))
 
-def find_low_points(heightmap: list[list[int]], height: int, width: int) \
-        -> Iterable[tuple[Point, int]]:
-    for x, row in enumerate(heightmap):
-        for y, value in enumerate(row):
-            if all(heightmap[nx][ny] > value for nx, ny in neighbors((x, y), height, width)):
-                yield (x, y), value
+    indexes = np.flatnonzero(low)
+    yield from zip(indexes.tolist(), middle.ravel()[indexes].tolist())
 
 
-def load_heightmap(lines: Iterable[str]) -> list[list[int]]:
-    return [[int(chr) for chr in line.strip()] for line in lines]
+def load_heightmap(lines: Iterable[str]) -> Grid:
+    return Grid.from_lines(line.strip() for line in lines)
+
+
+def parse(lines: Iterable[str]) -> Grid:
+    return load_heightmap(lines)
+
+
+def solve(heightmap: Grid) -> int:
+    return sum(1 + value for _, value in find_low_points(heightmap))
 
 
 if __name__ == "__main__":
     input: "FileInput[str]" = FileInput()
-    heightmap = load_heightmap(input)
-    height = len(heightmap)
-    width = len(heightmap[0])
-    risk_level_of_low_points = sum(
-        1 + value for _, value in find_low_points(heightmap, height, width)
-    )
-    print(risk_level_of_low_points)
+    print(solve(parse(input)))
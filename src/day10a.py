@@ -1,5 +1,5 @@
 from fileinput import FileInput
-from typing import Optional
+from typing import Iterable, Optional
 
 EXPECTED_OPEN_BRACKET: dict[str, str] = {
     ")": "(",
@@ -35,13 +35,21 @@ def incorrect_brackets(line: str) -> Optional[str]:
             assert False, f"invalid char: {char!r}"
 
 
-if __name__ == "__main__":
-    input: "FileInput[str]" = FileInput()
+def parse(lines: Iterable[str]) -> list[str]:
+    return [line.strip() for line in lines]
+
+
+def solve(lines: list[str]) -> int:
     total: int = 0
 
-    for line in (i.strip() for i in input):
+    for line in lines:
         incorrect_bracket = incorrect_brackets(line)
         if incorrect_bracket:
             total += SCORES[incorrect_bracket]
 
-    print(total)
+    return total
+
+
+if __name__ == "__main__":
+    input: "FileInput[str]" = FileInput()
+    print(solve(parse(input)))
@@ -1,7 +1,8 @@
 from fileinput import FileInput
-from statistics import median
 from typing import Iterable
 
+from day10a import parse
+
 EXPECTED_OPEN_BRACKET: dict[str, str] = {
     ")": "(",
     "]": "[",
@@ -51,6 +52,12 @@ def autocomplete_scores(input: Iterable[str]) -> Iterable[int]:
             yield score
 
 
+def solve(lines: list[str]) -> int:
+    # There's always an odd number of incomplete lines, so the median is the middle score
+    scores = sorted(autocomplete_scores(lines))
+    return scores[len(scores) // 2]
+
+
 if __name__ == "__main__":
     input: "FileInput[str]" = FileInput()
-    print(median(autocomplete_scores(input)))
+    print(solve(parse(input)))
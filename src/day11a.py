@@ -1,67 +1,91 @@
 from fileinput import FileInput
-from itertools import product
-from typing import Iterable
+from typing import Any, Iterable
 
-Board = list[list[int]]
-Point = tuple[int, int]
+from core import Grid, numpy_backend
 
-BOARD_SIZE = 10
+Board = Grid
 
 
 def dump_board(b: Board):
-    for row in b:
-        print("".join(map(str, row)))
-
-
-def neighbors(x: int, y: int) -> Iterable[Point]:
-    for nx, ny in product((x-1, x, x+1), (y-1, y, y+1)):
-        if 0 <= nx < BOARD_SIZE and 0 <= ny < BOARD_SIZE and not (nx == x and ny == y):
-            yield nx, ny
+    print(b)
 
 
 def evolve(board: Board) -> tuple[Board, int]:
-    flashed: set[Point] = set()
-    to_expand: set[Point] = set()
+    np = numpy_backend(len(board))
+    if np is not None:
+        return evolve_numpy(board, np)
+
+    cells = board.cells
+    to_expand: list[int] = []
 
     # Add one to every position and find initial flashes
-    for x, y in product(range(BOARD_SIZE), range(BOARD_SIZE)):
-        board[x][y] += 1
-        if board[x][y] > 9:
-            flashed.add((x, y))
-            to_expand.add((x, y))
+    for i in range(len(cells)):
+        cells[i] += 1
+        if cells[i] > 9:
+            to_expand.append(i)
 
-    # Bump values until no other flashes occur
+    # Bump values until no other flashes occur;
+    # octopuses with energy above 9 have already flashed.
     while to_expand:
-        x, y = to_expand.pop()
+        i = to_expand.pop()
 
         # Bump adjacent
-        for nx, ny in neighbors(x, y):
+        for n in board.neighbors(i, diagonal=True):
             # Neighbor already flashed - ignore
-            if (nx, ny) in flashed:
+            if cells[n] > 9:
                 continue
 
-            board[nx][ny] += 1
-            if board[nx][ny] > 9:
-                flashed.add((nx, ny))
-                to_expand.add((nx, ny))
+            cells[n] += 1
+            if cells[n] > 9:
+                to_expand.append(n)
 
     # Wrap around flashed to zero
-    for x, y in flashed:
-        board[x][y] = 0
+    flashed = 0
+    for i in range(len(cells)):
+        if cells[i] > 9:
+            cells[i] = 0
+            flashed += 1
 
-    return board, len(flashed)
+    return board, flashed
 
 
-if __name__ == "__main__":
-    input: "FileInput[str]" = FileInput()
-    board = [
-        [int(i) for i in line.strip()]
-        for line in input
-    ]
+def evolve_numpy(board: Board, np: Any) -> tuple[Board, int]:
+    """Like evolve, flashing all octopuses above 9 at once"""
+    energy = board.array()
+    energy += 1
+    flashed = np.zeros(energy.shape, dtype=bool)
+
+    while True:
+        flashing = (energy > 9) & ~flashed
+        if not flashing.any():
+            break
+        flashed |= flashing
+
+        # Bump the 8 neighbours of every flashing octopus; a bump of an octopus
+        # which already flashed doesn't matter, as it's reset to 0 anyway
+        bumps = np.pad(flashing, 1).astype(np.uint8)
+        energy += (bumps[:-2, :-2] + bumps[:-2, 1:-1] + bumps[:-2, 2:]
+                   + bumps[1:-1, :-2] + bumps[1:-1, 2:]
+                   + bumps[2:, :-2] + bumps[2:, 1:-1] + bumps[2:, 2:])
+
+    energy[flashed] = 0
+    return board, int(np.count_nonzero(flashed))
+
+
+def parse(lines: Iterable[str]) -> Board:
+    return Grid.from_lines(line.strip() for line in lines)
+
+
+def solve(board: Board) -> int:
     flashes: int = 0
 
     for _ in range(100):
         board, current_flashes = evolve(board)
         flashes += current_flashes
 
-    print(flashes)
+    return flashes
+
+
+if __name__ == "__main__":
+    input: "FileInput[str]" = FileInput()
+    print(solve(parse(input)))
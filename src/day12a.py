@@ -1,5 +1,7 @@
 from fileinput import FileInput
-from typing import Iterable
+from typing import Iterable, Optional
+
+from core import SearchStats
 
 Node = tuple[str, set[str]]
 Graph = dict[str, Node]
@@ -22,25 +24,41 @@ def make_graph(lines: Iterable[str]) -> Graph:
     return graph
 
 
-def find_all_paths(graph: Graph) -> set[Path]:
+def find_all_paths(graph: Graph, stats: Optional[SearchStats] = None) \
+        -> tuple[set[Path], SearchStats]:
+    if stats is None:
+        stats = SearchStats()
+
     finished: set[Path] = set()
     queue: set[Path] = {("start", )}
 
     while queue:
         to_expand = queue.pop()
+        stats.popped += 1
         _, adjacent = graph[to_expand[-1]]
 
         for node in adjacent:
             if node == "end":
                 finished.add(tuple(list(to_expand) + [node]))
             elif node.isupper() or (node not in to_expand):
-                queue.add(tuple(list(to_expand) + [node]))
+                new_path = tuple(list(to_expand) + [node])
+                queue.add(new_path)
+                stats.pushed += 1
+                stats.update_peak(queue, new_path)
+
+    stats.report("day12a.find_all_paths")
+    return finished, stats
+
+
+def parse(lines: Iterable[str]) -> Graph:
+    return make_graph(lines)
+
 
-    return finished
+def solve(graph: Graph) -> int:
+    paths, _ = find_all_paths(graph)
+    return len(paths)
 
 
 if __name__ == "__main__":
     input: "FileInput[str]" = FileInput()
-    graph = make_graph(input)
-    paths = find_all_paths(graph)
-    print(len(paths))
+    print(solve(parse(input)))
@@ -1,10 +1,15 @@
 from fileinput import FileInput
 from typing import Optional
 
-from day12a import Graph, Path, make_graph
+from core import SearchStats
+from day12a import Graph, Path, parse
 
 
-def find_all_paths(graph: Graph) -> set[Path]:
+def find_all_paths(graph: Graph, stats: Optional[SearchStats] = None) \
+        -> tuple[set[Path], SearchStats]:
+    if stats is None:
+        stats = SearchStats()
+
     finished: set[Path] = set()
 
     # The second element represents which small cave was visited twice
@@ -12,6 +17,7 @@ def find_all_paths(graph: Graph) -> set[Path]:
 
     while queue:
         path_so_far, small_cave_visited_twice = queue.pop()
+        stats.popped += 1
         _, adjacent = graph[path_so_far[-1]]
 
         for node in adjacent:
@@ -26,17 +32,28 @@ def find_all_paths(graph: Graph) -> set[Path]:
             elif node.isupper() or node not in path_so_far:
                 # Big cave or a non-visited small cave
                 queue.add((with_node_appended, small_cave_visited_twice))
+                stats.pushed += 1
 
             elif small_cave_visited_twice is None:
                 # Small cave, that we already visited;
                 # however none other small cave was already visited twice.
                 queue.add((with_node_appended, node))
+                stats.pushed += 1
+
+            else:
+                continue
+
+            stats.update_peak(queue, with_node_appended)
+
+    stats.report("day12b.find_all_paths")
+    return finished, stats
+
 
-    return finished
+def solve(graph: Graph) -> int:
+    paths, _ = find_all_paths(graph)
+    return len(paths)
 
 
 if __name__ == "__main__":
     input: "FileInput[str]" = FileInput()
-    graph = make_graph(input)
-    paths = find_all_paths(graph)
-    print(len(paths))
+    print(solve(parse(input)))
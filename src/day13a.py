@@ -1,18 +1,17 @@
 from fileinput import FileInput
+from itertools import chain
 from typing import Iterable
 
-from core import empty_str, split_on
+from core import PointSet, empty_str, extract_ints, grouped, isplit_on
 
-Point = tuple[int, int]  # x, y
 Fold = tuple[int, int]   # fold_axis, along
-Points = set[Point]
+Points = PointSet
 
 
-def parse_points(lines: Iterable[str]) -> Points:
-    points: Points = set()
-    for line in lines:
-        x, _, y = line.partition(",")
-        points.add((int(x), int(y)))
+def parse_points(text: str) -> Points:
+    points = PointSet()
+    for x, y in grouped(extract_ints(text), 2):
+        points.add(x, y)
     return points
 
 
@@ -24,45 +23,26 @@ def parse_folds(lines: Iterable[str]) -> list[Fold]:
     return folds
 
 
-def partition_for_fold(points: Points, fold_axis: int, along: int) -> tuple[Points, Points]:
-    # Split the set of points into 2 buckets:
-    # 1. points before the fold line and after the fold line
-    before_fold: Points = set()
-    after_fold: Points = set()
-
-    for point in points:
-        if point[fold_axis] < along:
-            before_fold.add(point)
-        elif point[fold_axis] > along:
-            after_fold.add(point)
-        # Dropping all points on the fold axis
-
-    return before_fold, after_fold
-
+def perform_fold(points: Points, fold_axis: int, along: int) -> Points:
+    # Points after the fold line are mirrored, points on the fold line are dropped
+    return points.folded(fold_axis, along)
 
-def mirror_point(point: Point, fold_axis: int, along: int) -> Point:
-    if fold_axis == 0:
-        return 2*along - point[0], point[1]
-    else:
-        return point[0], 2*along - point[1]
 
+def parse(lines: Iterable[str]) -> tuple[Points, list[Fold]]:
+    # Points, then folds - in the groups of lines separated by blank ones
+    groups = isplit_on((i.strip() for i in lines), empty_str)
+    points = parse_points("\n".join(next(groups, ())))
+    return points, parse_folds(chain.from_iterable(groups))
 
-def perform_fold(points: Points, fold_axis: int, along: int) -> Points:
-    correct, to_mirror = partition_for_fold(points, fold_axis, along)
 
-    for point in to_mirror:
-        correct.add(mirror_point(point, fold_axis, along))
+def solve(manual: tuple[Points, list[Fold]]) -> int:
+    points, folds = manual
 
-    return correct
+    # Perform a single fold
+    points = perform_fold(points, *folds[0])
+    return len(points)
 
 
 if __name__ == "__main__":
     input: "FileInput[str]" = FileInput()
-    point_lines, fold_lines = split_on((i.strip() for i in input), empty_str)
-
-    points = parse_points(point_lines)
-    folds = parse_folds(fold_lines)
-
-    # Perform a single fold
-    points = perform_fold(points, *folds[0])
-    print(len(points))
+    print(solve(parse(input)))
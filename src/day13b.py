@@ -1,7 +1,6 @@
 from fileinput import FileInput
 
-from core import empty_str, split_on
-from day13a import Points, parse_folds, parse_points, perform_fold
+from day13a import Fold, Points, parse, perform_fold
 
 
 def pprint_points(points: Points) -> str:
@@ -11,21 +10,22 @@ def pprint_points(points: Points) -> str:
 
     for y in range(max_y+1):
         for x in range(max_x+1):
-            text += "#" if (x, y) in points else " "
+            text += "#" if points.contains(x, y) else " "
         text += "\n"
 
     return text
 
 
-if __name__ == "__main__":
-    input: "FileInput[str]" = FileInput()
-    point_lines, fold_lines = split_on((i.strip() for i in input), empty_str)
-
-    points = parse_points(point_lines)
-    folds = parse_folds(fold_lines)
+def solve(manual: tuple[Points, list[Fold]]) -> str:
+    points, folds = manual
 
     # Perform folds
     for fold in folds:
         points = perform_fold(points, *fold)
 
-    print(pprint_points(points))
+    return pprint_points(points)
+
+
+if __name__ == "__main__":
+    input: "FileInput[str]" = FileInput()
+    print(solve(parse(input)))
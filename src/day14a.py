@@ -28,12 +28,17 @@ def perform_insertions(value: str, table: dict[str, str]) -> str:
     return value
 
 
-if __name__ == "__main__":
-    input: "FileInput[str]" = FileInput()
-    values, insertion_pairs = split_on((i.strip() for i in input), empty_str)
-    assert len(values) == 1
-    value = values[0]
-    table = parse_inertions(insertion_pairs)
+Manual = tuple[str, dict[str, str]]  # template, insertion table
+
+
+def parse(lines: Iterable[str]) -> Manual:
+    templates, insertion_pairs = split_on((i.strip() for i in lines), empty_str)
+    assert len(templates) == 1
+    return templates[0], parse_inertions(insertion_pairs)
+
+
+def solve(manual: Manual) -> int:
+    value, table = manual
 
     for _ in range(10):
         value = perform_insertions(value, table)
@@ -42,4 +47,9 @@ if __name__ == "__main__":
     most_common = counted[0]
     least_common = counted[-1]
 
-    print(most_common[1] - least_common[1])
+    return most_common[1] - least_common[1]
+
+
+if __name__ == "__main__":
+    input: "FileInput[str]" = FileInput()
+    print(solve(parse(input)))
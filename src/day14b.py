@@ -1,8 +1,7 @@
 from fileinput import FileInput
 from typing import Counter
 
-from core import empty_str, split_on
-from day14a import parse_inertions
+from day14a import Manual, parse
 
 
 def perform_insertions(pairs: Counter[str], table: dict[str, str]) -> Counter[str]:
@@ -33,12 +32,8 @@ def pair_count_to_chr_counter(pairs: Counter[str]) -> Counter[str]:
     return chars
 
 
-if __name__ == "__main__":
-    input: "FileInput[str]" = FileInput()
-    templates, insertion_pairs = split_on((i.strip() for i in input), empty_str)
-    assert len(templates) == 1
-    template = templates[0]
-    table = parse_inertions(insertion_pairs)
+def solve(manual: Manual) -> int:
+    template, table = manual
 
     pair_counter = initial_pair_count(template)
 
@@ -50,4 +45,9 @@ if __name__ == "__main__":
     least_common = counted[-1]
 
     # No fucking clue why I have to add one, but it works
-    print(most_common[1] - least_common[1] + 1)
+    return most_common[1] - least_common[1] + 1
+
+
+if __name__ == "__main__":
+    input: "FileInput[str]" = FileInput()
+    print(solve(parse(input)))
@@ -2,83 +2,96 @@ import dataclasses
 import heapq
 import math
 from fileinput import FileInput
-from typing import Iterable
-
-Point = tuple[int, int]
-Map = list[list[int]]
+from typing import Iterable, Optional
 
+from core import Grid, SearchStats
 
-NEIGHBOR_DELTAS: list[Point] = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+Point = tuple[int, int]
+Map = Grid
 
 
 @dataclasses.dataclass(order=True)
 class AStarQueueItem:
-    pt: Point = dataclasses.field(compare=False)
+    pt: int = dataclasses.field(compare=False)
     cost_to: float = dataclasses.field(compare=False)
     heuristic: float = dataclasses.field(compare=True)
 
 
 def dist(p1: Point, p2: Point) -> float:
     dx = p2[0] - p1[0]
-    dy = p2[1] - p1[0]
+    dy = p2[1] - p1[1]
     return (dx ** 2 + dy ** 2) ** 0.5
 
 
-def valid_point(x: int, y: int, size: int) -> bool:
-    return 0 <= x < size and 0 <= y < size
-
-
-def neighbors(x: int, y: int, size: int) -> Iterable[Point]:
-    for dx, dy in NEIGHBOR_DELTAS:
-        nx = x + dx
-        ny = y + dy
-        if valid_point(nx, ny, size):
-            yield nx, ny
-
-
-def restore_path(pt: Point, came_from: dict[Point, Point]) -> list[Point]:
-    path: list[Point] = [pt]
+def restore_path(pt: int, came_from: dict[int, int]) -> list[int]:
+    path: list[int] = [pt]
     while pt in came_from:
         pt = came_from[pt]
         path.insert(0, pt)
     return path
 
 
-def a_star(start: Point, end: Point, map: Map, size: int) -> list[Point]:
-    assert valid_point(*start, size)
-    assert valid_point(*end, size)
+def a_star(start: int, end: int, map: Map, stats: Optional[SearchStats] = None) \
+        -> tuple[list[int], SearchStats]:
+    """Finds the cheapest path between 2 cells (given by their indices) of the map"""
+    assert 0 <= start < len(map)
+    assert 0 <= end < len(map)
+
+    if stats is None:
+        stats = SearchStats()
+
+    end_pt = map.coords(end)
 
-    queue: list[AStarQueueItem] = [AStarQueueItem(start, 0, dist(start, end))]
-    scores: dict[Point, float] = {start: 0}
-    came_from: dict[Point, Point] = {}
+    queue: list[AStarQueueItem] = [AStarQueueItem(start, 0, dist(map.coords(start), end_pt))]
+    scores: dict[int, float] = {start: 0}
+    came_from: dict[int, int] = {}
 
     while queue:
         item = heapq.heappop(queue)
+        stats.popped += 1
+
         if item.pt == end:
-            return restore_path(item.pt, came_from)
+            stats.report("day15a.a_star")
+            return restore_path(item.pt, came_from), stats
+
+        # A cheaper path to this point was found after this item was queued
+        if item.cost_to > scores[item.pt]:
+            stats.stale += 1
+            continue
 
-        for neighbor in neighbors(*item.pt, size):
-            new_cost_to = item.cost_to + map[neighbor[0]][neighbor[1]]
+        for neighbor in map.neighbors(item.pt):
+            new_cost_to = item.cost_to + map[neighbor]
 
             if new_cost_to < scores.get(neighbor, math.inf):
                 scores[neighbor] = new_cost_to
                 came_from[neighbor] = item.pt
-                heapq.heappush(
-                    queue,
-                    AStarQueueItem(
-                        neighbor,
-                        new_cost_to,
-                        new_cost_to + dist(neighbor, end),
-                    ),
+                new_item = AStarQueueItem(
+                    neighbor,
+                    new_cost_to,
+                    new_cost_to + dist(map.coords(neighbor), end_pt),
                 )
+                heapq.heappush(queue, new_item)
+                stats.pushed += 1
+                stats.update_peak(queue, new_item)
 
     raise ValueError("no path found")
 
 
+def lowest_total_risk(map: Map, stats: Optional[SearchStats] = None) \
+        -> tuple[int, SearchStats]:
+    path, stats = a_star(0, len(map) - 1, map, stats)
+    return sum(map[i] for i in path) - map[0], stats
+
+
+def parse(lines: Iterable[str]) -> Map:
+    return Grid.from_lines(line.strip() for line in lines)
+
+
+def solve(map: Map) -> int:
+    risk, _ = lowest_total_risk(map)
+    return risk
+
+
 if __name__ == "__main__":
     input: "FileInput[str]" = FileInput()
-    map: Map = [[int(cell) for cell in line.strip()] for line in input]
-    size = len(map)  # maps are square
-    path = a_star((0, 0), (size-1, size-1), map, size)
-    result = sum(map[x][y] for x, y in path) - map[0][0]
-    print(result)
+    print(solve(parse(input)))
@@ -133,10 +133,16 @@ def consume_packet(stream: str, no_padding: bool = False) -> tuple[Packet, str]:
     return OperatorPacket(version, type_id, sub_packets), eat_padding(stream, no_padding)
 
 
+def parse(lines: Iterable[str]) -> Packet:
+    stream = to_binary_string(next(iter(lines)).strip())
+    packet, _ = consume_packet(stream)
+    return packet
+
+
+def solve(packet: Packet) -> int:
+    return packet.recursive_version_sum()
+
+
 if __name__ == "__main__":
     input: "FileInput[str]" = FileInput()
-    line = next(input).strip()
-    stream = to_binary_string(line)
-
-    packet, stream = consume_packet(stream)
-    print(packet.recursive_version_sum())
+    print(solve(parse(input)))
@@ -1,6 +1,6 @@
 from fileinput import FileInput
 
-from day16a import consume_packet, to_binary_string
+from day16a import Packet, parse
 
 # There's no corresponding input/16-test, as there are multiuple different examples provided.
 # Testing is done via `echo HEX_PACKET | python src/day16b.py`.
@@ -8,10 +8,11 @@ from day16a import consume_packet, to_binary_string
 # The implementation is actually included in the day16a.py file
 # It's much easier to implement the evaluation as methods on Packets.
 
+
+def solve(packet: Packet) -> int:
+    return packet.eval()
+
+
 if __name__ == "__main__":
     input: "FileInput[str]" = FileInput()
-    line = next(input).strip()
-    stream = to_binary_string(line)
-
-    packet, stream = consume_packet(stream)
-    print(packet.eval())
+    print(solve(parse(input)))
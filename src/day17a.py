@@ -1,7 +1,10 @@
-import re
 from enum import Enum, auto
 from fileinput import FileInput
-from typing import NamedTuple
+from functools import partial
+from typing import Iterable, NamedTuple
+
+from core import extract_ints
+from parallel import parallel_map
 
 Point = tuple[int, int]
 Points = list[Point]
@@ -27,14 +30,9 @@ class BLTR(NamedTuple):
 
     @classmethod
     def from_input(cls, line: str) -> "BLTR":
-        m = re.match(r"target area: x=(-?\d+)\.\.(-?\d+), y=(-?\d+)\.\.(-?\d+)", line)
-        assert m
-        return cls(
-            bottom=int(m[3]),
-            left=int(m[1]),
-            top=int(m[4]),
-            right=int(m[2]),
-        )
+        # target area: x=left..right, y=bottom..top
+        left, right, bottom, top = extract_ints(line)
+        return cls(bottom=bottom, left=left, top=top, right=right)
 
     def contains(self, x: int, y: int) -> bool:
         return self.left <= x <= self.right and self.bottom <= y <= self.top
@@ -75,24 +73,35 @@ def shoot(vel_x: int, vel_y: int, target: BLTR) -> tuple[ShotResult, Points]:
             return ShotResult.UNDERSHOT, steps
 
 
-def brute_force_max_y(target: BLTR) -> int:
+def max_y_for_vel_x(target: BLTR, vel_x: int) -> int:
     max_y = -1
 
-    for vel_x in range(1, target.left//2):
-        for vel_y in range(500):
-            result, steps = shoot(vel_x, vel_y, target)
-            this_max_y = max(y for (_, y) in steps)
+    for vel_y in range(500):
+        result, steps = shoot(vel_x, vel_y, target)
+        this_max_y = max(y for (_, y) in steps)
 
-            if result == ShotResult.WITHIN and this_max_y >= max_y:
-                max_y = this_max_y
+        if result == ShotResult.WITHIN and this_max_y >= max_y:
+            max_y = this_max_y
 
-            elif result == ShotResult.OVERSHOT:
-                break
+        elif result == ShotResult.OVERSHOT:
+            break
 
     return max_y
 
 
+def brute_force_max_y(target: BLTR) -> int:
+    # Every vel_x is independent of the others, so they're tried in parallel
+    return max(parallel_map(partial(max_y_for_vel_x, target), range(1, target.left//2)),
+               default=-1)
+
+
+def parse(lines: Iterable[str]) -> BLTR:
+    return BLTR.from_input(next(iter(lines)).strip())
+
+
+def solve(target: BLTR) -> int:
+    return brute_force_max_y(target)
+
+
 if __name__ == "__main__":
-    target = BLTR.from_input(next(FileInput()).strip())
-    result = brute_force_max_y(target)
-    print(result)
+    print(solve(parse(FileInput())))
@@ -1,24 +1,32 @@
 from fileinput import FileInput
+from functools import partial
 
-from day17a import BLTR, ShotResult, shoot
+from day17a import BLTR, ShotResult, parse, shoot
+from parallel import parallel_map
 
 
-def brute_force_all(target: BLTR) -> int:
+def count_for_vel_x(target: BLTR, vel_x: int) -> int:
     count = 0
 
-    for vel_x in range(1, target.right+1):
-        for vel_y in range(-100, 500):
-            result, _ = shoot(vel_x, vel_y, target)
+    for vel_y in range(-100, 500):
+        result, _ = shoot(vel_x, vel_y, target)
 
-            if result == ShotResult.WITHIN:
-                count += 1
+        if result == ShotResult.WITHIN:
+            count += 1
 
-            elif result == ShotResult.OVERSHOT:
-                break
+        elif result == ShotResult.OVERSHOT:
+            break
 
     return count
 
 
+def brute_force_all(target: BLTR) -> int:
+    return sum(parallel_map(partial(count_for_vel_x, target), range(1, target.right+1)))
+
+
+def solve(target: BLTR) -> int:
+    return brute_force_all(target)
+
+
 if __name__ == "__main__":
-    target = BLTR.from_input(next(FileInput()).strip())
-    print(brute_force_all(target))
+    print(solve(parse(FileInput())))
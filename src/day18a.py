@@ -1,7 +1,7 @@
 import re
 from dataclasses import dataclass
 from fileinput import FileInput
-from typing import Optional, Union
+from typing import Iterable, Optional, Union
 
 SN = Union["SNLeaf", "SNNode"]
 
@@ -170,17 +170,29 @@ class SNNode:
             did_something = self.explode() or self.split()
 
 
-if __name__ == "__main__":
-    input: "FileInput[str]" = FileInput()
+def sn_node_from_str(t: str) -> SNNode:
+    nd, _ = SNNode.from_str(t)
+    assert isinstance(nd, SNNode)
+    return nd
+
+
+def parse(lines: Iterable[str]) -> list[SNNode]:
+    return [sn_node_from_str(line.strip()) for line in lines]
+
+
+def solve(numbers: list[SNNode]) -> int:
     result: Optional[SNNode] = None
 
-    for line in input:
-        nd, _ = SNNode.from_str(line.strip())
+    for nd in numbers:
         if result is None:
-            assert isinstance(nd, SNNode)
             result = nd
         else:
             result = result.add(nd)
 
     assert result
-    print(result.magnitude())
+    return result.magnitude()
+
+
+if __name__ == "__main__":
+    input: "FileInput[str]" = FileInput()
+    print(solve(parse(input)))
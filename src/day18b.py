@@ -1,24 +1,22 @@
 from fileinput import FileInput
+from functools import partial
 from itertools import permutations
 
-from day18a import SNNode
+from day18a import SNNode, parse
+from parallel import parallel_map
 
 
-def sn_node_from_str(t: str) -> SNNode:
-    nd, _ = SNNode.from_str(t)
-    assert isinstance(nd, SNNode)
-    return nd
+def magnitude_of_sum(all_numbers: list[SNNode], pair: tuple[int, int]) -> int:
+    left, right = pair
+    return all_numbers[left].add(all_numbers[right]).magnitude()
 
 
-if __name__ == "__main__":
-    input: "FileInput[str]" = FileInput()
-    all_numbers: list[SNNode] = [sn_node_from_str(i.strip()) for i in input]
-    max_magnitude: int = -1
+def solve(all_numbers: list[SNNode]) -> int:
+    # Pairs are sent to the workers as indexes, the numbers only once per chunk
+    pairs = list(permutations(range(len(all_numbers)), 2))
+    return max(parallel_map(partial(magnitude_of_sum, all_numbers), pairs), default=-1)
 
-    for left, right in permutations(all_numbers, 2):
-        result = left.add(right)
-        res_magnitude = result.magnitude()
-        if res_magnitude > max_magnitude:
-            max_magnitude = res_magnitude
 
-    print(max_magnitude)
+if __name__ == "__main__":
+    input: "FileInput[str]" = FileInput()
+    print(solve(parse(input)))
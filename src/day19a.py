@@ -1,4 +1,3 @@
-import re
 import sys
 from collections import Counter
 from dataclasses import dataclass
@@ -6,7 +5,9 @@ from fileinput import FileInput
 from itertools import product
 from typing import Iterable, NamedTuple, Optional
 
-from core import empty_str, split_on
+from checkpoint import checkpoint
+from core import empty_str, extract_ints, grouped, isplit_on
+from parallel import first_match
 
 
 def sgn(x: int) -> int:
@@ -77,15 +78,11 @@ class Scanner:
     position: Optional[Vec3D] = None
 
     @classmethod
-    def from_lines(cls, lines: Iterable[str]) -> "Scanner":
-        i = iter(lines)
-        header_match = re.match(r"^--- scanner (\d+) ---$", next(i))
-        assert header_match
-
-        self = cls(int(header_match[1]), set(), Vec3D(0, 0, 0) if header_match[1] == "0" else None)
-        for line in i:
-            self.beacons.add(Vec3D(*map(int, line.split(","))))
-        return self
+    def from_text(cls, text: str) -> "Scanner":
+        # --- scanner ID ---, followed by x,y,z of every beacon
+        id, *coordinates = extract_ints(text)
+        beacons = {Vec3D(*i) for i in grouped(coordinates, 3)}
+        return cls(id, beacons, Vec3D(0, 0, 0) if id == 0 else None)
 
     def flip(self, flip_axis: int) -> "Scanner":
         return Scanner(
@@ -129,48 +126,82 @@ class Scanner:
 
 def load_scanners(input: Iterable[str]) -> tuple[dict[int, Scanner], dict[int, Scanner]]:
     scanners: dict[int, Scanner] = {}
-    for lines in split_on((i.strip() for i in input), empty_str):
-        scanner = Scanner.from_lines(lines)
+    for lines in isplit_on((i.strip() for i in input), empty_str):
+        scanner = Scanner.from_text("\n".join(lines))
         scanners[scanner.id] = scanner
 
     matched_scanners: dict[int, Scanner] = {0: scanners.pop(0)}
     return matched_scanners, scanners
 
 
+def add_match(matched: dict[int, Scanner], unmatched: dict[int, Scanner],
+              transformed: Scanner) -> None:
+    unmatched.pop(transformed.id)
+    matched[transformed.id] = transformed
+    print(
+        f"Matched {transformed.id} ({len(matched) / (len(unmatched)+len(matched)):.2%})",
+        file=sys.stderr,
+    )
+
+
 def match_for(matched: dict[int, Scanner], unmatched: dict[int, Scanner],
               find_for: Scanner) -> bool:
     for try_match in matched.values():
         find_for_transformed = try_match.find_match_by_transforming(find_for)
 
         if find_for_transformed:
-            unmatched.pop(find_for.id)
-            matched[find_for.id] = find_for_transformed
-            print(
-                f"Matched {find_for.id} ({len(matched) / (len(unmatched)+len(matched)):.2%})",
-                file=sys.stderr,
-            )
+            add_match(matched, unmatched, find_for_transformed)
             return True
     return False
 
 
+def match_pair(pair: tuple[Scanner, Scanner]) -> Optional[Scanner]:
+    try_match, find_for = pair
+    return try_match.find_match_by_transforming(find_for)
+
+
 def match_next(matched: dict[int, Scanner], unmatched: dict[int, Scanner]) -> None:
-    for find_for in unmatched.values():
-        if match_for(matched, unmatched, find_for):
-            return
+    # All pairs are independent, so they're tried in parallel - picking the first match
+    # in the same order as trying them one by one would
+    pairs = [(try_match, find_for) for find_for in unmatched.values()
+             for try_match in matched.values()]
+    find_for_transformed = first_match(match_pair, pairs, chunk_size=1)
 
-    raise ValueError("no more matches")
+    if find_for_transformed is None:
+        raise ValueError("no more matches")
+    add_match(matched, unmatched, find_for_transformed)
 
 
-if __name__ == "__main__":
-    input: "FileInput[str]" = FileInput()
-    matched, unmatched = load_scanners(input)
+Scanners = tuple[dict[int, Scanner], dict[int, Scanner]]  # matched, unmatched
+
+
+def parse(lines: Iterable[str]) -> Scanners:
+    return load_scanners(lines)
+
+
+def solve(scanners: Scanners) -> int:
+    matched, unmatched = scanners
+
+    # Matching takes minutes, so progress is saved as scanners are matched
+    progress = checkpoint("day19a", matched, unmatched)
+    saved = progress.load()
+    if saved is not None:
+        matched, unmatched = saved
 
     while unmatched:
         match_next(matched, unmatched)
+        progress.save((matched, unmatched))
+
+    progress.clear()
 
     all_bacons: set[BeaconAbsolute] = set()
 
     for scanner in matched.values():
         all_bacons.update(scanner.beacons_absolute())
 
-    print(len(all_bacons))
+    return len(all_bacons)
+
+
+if __name__ == "__main__":
+    input: "FileInput[str]" = FileInput()
+    print(solve(parse(input)))
@@ -1,7 +1,7 @@
 from fileinput import FileInput
 from itertools import combinations
 
-from day19a import load_scanners, match_for
+from day19a import Scanners, match_for, match_next, parse
 
 # See stderr output from part A - this is a hint which Scanner to match next.
 # Otherwise we have to wait for the brute-force to complete.
@@ -16,12 +16,16 @@ MATCH_ORDER = [
 ]
 
 
-if __name__ == "__main__":
-    input: "FileInput[str]" = FileInput()
-    matched, unmatched = load_scanners(input)
+def solve(scanners: Scanners) -> int:
+    matched, unmatched = scanners
 
-    for match_id in MATCH_ORDER:
-        match_for(matched, unmatched, unmatched[match_id])
+    if unmatched.keys() == set(MATCH_ORDER):
+        for match_id in MATCH_ORDER:
+            match_for(matched, unmatched, unmatched[match_id])
+    else:
+        # The hint is for another input (like a generated one), so match as part A does
+        while unmatched:
+            match_next(matched, unmatched)
 
     assert not unmatched
 
@@ -34,4 +38,9 @@ if __name__ == "__main__":
         if dist > max_dist:
             max_dist = dist
 
-    print(max_dist)
+    return max_dist
+
+
+if __name__ == "__main__":
+    input: "FileInput[str]" = FileInput()
+    print(solve(parse(input)))
@@ -1,119 +1,109 @@
 from dataclasses import dataclass
 from fileinput import FileInput
-from typing import Iterable, Literal, NamedTuple
+from typing import Any, Iterable, Literal
 
-from core import empty_str, split_on
+from core import Grid, empty_str, numpy_backend, split_on
 
-Point = tuple[int, int]
-Enhancer = dict[int, Literal[0, 1]]
+# enhancer[i] is the new value of a pixel, whose 3x3 neighbourhood
+# (read row by row, "#" being 1) encodes i
+Enhancer = bytes
 
-NEIGHBOR_OFFSETS: list[Point] = [
-    (-1, -1), (0, -1), (1, -1),
-    (-1,  0), (0,  0), (1,  0),
-    (-1,  1), (0,  1), (1,  1),
-]
-
-
-class BLTR(NamedTuple):
-    """Bounds, aka. Bottom, Left, Top, Right"""
-    b: int
-    l: int
-    t: int
-    r: int
-
-    def within(self, x: int, y: int) -> bool:
-        return self.b <= y <= self.t and self.l <= x <= self.r  # noqa: E741
+PIXELS = bytes.maketrans(b".#", b"\0\1")
 
 
 @dataclass
 class Image:
-    white_pixels: set[Point]
+    """An infinite image - pixels outside of the grid all have the background value"""
+    pixels: Grid
     enhancer: Enhancer
     background: Literal[0, 1] = 0
 
-    def bounds(self) -> BLTR:
-        min_x, max_x = 0, 0
-        min_y, max_y = 0, 0
-
-        for x, y in self.white_pixels:
-            min_x = min(x, min_x)
-            max_x = max(x, max_x)
-            min_y = min(y, min_y)
-            max_y = max(y, max_y)
-
-        return BLTR(min_y, min_x, max_y, max_x)
-
-    def encode_neighbors(self, x: int, y: int, original_bounds: BLTR) -> int:
-        encoded: int = 0
-
-        for dx, dy in NEIGHBOR_OFFSETS:
-            nx, ny = x + dx, y + dy
-            encoded <<= 1
-
-            if self.background and not original_bounds.within(nx, ny):
-                encoded |= 1
-
-            elif (nx, ny) in self.white_pixels:
-                encoded |= 1
-
-        return encoded
-
     def enhanced(self) -> "Image":
-        new_whites: set[Point] = set()
-        bounds = self.bounds()
+        np = numpy_backend(len(self.pixels))
+        if np is not None:
+            return self.enhanced_numpy(np)
+
+        # Only the pixels next to the grid can change differently from the background,
+        # so the enhanced image grows by 1 pixel in every direction.
+        src = list(self.pixels.padded(2, self.background).rows())
+        enhancer = self.enhancer
+        pixels = bytearray()
+
+        for top, middle, bottom in zip(src, src[1:], src[2:]):
+            # Every row of the 3x3 neighbourhood, as a 3-bit number
+            t = top[0] << 1 | top[1]
+            m = middle[0] << 1 | middle[1]
+            b = bottom[0] << 1 | bottom[1]
+
+            for p, q, r in zip(top[2:], middle[2:], bottom[2:]):
+                t = (t << 1 | p) & 0b111
+                m = (m << 1 | q) & 0b111
+                b = (b << 1 | r) & 0b111
+                pixels.append(enhancer[t << 6 | m << 3 | b])
+
+        dst = Grid(self.pixels.width + 2, self.pixels.height + 2, pixels)
+        return Image(
+            dst,
+            self.enhancer,
+            self.enhancer[0b111_111_111 if self.background else 0],  # type: ignore
+        )
+
+    def enhanced_numpy(self, np: Any) -> "Image":
+        """Like enhanced, computing the enhancer indexes of all pixels at once"""
+        src = np.pad(self.pixels.array(), 2, constant_values=self.background).astype(np.uint16)
+        height, width = src.shape
+        indexes = np.zeros((height - 2, width - 2), dtype=np.uint16)
 
-        for y in range(bounds.b-1, bounds.t+2):
-            for x in range(bounds.l-1, bounds.r+2):
-                encoded = self.encode_neighbors(x, y, bounds)
-                if self.enhancer[encoded]:
-                    new_whites.add((x, y))
+        # Shift in the 3x3 neighbourhood, row by row
+        for dy in range(3):
+            for dx in range(3):
+                indexes <<= 1
+                indexes |= src[dy:dy + height - 2, dx:dx + width - 2]
 
+        enhancer = np.frombuffer(self.enhancer, dtype=np.uint8)
+        dst = Grid(width - 2, height - 2, bytearray(enhancer[indexes].tobytes()))
         return Image(
-            new_whites,
+            dst,
             self.enhancer,
-            self.background ^ self.enhancer[0]  # type: ignore | this xor can only return 0 or 1
+            self.enhancer[0b111_111_111 if self.background else 0],  # type: ignore
         )
 
-    def show_img(self) -> None:
-        bounds = self.bounds()
+    def white_pixels(self) -> int:
+        if self.background:
+            raise ValueError("infinitely many white pixels")
+        return self.pixels.cells.count(1)
 
-        for y in range(bounds.b, bounds.t+1):
-            for x in range(bounds.l, bounds.r+1):
-                print("#" if (x, y) in self.white_pixels else ".", end="")
-            print("\n", end="")
-        print("\n", end="")
+    def show_img(self) -> None:
+        for row in self.pixels.rows():
+            print("".join("#" if pixel else "." for pixel in row))
+        print()
 
 
 def load_enhancer(line: str) -> Enhancer:
-    enhancer: Enhancer = {}
-    for i, c in enumerate(line):
-        enhancer[i] = 0 if c == "." else 1
-    return enhancer
-
+    return line.encode("ascii").translate(PIXELS)
 
-def load_white_pixels(lines: Iterable[str]) -> set[Point]:
-    white_pixels: set[Point] = set()
 
-    for y, row in enumerate(lines):
-        for x, c in enumerate(row):
-            if c == "#":
-                white_pixels.add((x, y))
+def load_pixels(lines: Iterable[str]) -> Grid:
+    return Grid.from_lines(lines, PIXELS)
 
-    return white_pixels
 
-
-def main(rounds: int) -> None:
-    input: "FileInput[str]" = FileInput()
-    header, img = split_on((i.strip() for i in input), empty_str)
+def parse(lines: Iterable[str]) -> Image:
+    header, img = split_on((i.strip() for i in lines), empty_str)
     assert len(header) == 1
+    return Image(load_pixels(img), load_enhancer(header[0]))
 
-    img = Image(load_white_pixels(img), load_enhancer(header[0]))
 
+def count_after_enhancing(img: Image, rounds: int) -> int:
     for i in range(rounds):
         img = img.enhanced()
 
-    print(len(img.white_pixels))
+    return img.white_pixels()
+
+
+def solve(img: Image) -> int:
+    return count_after_enhancing(img, 2)
 
 
 if __name__ == "__main__":
-    main(2)
+    input: "FileInput[str]" = FileInput()
+    print(solve(parse(input)))
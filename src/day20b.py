@@ -1,4 +1,12 @@
-from day20a import main
+from fileinput import FileInput
+
+from day20a import Image, count_after_enhancing, parse
+
+
+def solve(img: Image) -> int:
+    return count_after_enhancing(img, 50)
+
 
 if __name__ == "__main__":
-    main(50)
+    input: "FileInput[str]" = FileInput()
+    print(solve(parse(input)))
@@ -52,9 +52,12 @@ def parse_player_positions(input: Iterable[str]) -> tuple[int, int]:
     return p1_pos, p2_pos
 
 
-if __name__ == "__main__":
-    p1_start_pos, p2_start_pos = parse_player_positions(FileInput())
+def parse(lines: Iterable[str]) -> tuple[int, int]:
+    return parse_player_positions(lines)
+
 
+def solve(start_positions: tuple[int, int]) -> int:
+    p1_start_pos, p2_start_pos = start_positions
     p: Optional[Player] = None
 
     dice = DeterministicDice(100)
@@ -68,4 +71,8 @@ if __name__ == "__main__":
 
     assert p is not None
     lost = p1 if p is p2 else p2
-    print(lost.score * dice.roll_count)
+    return lost.score * dice.roll_count
+
+
+if __name__ == "__main__":
+    print(solve(parse(FileInput())))
@@ -1,7 +1,9 @@
 from fileinput import FileInput
-from functools import lru_cache
+from typing import Optional
 
-from day21a import parse_player_positions
+from core import SearchStats
+from memo import memo_path, memoize
+from day21a import parse
 
 BOARD_SIZE = 10
 WON_TRESHOLD = 21
@@ -25,7 +27,8 @@ def player_moved(p: Player, advance: int) -> Player:
     return new_pos, p[1] + new_pos + 1
 
 
-@lru_cache(maxsize=128 * 1024)
+@memoize(maxsize=128 * 1024, persist=memo_path("day21b.DFS"),
+         version=f"{BOARD_SIZE},{WON_TRESHOLD}")
 def DFS(turn: int, p1: Player, p2: Player) -> tuple[int, int]:
     current_p = p1 if turn == 0 else p2
     previous_p = p2 if turn == 0 else p1
@@ -51,11 +54,32 @@ def DFS(turn: int, p1: Player, p2: Player) -> tuple[int, int]:
     return p1_won_total, p2_won_total
 
 
-if __name__ == "__main__":
-    p1_start_pos, p2_start_pos = parse_player_positions(FileInput())
+def count_wins(start_positions: tuple[int, int], stats: Optional[SearchStats] = None) \
+        -> tuple[tuple[int, int], SearchStats]:
+    """Returns the number of universes in which each of the players wins"""
+    if stats is None:
+        stats = SearchStats()
+
+    p1_start_pos, p2_start_pos = start_positions
 
     p1: Player = p1_start_pos - 1, 0
     p2: Player = p2_start_pos - 1, 0
 
+    before = DFS.cache_info()
     p1_won, p2_won = DFS(0, p1, p2)
-    print(max(p1_won, p2_won))
+    after = DFS.cache_info()
+
+    stats.cache_hits += after.hits - before.hits
+    stats.cache_misses += after.misses - before.misses
+    stats.report("day21b.DFS")
+
+    return (p1_won, p2_won), stats
+
+
+def solve(start_positions: tuple[int, int]) -> int:
+    wins, _ = count_wins(start_positions)
+    return max(wins)
+
+
+if __name__ == "__main__":
+    print(solve(parse(FileInput())))
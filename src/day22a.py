@@ -1,47 +1,65 @@
+import re
 from fileinput import FileInput
 from itertools import product
-from typing import Iterable
+from typing import Iterable, NamedTuple
+
+from core import extract_ints, grouped
 
 Point = tuple[int, int, int]
+Bounds = tuple[int, ...]  # x_min, x_max, y_min, y_max, z_min, z_max (inclusive)
+
+
+class Step(NamedTuple):
+    on: bool
+    bounds: Bounds
+
 
 LEFT_LIMIT = -50
 RIGHT_LIMIT = 50
 
 
-def parse_range(r: str) -> range:
-    left, _, right = r.partition("..")
-    return range(
-        max(int(left), LEFT_LIMIT),
-        min(int(right), RIGHT_LIMIT) + 1
-    )
+def limited_range(left: int, right: int) -> range:
+    return range(max(left, LEFT_LIMIT), min(right, RIGHT_LIMIT) + 1)
 
 
-def points_of_line(line: str) -> Iterable[Point]:
-    x_str, y_str, z_str = line.split(",")
-    xs = parse_range(x_str[2:])
-    ys = parse_range(y_str[2:])
-    zs = parse_range(z_str[2:])
-    yield from product(xs, ys, zs)
+def points_of_step(bounds: Bounds) -> Iterable[Point]:
+    x_min, x_max, y_min, y_max, z_min, z_max = bounds
+    yield from product(limited_range(x_min, x_max), limited_range(y_min, y_max),
+                       limited_range(z_min, z_max))
 
 
-def process_line(reactor: set[Point], line: str) -> None:
-    status, _, points_str = line.partition(" ")
-    points = points_of_line(points_str)
+def process_step(reactor: set[Point], step: Step) -> None:
+    points = points_of_step(step.bounds)
 
-    if status == "on":
+    if step.on:
         reactor.update(points)
-    elif status == "off":
-        reactor.difference_update(points)
     else:
-        raise ValueError(f"unknown status: {status!r} ({line!r})")
+        reactor.difference_update(points)
 
 
-if __name__ == "__main__":
-    input: "FileInput[str]" = FileInput()
-    lines = filter(None, (i.strip() for i in input))
+def parse(lines: Iterable[str]) -> list[Step]:
+    text = "".join(lines)
+    statuses = re.findall(r"^\s*(\S+)", text, re.MULTILINE)
+    for status in statuses:
+        if status not in ("on", "off"):
+            raise ValueError(f"unknown status: {status!r}")
+
+    bounds = list(grouped(extract_ints(text), 6))
+    if len(bounds) != len(statuses):
+        raise ValueError(f"expected 6 numbers on each of {len(statuses)} lines")
+
+    return [Step(status == "on", i) for status, i in zip(statuses, bounds)]
+
+
+def solve(steps: list[Step]) -> int:
     reactor: set[Point] = set()
 
-    for line in lines:
-        process_line(reactor, line.strip())
+    for step in steps:
+        process_step(reactor, step)
 
-    print(len(reactor))
+    return len(reactor)
+
+
+if __name__ == "__main__":
+    input: "FileInput[str]" = FileInput()
+    print(solve(parse(input)))
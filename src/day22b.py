@@ -1,14 +1,12 @@
 import sys
 from fileinput import FileInput
-from itertools import combinations
-from typing import NamedTuple
-
-# This is a stupid solution, it takes 10 minutes to run
+from itertools import chain, combinations
+from typing import Any, NamedTuple
 
+from checkpoint import checkpoint
+from day22a import Step, parse
 
-def parse_range(r: str) -> frozenset[int]:
-    left, _, right = r.partition("..")
-    return frozenset(range(int(left), int(right)+1))
+# This is a stupid solution, it takes 10 minutes to run
 
 
 def ensure_continuity(r: frozenset[int]) -> tuple[frozenset[int], frozenset[int]]:
@@ -35,18 +33,43 @@ def ensure_continuity(r: frozenset[int]) -> tuple[frozenset[int], frozenset[int]
     return frozenset(before), frozenset(after)
 
 
+def runs(r: frozenset[int]) -> list[tuple[int, int]]:
+    """Returns the (first, last) ints of every continuous run in the set"""
+    if r and max(r) - min(r) + 1 == len(r):
+        return [(min(r), max(r))]
+
+    result: list[tuple[int, int]] = []
+    for i in sorted(r):
+        if result and result[-1][1] == i - 1:
+            result[-1] = (result[-1][0], i)
+        else:
+            result.append((i, i))
+    return result
+
+
+def from_runs(r: list[tuple[int, int]]) -> frozenset[int]:
+    return frozenset(chain.from_iterable(range(first, last + 1) for first, last in r))
+
+
 class Cube(NamedTuple):
     xs: frozenset[int]
     ys: frozenset[int]
     zs: frozenset[int]
 
     @classmethod
-    def from_str(cls, cube_str: str) -> "Cube":
-        x_str, y_str, z_str = cube_str.split(",")
-        xs = parse_range(x_str[2:])
-        ys = parse_range(y_str[2:])
-        zs = parse_range(z_str[2:])
-        return cls(xs, ys, zs)
+    def from_step(cls, step: Step) -> "Cube":
+        x_min, x_max, y_min, y_max, z_min, z_max = step.bounds
+        return cls(frozenset(range(x_min, x_max + 1)), frozenset(range(y_min, y_max + 1)),
+                   frozenset(range(z_min, z_max + 1)))
+
+    @classmethod
+    def from_runs(cls, xs: list[tuple[int, int]], ys: list[tuple[int, int]],
+                  zs: list[tuple[int, int]]) -> "Cube":
+        return cls(from_runs(xs), from_runs(ys), from_runs(zs))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Checkpoints store the ranges of coordinates, rather than all of them
+        return Cube.from_runs, (runs(self.xs), runs(self.ys), runs(self.zs))
 
     def __len__(self) -> int:
         return len(self.xs) * len(self.ys) * len(self.zs)
@@ -106,16 +129,13 @@ def reactor_off(r: set[Cube], rem: Cube) -> set[Cube]:
     return new
 
 
-def process_line(r: set[Cube], line: str) -> set[Cube]:
-    status, _, cube_str = line.partition(" ")
-    cube = Cube.from_str(cube_str)
+def process_step(r: set[Cube], step: Step) -> set[Cube]:
+    cube = Cube.from_step(step)
 
-    if status == "on":
+    if step.on:
         return reactor_on(r, cube)
-    elif status == "off":
-        return reactor_off(r, cube)
     else:
-        raise ValueError(f"unknown status: {status!r} ({line!r})")
+        return reactor_off(r, cube)
 
 
 def assert_no_overlaps(r: set[Cube]) -> None:
@@ -123,14 +143,26 @@ def assert_no_overlaps(r: set[Cube]) -> None:
         assert not a.intersects(b)
 
 
-if __name__ == "__main__":
-    input: "FileInput[str]" = FileInput()
-    lines = filter(None, (i.strip() for i in input))
+def solve(steps: list[Step]) -> int:
     reactor: set[Cube] = set()
+    done = 0
+
+    progress = checkpoint("day22b", steps)
+    saved = progress.load()
+    if saved is not None:
+        reactor, done = saved
 
-    for idx, line in enumerate(lines):
-        print(idx, repr(line), file=sys.stderr)
-        reactor = process_line(reactor, line.strip())
+    for idx, step in enumerate(steps[done:], done):
+        print(idx, step, file=sys.stderr)
+        reactor = process_step(reactor, step)
         # assert_no_overlaps(reactor)
+        progress.save((reactor, idx + 1))
 
-    print(sum(len(c) for c in reactor))
+    progress.clear()
+
+    return sum(len(c) for c in reactor)
+
+
+if __name__ == "__main__":
+    input: "FileInput[str]" = FileInput()
+    print(solve(parse(input)))
@@ -5,6 +5,8 @@ from fileinput import FileInput
 from math import inf
 from typing import Iterable, NamedTuple, Optional
 
+from core import SearchStats
+
 
 HALLWAY_LENGTH = 7
 ROOMS = 4
@@ -90,16 +92,20 @@ class Burrow(NamedTuple):
             tuple(tuple(room) for room in self.rooms)
         ))
 
+    @property
+    def room_size(self) -> int:
+        return len(self.rooms[0])
+
     @classmethod
-    def from_input(cls, lines: Iterable[str]) -> "Burrow":
+    def from_input(cls, lines: Iterable[str], room_size: int = ROOM_SIZE) -> "Burrow":
         iterator = iter(lines)
         next(iterator)  # Ignore the top border
         next(iterator)  # Ignore the hallway, as it's initially empty
 
         hallway: list[Spot] = [Spot.Empty] * HALLWAY_LENGTH
-        rooms: list[list[Spot]] = [[Spot.Empty] * ROOM_SIZE for _ in range(ROOMS)]
+        rooms: list[list[Spot]] = [[Spot.Empty] * room_size for _ in range(ROOMS)]
 
-        for room_spot in range(ROOM_SIZE-1, -1, -1):
+        for room_spot in range(room_size-1, -1, -1):
             line = next(iterator)
 
             for room_idx in range(ROOMS):
@@ -125,10 +131,10 @@ class Burrow(NamedTuple):
         rows.append("#" + self._hallway_str() + "#")
 
         # Add the rooms
-        for i in range(ROOM_SIZE-1, -1, -1):
+        for i in range(self.room_size-1, -1, -1):
             room = "#".join(str(self.rooms[j][i]) for j in range(ROOMS))
 
-            if i == ROOM_SIZE-1:
+            if i == self.room_size-1:
                 rows.append("###" + room + "###")
             else:
                 rows.append("  #" + room + "#  ")
@@ -190,7 +196,7 @@ class State:
 
     def is_end(self) -> bool:
         for room_idx in range(ROOMS):
-            for room_spot in range(ROOM_SIZE):
+            for room_spot in range(self.burrow.room_size):
                 if self.burrow.rooms[room_idx][room_spot] != room_idx:
                     return False
 
@@ -217,7 +223,7 @@ class State:
 
         Returns None if the move can't be performed, and a room_spot_idx otherwise.
         """
-        for room_spot_idx in range(ROOM_SIZE):
+        for room_spot_idx in range(self.burrow.room_size):
             occupant = self.burrow.rooms[room_idx][room_spot_idx]
 
             if occupant == Spot.Empty:
@@ -245,17 +251,19 @@ class State:
             return None
 
         # Find the top item
-        for idx in range(ROOM_SIZE):
+        for idx in range(len(room)):
             if room[idx] == Spot.Empty:
                 return idx-1
 
-        return ROOM_SIZE - 1
+        return len(room) - 1
 
     def possible_moves(self) -> Iterable["State"]:
         """Generates all of the possible moves from the current state -
         first generating all moves **to** a room, and then by
         generating moves **from** all rooms.
         """
+        room_size = self.burrow.room_size
+
         # First check if someone from the hallway can move to its room
         for idx in range(HALLWAY_LENGTH):
             amphipod = self.burrow.hallway[idx]
@@ -266,7 +274,7 @@ class State:
                     and (insert_into_spot := self.can_move_into_room(amphipod)) is not None:
 
                 energy_delta = abs(unwrap_hallway_index(idx) - 2 * (amphipod + 1))
-                energy_delta += ROOM_SIZE - insert_into_spot
+                energy_delta += room_size - insert_into_spot
                 energy_delta *= amphipod.energy_multiplier()
 
                 yield State(
@@ -290,7 +298,7 @@ class State:
                     continue
 
                 energy_delta = abs(unwrap_hallway_index(hallway_idx) - 2 * (room_idx + 1))
-                energy_delta += ROOM_SIZE - from_spot
+                energy_delta += room_size - from_spot
                 energy_delta *= amphipod.energy_multiplier()
 
                 yield State(
@@ -299,7 +307,8 @@ class State:
                 )
 
 
-def find_cheapest(initial_state: State) -> State:
+def find_cheapest(initial_state: State, stats: Optional[SearchStats] = None) \
+        -> tuple[State, SearchStats]:
     """Uses Dijkstra's algorithm to find the least-energy
     solved state.
 
@@ -310,26 +319,43 @@ def find_cheapest(initial_state: State) -> State:
     it can be improved by switching to A*; or maybe it's possible to solve
     the task in an entirely different way...
     """
+    if stats is None:
+        stats = SearchStats()
+
     min_energies: dict[Burrow, float] = {initial_state.burrow: 0}
     queue: list[State] = [initial_state]
 
     while queue:
         state = heappop(queue)
+        stats.popped += 1
 
         if state.is_end():
-            return state
+            stats.report("day23a.find_cheapest")
+            return state, stats
+
+        # A cheaper way to get to this burrow was found after this state was queued
+        if state.energy > min_energies[state.burrow]:
+            stats.stale += 1
+            continue
 
         for new_state in state.possible_moves():
             if new_state.energy < min_energies.get(new_state.burrow, inf):
                 min_energies[new_state.burrow] = new_state.energy
                 heappush(queue, new_state)
+                stats.pushed += 1
+                stats.update_peak(queue, new_state)
 
     raise RuntimeError("no solution found")
 
 
-if __name__ == "__main__":
-    initial_burrow = Burrow.from_input(FileInput())
-    initial_state = State(initial_burrow)
+def parse(lines: Iterable[str]) -> State:
+    return State(Burrow.from_input(lines))
+
+
+def solve(initial_state: State) -> int:
+    cheapest, _ = find_cheapest(initial_state)
+    return cheapest.energy
 
-    cheapest_end_state = find_cheapest(initial_state)
-    print(cheapest_end_state.energy)
+
+if __name__ == "__main__":
+    print(solve(parse(FileInput())))
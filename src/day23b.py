@@ -1,13 +1,14 @@
 from fileinput import FileInput
+from typing import Iterable
 
-import day23a
+from day23a import Burrow, State, solve
 
+ROOM_SIZE = 4
 
-if __name__ == "__main__":
-    day23a.ROOM_SIZE = 4
 
-    initial_burrow = day23a.Burrow.from_input(FileInput())
-    initial_state = day23a.State(initial_burrow)
+def parse(lines: Iterable[str]) -> State:
+    return State(Burrow.from_input(lines, ROOM_SIZE))
+
 
-    cheapest_end_state = day23a.find_cheapest(initial_state)
-    print(cheapest_end_state.energy)
+if __name__ == "__main__":
+    print(solve(parse(FileInput())))
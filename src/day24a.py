@@ -1,4 +1,4 @@
-from typing import NamedTuple
+from typing import Iterable, NamedTuple
 
 # This is the simplified program; it performs only 2 operations:
 #
@@ -114,10 +114,23 @@ def op_pairs() -> list[OPPair]:
     return pairs
 
 
-if __name__ == "__main__":
-    digits = [-1] * 14
+def model_number(pairs: Iterable[OPPair], big_first: bool) -> str:
+    digits = [-1] * len(OPS)
+
+    for solve_pair in pairs:
+        solve_pair.solve_into(digits, big_first)
+
+    return "".join(map(str, digits))
+
 
-    for solve_pair in op_pairs():
-        solve_pair.solve_into(digits, True)
+def parse(lines: Iterable[str]) -> list[OPPair]:
+    # The MONAD program is already hardcoded as OPS, the input is not needed
+    return op_pairs()
 
-    print("".join(map(str, digits)))
+
+def solve(pairs: list[OPPair]) -> str:
+    return model_number(pairs, True)
+
+
+if __name__ == "__main__":
+    print(solve(parse([])))
@@ -1,9 +1,9 @@
-from day24a import op_pairs
+from day24a import OPPair, model_number, parse
 
-if __name__ == "__main__":
-    digits = [-1] * 14
 
-    for solve_pair in op_pairs():
-        solve_pair.solve_into(digits, False)
+def solve(pairs: list[OPPair]) -> str:
+    return model_number(pairs, False)
+
 
-    print("".join(map(str, digits)))
+if __name__ == "__main__":
+    print(solve(parse([])))
@@ -1,79 +1,80 @@
 from dataclasses import dataclass
 from fileinput import FileInput
-from typing import Iterable
+from typing import Any, Iterable
 
-Point = tuple[int, int]
+from core import Grid, numpy_backend
+
+EMPTY = 0
+EAST = 1
+SOUTH = 2
+
+CELLS = bytes.maketrans(b".>v", bytes((EMPTY, EAST, SOUTH)))
+
+# Directions the herds move in (see SeaFloor.move_herd)
+TO_EAST = 0
+TO_SOUTH = 1
 
 
 @dataclass
 class SeaFloor:
-    width: int
-    height: int
+    grid: Grid
+
+    @property
+    def width(self) -> int:
+        return self.grid.width
 
-    east_cucumbers: set[Point]
-    south_cucumbers: set[Point]
+    @property
+    def height(self) -> int:
+        return self.grid.height
 
     @classmethod
     def from_input(cls, lines: Iterable[str]) -> "SeaFloor":
-        self = cls(0, 0, set(), set())
-
-        for y, line in enumerate(lines):
-            # Update sea floor dimensions
-            self.height += 1
-            if self.width:
-                assert len(line) == self.width
-            else:
-                self.width = len(line)
-
-            # Add cucumbers
-            for x, c in enumerate(line):
-                match c:
-                    case ">":
-                        self.east_cucumbers.add((x, y))
-                    case "v":
-                        self.south_cucumbers.add((x, y))
-
-        return self
-
-    def move_east(self, cucumber: Point) -> tuple[Point, bool]:
-        moved: Point = (cucumber[0] + 1) % self.width, cucumber[1]
-
-        if moved in self.east_cucumbers or moved in self.south_cucumbers:
-            return cucumber, False
-        else:
-            return moved, True
-
-    def move_south(self, cucumber: Point) -> tuple[Point, bool]:
-        moved: Point = cucumber[0], (cucumber[1] + 1) % self.height
-
-        if moved in self.east_cucumbers or moved in self.south_cucumbers:
-            return cucumber, False
-        else:
-            return moved, True
+        # Cucumbers leaving the sea floor on one edge reappear on the opposite edge
+        return cls(Grid.from_lines(lines, CELLS, wrap=True))
+
+    def move_herd(self, herd: int, direction: int) -> int:
+        """Moves all cucumbers of a herd which can move in the given direction
+        (all at the same time); returns the number of cucumbers which moved.
+        """
+        np = numpy_backend(len(self.grid))
+        if np is not None:
+            return self.move_herd_numpy(herd, direction, np)
+
+        cells = self.grid.cells
+        moving: list[tuple[int, int]] = []  # from, to
+
+        # Cucumbers move by a fixed offset of their index, by a row or a column less
+        # when they wrap around the edge
+        offset, wrap = (1, self.width) if direction == TO_EAST else (self.width, len(cells))
+        i = cells.find(herd)
+        while i >= 0:
+            target = i + offset - wrap if i % wrap + offset >= wrap else i + offset
+            if cells[target] == EMPTY:
+                moving.append((i, target))
+            i = cells.find(herd, i + 1)
+
+        for i, target in moving:
+            cells[i] = EMPTY
+            cells[target] = herd
+
+        return len(moving)
+
+    def move_herd_numpy(self, herd: int, direction: int, np: Any) -> int:
+        cells = self.grid.array()
+        axis = 1 if direction == TO_EAST else 0
+
+        # np.roll wraps around the edges, like the cucumbers do
+        moving = (cells == herd) & (np.roll(cells, -1, axis) == EMPTY)
+        cells[moving] = EMPTY
+        cells[np.roll(moving, 1, axis)] = herd
+
+        return int(np.count_nonzero(moving))
 
     def move_all_east(self) -> int:
-        move_count: int = 0
-        new_east: set[Point] = set()
-
-        for cucumber in self.east_cucumbers:
-            new_cucumber, did_move = self.move_east(cucumber)
-            new_east.add(new_cucumber)
-            move_count += int(did_move)
-
-        self.east_cucumbers = new_east
-        return move_count
+        return self.move_herd(EAST, TO_EAST)
 
     def move_all_south(self) -> int:
-        move_count: int = 0
-        new_south: set[Point] = set()
-
-        for cucumber in self.south_cucumbers:
-            new_cucumber, did_move = self.move_south(cucumber)
-            new_south.add(new_cucumber)
-            move_count += int(did_move)
-
-        self.south_cucumbers = new_south
-        return move_count
+        return self.move_herd(SOUTH, TO_SOUTH)
 
     def move_all(self) -> int:
         count = self.move_all_east()
@@ -81,9 +82,16 @@ class SeaFloor:
         return count
 
 
-if __name__ == "__main__":
-    sea_floor = SeaFloor.from_input(i.strip() for i in FileInput())
+def parse(lines: Iterable[str]) -> SeaFloor:
+    return SeaFloor.from_input(i.strip() for i in lines)
+
+
+def solve(sea_floor: SeaFloor) -> int:
     moves = 1
     while sea_floor.move_all():
         moves += 1
-    print(moves)
+    return moves
+
+
+if __name__ == "__main__":
+    print(solve(parse(FileInput())))
@@ -0,0 +1,439 @@
+"""Generators of synthetic, but valid puzzle inputs of arbitrary size.
+
+The size of an input is the (approximate) number of items it contains - samples for day01,
+lines for day05, cells for the 2D map days (day15 with n=25_000_000 is a 5000x5000 map).
+
+Days with fixed-size inputs (like the 10x10 octopus grid of day11 or the burrow of day23)
+or inputs which don't have a meaningful size (day17, day21, day24) have no generators.
+Neither has day12: the number of paths through a cave system, which its solutions
+enumerate one by one, grows exponentially with the number of caves.
+
+Usage: python src/generators.py DAY SIZE [--seed SEED] > input.txt
+"""
+import argparse
+import random
+import sys
+from itertools import permutations
+from math import isqrt, prod
+from typing import Callable, Iterable, Iterator, TextIO
+
+Generator = Callable[[int, random.Random], Iterator[str]]
+
+
+def side_of(n: int) -> int:
+    """Side length of a square map with roughly n cells"""
+    return max(isqrt(n), 2)
+
+
+def day01(n: int, rng: random.Random) -> Iterator[str]:
+    depth = rng.randint(100, 200)
+    for _ in range(n):
+        depth = max(0, depth + rng.randint(-10, 20))
+        yield str(depth)
+
+
+def day02(n: int, rng: random.Random) -> Iterator[str]:
+    depth = 0  # depth in part 1, aim in part 2 - never above the surface
+    for _ in range(n):
+        direction = rng.choice(("forward", "forward", "down", "up"))
+        value = rng.randint(1, 9)
+
+        if direction == "up" and value > depth:
+            direction = "down"
+
+        if direction == "down":
+            depth += value
+        elif direction == "up":
+            depth -= value
+
+        yield f"{direction} {value}"
+
+
+def day03(n: int, rng: random.Random) -> Iterator[str]:
+    # Numbers need to be unique - otherwise day03b can't narrow them down to a single one
+    width = max(12, (2 * n).bit_length())
+    for number in rng.sample(range(1 << width), n):
+        yield f"{number:0{width}b}"
+
+
+def day04(n: int, rng: random.Random) -> Iterator[str]:
+    # Every board gets its own numbers, so that no two boards can win at the same time
+    numbers = list(range(25 * n))
+    rng.shuffle(numbers)
+    yield ",".join(map(str, numbers))
+
+    rng.shuffle(numbers)
+    for board_start in range(0, len(numbers), 25):
+        board = numbers[board_start:board_start+25]
+        yield ""
+        for row_start in range(0, 25, 5):
+            yield " ".join(f"{i:2}" for i in board[row_start:row_start+5])
+
+
+def _move_within(start: int, length: int, rng: random.Random, limit: int = 1000) -> int:
+    end = start + rng.choice((-length, length))
+    return end if 0 <= end < limit else 2 * start - end
+
+
+def day05(n: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(n):
+        x1, y1 = rng.randrange(1000), rng.randrange(1000)
+        length = rng.randint(1, 300)
+        match rng.randrange(3):
+            case 0:
+                x2, y2 = x1, _move_within(y1, length, rng)
+            case 1:
+                x2, y2 = _move_within(x1, length, rng), y1
+            case _:
+                x2, y2 = _move_within(x1, length, rng), _move_within(y1, length, rng)
+        yield f"{x1},{y1} -> {x2},{y2}"
+
+
+def day06(n: int, rng: random.Random) -> Iterator[str]:
+    yield ",".join(str(rng.randint(1, 5)) for _ in range(n))
+
+
+def day07(n: int, rng: random.Random) -> Iterator[str]:
+    yield ",".join(str(int(rng.expovariate(1 / 400))) for _ in range(n))
+
+
+SEGMENTS: list[str] = [
+    # cSpell: disable
+    "abcefg", "cf", "acdeg", "acdfg", "bcdf", "abdfg", "abdefg", "acf", "abcdefg", "abcdfg",
+    # cSpell: enable
+]
+
+
+def day08(n: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(n):
+        wiring = dict(zip("abcdefg", rng.sample("abcdefg", 7)))
+
+        def scrambled(digit: int) -> str:
+            return "".join(rng.sample([wiring[s] for s in SEGMENTS[digit]],
+                                      len(SEGMENTS[digit])))
+
+        inputs = [scrambled(digit) for digit in rng.sample(range(10), 10)]
+        outputs = [scrambled(rng.randrange(10)) for _ in range(4)]
+        yield " ".join(inputs) + " | " + " ".join(outputs)
+
+
+def _random_cuts(size: int, rng: random.Random) -> set[int]:
+    cuts: set[int] = set()
+    i = rng.randint(0, 8)
+    while i < size:
+        cuts.add(i)
+        i += rng.randint(3, 16)
+    return cuts
+
+
+def day09(n: int, rng: random.Random) -> Iterator[str]:
+    # The map is split by walls of 9s into rectangular basins. The height inside a basin
+    # grows with the distance from a random low point, so that each basin has exactly one.
+    side = side_of(n)
+    row_cuts = _random_cuts(side, rng)
+    col_cuts = _random_cuts(side, rng)
+
+    def low_points(cuts: set[int]) -> list[int]:
+        """Maps every index to the position of the low point in its section"""
+        low_points = [0] * side
+        bounds = sorted(cuts | {-1, side})
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            if end - start > 1:
+                low_points[start+1:end] = [rng.randint(start + 1, end - 1)] * (end - start - 1)
+        return low_points
+
+    low_in_row = low_points(row_cuts)
+    low_in_col = low_points(col_cuts)
+
+    for y in range(side):
+        yield "".join(
+            "9" if y in row_cuts or x in col_cuts
+            else str(min(abs(y - low_in_row[y]) + abs(x - low_in_col[x]), 8))
+            for x in range(side)
+        )
+
+
+BRACKETS: dict[str, str] = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+
+def _bracket_line(rng: random.Random, corrupted: bool) -> str:
+    line: list[str] = []
+    stack: list[str] = []
+
+    for _ in range(rng.randint(20, 110)):
+        if stack and rng.random() < 0.4:
+            line.append(BRACKETS[stack.pop()])
+        else:
+            stack.append(rng.choice("([{<"))
+            line.append(stack[-1])
+
+    if not stack:
+        stack.append(rng.choice("([{<"))
+        line.append(stack[-1])
+
+    if corrupted:
+        line.append(rng.choice([c for c in BRACKETS.values() if c != BRACKETS[stack[-1]]]))
+        line.extend(BRACKETS[c] for c in reversed(stack[:-1]))
+
+    return "".join(line)
+
+
+def day10(n: int, rng: random.Random) -> Iterator[str]:
+    # day10b takes the median of the incomplete lines, so there has to be an odd number of them
+    incomplete = (n // 2) | 1
+    kinds = [False] * incomplete + [True] * (n - incomplete)
+    rng.shuffle(kinds)
+    for corrupted in kinds:
+        yield _bracket_line(rng, corrupted)
+
+
+def day13(n: int, rng: random.Random) -> Iterator[str]:
+    # Points are generated on the final (folded) sheet, and then randomly "unfolded".
+    # This ensures no point ever lies on a fold line.
+    widths = [40]
+    heights = [6]
+    for _ in range(6):
+        widths.append(2 * widths[-1] + 1)
+        heights.append(2 * heights[-1] + 1)
+
+    folds = [(axis, along) for x, y in zip(reversed(widths[:-1]), reversed(heights[:-1]))
+             for axis, along in (("x", x), ("y", y))]
+
+    for _ in range(n):
+        x, y = rng.randrange(widths[0] - 1), rng.randrange(heights[0] - 1)
+        for axis, along in reversed(folds):
+            if rng.random() < 0.5:
+                if axis == "x":
+                    x = 2 * along - x
+                else:
+                    y = 2 * along - y
+        yield f"{x},{y}"
+
+    yield ""
+    for axis, along in folds:
+        yield f"fold along {axis}={along}"
+
+
+def day14(n: int, rng: random.Random) -> Iterator[str]:
+    elements = "BCFHKNOPSV"
+    yield "".join(rng.choice(elements) for _ in range(n))
+    yield ""
+    for a in elements:
+        for b in elements:
+            yield f"{a}{b} -> {rng.choice(elements)}"
+
+
+def day15(n: int, rng: random.Random) -> Iterator[str]:
+    side = side_of(n)
+    for _ in range(side):
+        yield "".join(rng.choice("123456789") for _ in range(side))
+
+
+def _packet_bits(n: int, rng: random.Random, out: list[str]) -> None:
+    """Appends bits of a random packet with n literal packets inside to out"""
+    version = f"{rng.randrange(8):03b}"
+
+    if n == 1:
+        out.append(version + "100")
+        value = f"{rng.randrange(1 << 16):016b}"
+        groups = [value[i:i+4] for i in range(0, 16, 4)]
+        out.extend(("1" if i < len(groups) - 1 else "0") + g for i, g in enumerate(groups))
+        return
+
+    if n == 2 and rng.random() < 0.5:
+        type_id = rng.choice((5, 6, 7))
+        counts = [1, 1]
+    else:
+        # Product (type 1) is avoided, otherwise the result would get astronomically large
+        type_id = rng.choice((0, 2, 3))
+        children = min(n, rng.randint(2, 8))
+        splits = sorted(rng.sample(range(1, n), children - 1))
+        counts = [b - a for a, b in zip([0] + splits, splits + [n])]
+
+    sub_packets: list[str] = []
+    for count in counts:
+        _packet_bits(count, rng, sub_packets)
+    sub_bits = "".join(sub_packets)
+
+    out.append(version + f"{type_id:03b}")
+    if len(sub_bits) < (1 << 15) and rng.random() < 0.5:
+        out.append("0" + f"{len(sub_bits):015b}")
+    else:
+        out.append("1" + f"{len(counts):011b}")
+    out.append(sub_bits)
+
+
+def day16(n: int, rng: random.Random) -> Iterator[str]:
+    bits_list: list[str] = []
+    _packet_bits(n, rng, bits_list)
+    bits = "".join(bits_list)
+    bits += "0" * (-len(bits) % 4)
+    yield "".join(f"{int(bits[i:i+4], 2):X}" for i in range(0, len(bits), 4))
+
+
+def _snailfish_number(rng: random.Random, depth: int = 0) -> str:
+    # Inputs are already reduced - so pairs can't be nested in 4 other pairs
+    if depth == 4 or (depth > 0 and rng.random() < 0.3):
+        return str(rng.randrange(10))
+    return f"[{_snailfish_number(rng, depth + 1)},{_snailfish_number(rng, depth + 1)}]"
+
+
+def day18(n: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(n):
+        yield _snailfish_number(rng)
+
+
+Point3D = tuple[int, int, int]
+
+# Scanners of day19 see beacons up to this far along every axis
+SCANNER_RANGE = 1000
+BEACONS_PER_SCANNER = 25
+
+
+def _permutation_sign(permutation: tuple[int, ...]) -> int:
+    inversions = sum(a > b for i, a in enumerate(permutation) for b in permutation[i+1:])
+    return -1 if inversions % 2 else 1
+
+
+# The 24 orientations of a scanner, as the axis and the sign of every rotated coordinate
+ROTATIONS: list[tuple[tuple[int, ...], tuple[int, ...]]] = [
+    (axes, signs) for axes in permutations(range(3))
+    for signs in ((x, y, z) for x in (1, -1) for y in (1, -1) for z in (1, -1))
+    if _permutation_sign(axes) * prod(signs) == 1
+]
+
+
+def day19(n: int, rng: random.Random) -> Iterator[str]:
+    # Every scanner is placed next to an earlier one, with (at least) 12 beacons seen by both,
+    # so that all of them can be matched. Scanner 0 defines the orientation of the others.
+    scanners: list[Point3D] = [(0, 0, 0)]
+    beacons: set[Point3D] = set()
+
+    def sees(scanner: Point3D, beacon: Point3D) -> bool:
+        return all(abs(b - s) <= SCANNER_RANGE for s, b in zip(scanner, beacon))
+
+    def add_beacons(count: int, *seen_by: Point3D) -> None:
+        lows = [max(s[axis] for s in seen_by) - SCANNER_RANGE for axis in range(3)]
+        highs = [min(s[axis] for s in seen_by) + SCANNER_RANGE for axis in range(3)]
+        while count > 0:
+            beacon = (rng.randint(lows[0], highs[0]), rng.randint(lows[1], highs[1]),
+                      rng.randint(lows[2], highs[2]))
+            if beacon not in beacons:
+                beacons.add(beacon)
+                count -= 1
+
+    add_beacons(BEACONS_PER_SCANNER, scanners[0])
+    while len(scanners) < n:
+        neighbor = rng.choice(scanners)
+        offset = [rng.randint(-300, 300) for _ in range(3)]
+        offset[rng.randrange(3)] = rng.choice((-1, 1)) * rng.randint(800, 1200)
+        scanner = (neighbor[0] + offset[0], neighbor[1] + offset[1], neighbor[2] + offset[2])
+        if scanner in scanners:
+            continue
+
+        shared = sum(sees(scanner, beacon) and sees(neighbor, beacon) for beacon in beacons)
+        add_beacons(12 - shared, scanner, neighbor)
+        add_beacons(BEACONS_PER_SCANNER - sum(sees(scanner, beacon) for beacon in beacons),
+                    scanner)
+        scanners.append(scanner)
+
+    for i, scanner in enumerate(scanners):
+        axes, signs = ROTATIONS[0] if i == 0 else rng.choice(ROTATIONS)
+        seen = [beacon for beacon in beacons if sees(scanner, beacon)]
+        rng.shuffle(seen)
+
+        if i:
+            yield ""
+        yield f"--- scanner {i} ---"
+        for beacon in seen:
+            relative = [b - s for s, b in zip(scanner, beacon)]
+            yield ",".join(str(sign * relative[axis]) for axis, sign in zip(axes, signs))
+
+
+def day20(n: int, rng: random.Random) -> Iterator[str]:
+    enhancer = [rng.choice(".#") for _ in range(512)]
+    if enhancer[0] == "#":
+        # Otherwise the infinite background would be lit up after every even round
+        enhancer[511] = "."
+    yield "".join(enhancer)
+    yield ""
+
+    side = side_of(n)
+    for _ in range(side):
+        yield "".join(rng.choice(".#") for _ in range(side))
+
+
+def _cuboid(rng: random.Random, limit: int, max_size: int) -> str:
+    ranges: list[str] = []
+    for axis in "xyz":
+        start = rng.randint(-limit, limit - 1)
+        end = min(start + rng.randint(1, max_size), limit)
+        ranges.append(f"{axis}={start}..{end}")
+    return ",".join(ranges)
+
+
+def day22(n: int, rng: random.Random) -> Iterator[str]:
+    # Like in the real input, the first 5% of steps target the initialization area,
+    # while the rest are huge cuboids all over the place.
+    for i in range(n):
+        status = "on" if i == 0 or rng.random() < 0.6 else "off"
+        if i < max(n // 20, 1):
+            yield f"{status} {_cuboid(rng, 50, 50)}"
+        else:
+            yield f"{status} {_cuboid(rng, 100_000, 50_000)}"
+
+
+def day25(n: int, rng: random.Random) -> Iterator[str]:
+    side = side_of(n)
+    for _ in range(side):
+        yield "".join(rng.choices(".>v", weights=(5, 3, 3), k=side))
+
+
+# Map from the day to its generator and a default size
+GENERATORS: dict[int, tuple[Generator, int]] = {
+    1: (day01, 2_000),
+    2: (day02, 1_000),
+    3: (day03, 1_000),
+    4: (day04, 100),
+    5: (day05, 500),
+    6: (day06, 300),
+    7: (day07, 1_000),
+    8: (day08, 200),
+    9: (day09, 10_000),
+    10: (day10, 100),
+    13: (day13, 1_000),
+    14: (day14, 20),
+    15: (day15, 10_000),
+    16: (day16, 300),
+    18: (day18, 100),
+    19: (day19, 8),
+    20: (day20, 10_000),
+    22: (day22, 40),
+    25: (day25, 10_000),
+}
+
+
+def generate(day: int, n: int, seed: int = 0) -> Iterable[str]:
+    """Generates lines (without the trailing newline) of an input for a given day"""
+    try:
+        generator, _ = GENERATORS[day]
+    except KeyError:
+        raise ValueError(f"no input generator for day {day}") from None
+
+    return generator(n, random.Random(seed))
+
+
+def write_input(day: int, n: int, out: TextIO, seed: int = 0) -> None:
+    for line in generate(day, n, seed):
+        out.write(line)
+        out.write("\n")
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__.partition("\n\n")[0])
+    arg_parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    arg_parser.add_argument("size", type=int, nargs="?", help="number of input items")
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args()
+
+    write_input(args.day, args.size or GENERATORS[args.day][1], sys.stdout, args.seed)
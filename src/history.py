@@ -0,0 +1,131 @@
+"""Persistent history of benchmark results, with detection of performance regressions.
+
+benchmark.py appends every measurement to a JSON-lines history file. This script compares
+the latest result of every (day, part, input size) with a baseline - the oldest stored result,
+or the newest one from a given git revision - and flags solutions that got slower.
+
+Usage: python src/history.py [--threshold 20] [--baseline REVISION] [--history PATH]
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional
+
+HISTORY_PATH = Path(__file__).parent.parent / "bench_history.jsonl"
+
+
+class Record(NamedTuple):
+    day: int
+    part: str
+    size: int
+    time: float  # wall time of parse + solve, in seconds
+    max_rss: int  # in KiB
+    revision: Optional[str]
+    timestamp: float
+
+    @property
+    def key(self) -> tuple[int, str, int]:
+        return self.day, self.part, self.size
+
+
+class Regression(NamedTuple):
+    baseline: Record
+    current: Record
+
+    @property
+    def slowdown(self) -> float:
+        return self.current.time / self.baseline.time
+
+
+def git_revision() -> Optional[str]:
+    """Returns the hash of the checked-out commit, with a '+' suffix if the tree is dirty"""
+    try:
+        rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                             text=True, check=True, cwd=HISTORY_PATH.parent).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                               capture_output=True, text=True, check=True,
+                               cwd=HISTORY_PATH.parent).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return rev + "+" if dirty else rev
+
+
+def commit_of(revision: Optional[str]) -> Optional[str]:
+    """Returns the commit of a revision from git_revision, without the '+' of a dirty tree"""
+    return revision.rstrip("+") if revision else revision
+
+
+def append(records: Iterable[Record], path: Path = HISTORY_PATH) -> None:
+    with path.open("a") as f:
+        for record in records:
+            f.write(json.dumps(record._asdict()))
+            f.write("\n")
+
+
+def load(path: Path = HISTORY_PATH) -> list[Record]:
+    if not path.exists():
+        return []
+
+    with path.open() as f:
+        return [Record(**json.loads(line)) for line in f if line.strip()]
+
+
+def find_regressions(records: Iterable[Record], threshold: float,
+                     baseline_revision: Optional[str] = None,
+                     min_time: float = 0.0) -> list[Regression]:
+    """Compares the newest record of every solver & input size with its baseline,
+    returning those which got more than `threshold` percent slower.
+
+    The baseline is the newest record from `baseline_revision` (including ones measured
+    with uncommitted changes on top of it), or the oldest record if no revision
+    is provided. Baselines faster than min_time seconds are ignored, as they're mostly noise.
+    """
+    baselines: dict[tuple[int, str, int], Record] = {}
+    latest: dict[tuple[int, str, int], Record] = {}
+
+    for record in sorted(records, key=lambda r: r.timestamp):
+        if baseline_revision is None:
+            baselines.setdefault(record.key, record)
+        elif commit_of(record.revision) == commit_of(baseline_revision):
+            baselines[record.key] = record
+        latest[record.key] = record
+
+    regressions: list[Regression] = []
+    for key, baseline in sorted(baselines.items()):
+        current = latest[key]
+        if current is baseline or baseline.time < min_time:
+            continue
+
+        if current.time > baseline.time * (1 + threshold / 100):
+            regressions.append(Regression(baseline, current))
+
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.partition("\n\n")[0])
+    arg_parser.add_argument("--history", type=Path, default=HISTORY_PATH)
+    arg_parser.add_argument("--threshold", type=float, default=20.0,
+                            help="max allowed slowdown, in percent")
+    arg_parser.add_argument("--baseline", metavar="REVISION",
+                            help="compare with results of this git revision "
+                                 "(default: the oldest results)")
+    arg_parser.add_argument("--min-time", type=float, default=0.01,
+                            help="ignore baselines faster than this many seconds")
+    args = arg_parser.parse_args(argv)
+
+    regressions = find_regressions(load(args.history), args.threshold, args.baseline,
+                                   args.min_time)
+
+    for r in regressions:
+        print(f"day{r.current.day:02}{r.current.part} ({r.current.size} items): "
+              f"{r.baseline.time:.4f} s ({r.baseline.revision}) -> "
+              f"{r.current.time:.4f} s ({r.current.revision}), {r.slowdown:.2f}x slower")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,291 @@
+"""Reports the startup cost of the solution modules, and imports which could be deferred.
+
+Every module is imported in a fresh interpreter with `python -X importtime`;
+the report shows the wall time of that interpreter (and of an empty one, for reference),
+the time spent importing the module, and its most expensive imports.
+
+Imports of non-local modules (stdlib, NumPy, ...) whose names aren't needed while
+the module is being imported - only inside functions, only when run as a script
+(in the `if __name__ == "__main__"` block), only in quoted type annotations
+(which can use an `if TYPE_CHECKING:` import), or not at all - are listed as deferrable:
+moving them into the functions using them takes their cost off every invocation
+which doesn't need them. Their cost is only saved if no other import loads them, too.
+
+Usage: python src/importtime.py [day01a day15b ...] [--repeat 5] [--top 3]
+"""
+import argparse
+import ast
+import re
+import subprocess
+import sys
+import time
+from typing import Iterable, NamedTuple, Optional
+
+import runner
+
+REPEAT = 5
+TOP = 3
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$")
+
+
+class ImportTime(NamedTuple):
+    name: str
+    self_time: int  # in µs
+    cumulative: int  # in µs, including imports made by this one
+    depth: int  # 0 for imports made by the main script
+
+
+class Measurement(NamedTuple):
+    module: str
+    startup: float  # in seconds, of the whole interpreter
+    imports: list[ImportTime]  # in the order of -X importtime: imports precede their importer
+
+    def own(self) -> Optional[ImportTime]:
+        return next((i for i in self.imports if i.name == self.module), None)
+
+    def direct_imports(self) -> list[ImportTime]:
+        """Imports made by the module itself, which actually loaded something"""
+        own = self.own()
+        if own is None:
+            return []
+        return [i for i in self.imports if i.depth == own.depth + 1 and self.importer(i) == own]
+
+    def importer(self, imported: ImportTime) -> Optional[ImportTime]:
+        # Imports are reported after everything they import
+        after = self.imports[self.imports.index(imported) + 1:]
+        return next((i for i in after if i.depth < imported.depth), None)
+
+
+class Deferrable(NamedTuple):
+    module: str  # the module importing it
+    imported: str
+    names: list[str]
+    reason: str
+    also_imported_by: list[str]  # local modules which the module uses, importing it, too
+
+
+def parse_importtime(output: str) -> list[ImportTime]:
+    imports: list[ImportTime] = []
+    for line in output.splitlines():
+        m = _IMPORTTIME_LINE.match(line)
+        if m:
+            imports.append(ImportTime(m[4], int(m[1]), int(m[2]), len(m[3]) // 2))
+    return imports
+
+
+def measure_once(module: Optional[str]) -> Measurement:
+    """Imports a module (nothing for None) in a fresh interpreter"""
+    start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}" if module else "pass"],
+        cwd=runner.SRC_DIR,
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+
+    if process.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{process.stderr}")
+    return Measurement(module or "", elapsed, parse_importtime(process.stderr))
+
+
+def measure(module: Optional[str], repeat: int = REPEAT) -> Measurement:
+    """Returns the fastest of `repeat` measurements - the one least disturbed by other processes"""
+    return min((measure_once(module) for _ in range(repeat)), key=lambda m: m.startup)
+
+
+def _is_main_block(node: ast.AST) -> bool:
+    if not isinstance(node, ast.If) or not isinstance(node.test, ast.Compare):
+        return False
+    left, right = node.test.left, node.test.comparators[0]
+    return isinstance(left, ast.Name) and left.id == "__name__" \
+        and isinstance(right, ast.Constant) and right.value == "__main__"
+
+
+def _names_used(node: ast.AST, skip_functions: bool = False, skip_main: bool = False) \
+        -> set[str]:
+    """Returns names read by the code of a node. skip_functions skips the bodies of functions
+    and lambdas (their defaults, decorators and annotations are still evaluated at
+    import time), skip_main skips the `if __name__ == "__main__"` block.
+    """
+    used: set[str] = set()
+    to_visit: list[ast.AST] = [node]
+
+    while to_visit:
+        n = to_visit.pop()
+
+        if skip_functions and isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            to_visit.extend(n.decorator_list)
+            to_visit.append(n.args)
+            if n.returns:
+                to_visit.append(n.returns)
+            continue
+        if skip_functions and isinstance(n, ast.Lambda):
+            to_visit.append(n.args)
+            continue
+        if skip_main and _is_main_block(n):
+            continue
+
+        if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Load):
+            used.add(n.id)
+        to_visit.extend(ast.iter_child_nodes(n))
+
+    return used
+
+
+def _names_in_quoted_annotations(tree: ast.AST) -> set[str]:
+    used: set[str] = set()
+
+    for n in ast.walk(tree):
+        if isinstance(n, (ast.arg, ast.AnnAssign)):
+            annotation = n.annotation
+        elif isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            annotation = n.returns
+        else:
+            continue
+
+        if isinstance(annotation, ast.Constant) and isinstance(annotation.value, str):
+            try:
+                used |= _names_used(ast.parse(annotation.value, mode="eval"))
+            except SyntaxError:
+                pass
+
+    return used
+
+
+def _is_local(module: str) -> bool:
+    return (runner.SRC_DIR / f"{module.partition('.')[0]}.py").exists()
+
+
+def _top_level_imports(tree: ast.Module) -> Iterable[tuple[str, list[str]]]:
+    """Yields the imported module & the names bound by it, for every top-level import"""
+    for statement in tree.body:
+        if isinstance(statement, ast.Import):
+            for alias in statement.names:
+                yield alias.name, [(alias.asname or alias.name).partition(".")[0]]
+        elif isinstance(statement, ast.ImportFrom) and statement.module and not statement.level:
+            yield statement.module, [alias.asname or alias.name for alias in statement.names]
+
+
+def _parse_module(module: str) -> ast.Module:
+    return ast.parse((runner.SRC_DIR / f"{module}.py").read_text())
+
+
+def _imported_by_dependencies(module: str) -> dict[str, list[str]]:
+    """Maps non-local modules to the local modules (other than `module`) which import them
+    at the top level, for all local modules `module` (transitively) imports
+    """
+    imported_by: dict[str, list[str]] = {}
+    seen: set[str] = {module}
+    to_check = [i for i, _ in _top_level_imports(_parse_module(module)) if _is_local(i)]
+
+    while to_check:
+        dependency = to_check.pop()
+        if dependency in seen:
+            continue
+        seen.add(dependency)
+
+        for imported, _ in _top_level_imports(_parse_module(dependency)):
+            if _is_local(imported):
+                to_check.append(imported)
+            else:
+                imported_by.setdefault(imported, []).append(dependency)
+
+    return imported_by
+
+
+def deferrable_imports(module: str) -> list[Deferrable]:
+    """Finds top-level imports of non-local modules, whose names aren't used at import time"""
+    tree = _parse_module(module)
+    imported_by_dependencies = _imported_by_dependencies(module)
+    at_import_time = _names_used(tree, skip_functions=True, skip_main=True)
+    outside_main = _names_used(tree, skip_main=True)
+    in_main = _names_used(tree) - outside_main
+    in_annotations = _names_in_quoted_annotations(tree)
+
+    found: list[Deferrable] = []
+    for imported, names in _top_level_imports(tree):
+        if _is_local(imported) or any(name in at_import_time for name in names):
+            continue
+
+        if any(name in outside_main for name in names):
+            reason = "only used in functions"
+        elif any(name in in_main for name in names):
+            reason = "only used when run as a script"
+        elif any(name in in_annotations for name in names):
+            reason = "only used in type annotations"
+        else:
+            reason = "unused"
+        also_imported_by = sorted(imported_by_dependencies.get(imported, []))
+        found.append(Deferrable(module, imported, names, reason, also_imported_by))
+
+    return found
+
+
+def format_ms(us: float) -> str:
+    return f"{us / 1000:.1f}"
+
+
+def print_report(baseline: Measurement, measurements: Iterable[Measurement], top: int = TOP,
+                 file=sys.stdout) -> None:
+    print(f"Empty interpreter: {baseline.startup * 1000:.1f} ms", file=file)
+    print(f"{'module':<8} {'startup [ms]':>12} {'import [ms]':>11}  slowest imports [ms]",
+          file=file)
+
+    for m in measurements:
+        own = m.own()
+        slowest = sorted(m.direct_imports(), key=lambda i: i.cumulative, reverse=True)[:top]
+        print(f"{m.module:<8} {m.startup * 1000:>12.1f} "
+              f"{format_ms(own.cumulative) if own else '-':>11}  "
+              + ", ".join(f"{i.name} {format_ms(i.cumulative)}" for i in slowest), file=file)
+
+
+def print_deferrable(deferrable: Iterable[tuple[Deferrable, Measurement]],
+                     file=sys.stdout) -> None:
+    print(f"{'module':<8} {'import':<32} {'cost [ms]':>9}  reason", file=file)
+
+    for d, m in deferrable:
+        # The import's cost is where it was loaded - if that's not the module itself,
+        # or the module uses others importing it as well, deferring it doesn't save anything
+        loaded = next((i for i in m.imports if i.name == d.imported), None)
+        importer = m.importer(loaded) if loaded else None
+        if loaded is None:
+            cost = "-"
+        elif d.also_imported_by or (importer is not None and importer.name != d.module):
+            cost = f"({format_ms(loaded.cumulative)})"
+        else:
+            cost = format_ms(loaded.cumulative)
+
+        names = f"{d.imported} ({', '.join(d.names)})" if d.names != [d.imported] else d.imported
+        reason = d.reason
+        if d.also_imported_by:
+            reason += f", also imported by {', '.join(d.also_imported_by)}"
+        print(f"{d.module:<8} {names:<32} {cost:>9}  {reason}", file=file)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.partition("\n\n")[0])
+    arg_parser.add_argument("modules", nargs="*", help="modules to measure (default: all)")
+    arg_parser.add_argument("--repeat", type=int, default=REPEAT,
+                            help="imports per module, the fastest one is reported")
+    arg_parser.add_argument("--top", type=int, default=TOP,
+                            help="number of slowest imports to show per module")
+    args = arg_parser.parse_args(argv)
+
+    modules = args.modules or runner.all_modules()
+    for module in modules:
+        if not runner.MODULE_NAME.match(module):
+            arg_parser.error(f"not a solution module: {module!r}")
+
+    baseline = measure(None, args.repeat)
+    measurements = [measure(module, args.repeat) for module in modules]
+    print_report(baseline, measurements, args.top)
+
+    print("\nImports not needed at import time (cost in parentheses: also loaded elsewhere):")
+    print_deferrable((d, m) for m in measurements for d in deferrable_imports(m.module))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""Memoization of solutions' recursive functions, optionally persisted across runs.
+
+Without persistence, memoize is functools.lru_cache. With it, results are also stored
+in an SQLite file (see memo_path) and reused by later runs, as long as neither the
+function's code nor its `version` changed; the file keeps at most `max_rows` of the
+most recently computed results.
+"""
+import atexit
+import os
+import pickle
+from collections import OrderedDict
+from functools import lru_cache, update_wrapper
+from pathlib import Path
+from types import CodeType
+from typing import (TYPE_CHECKING, Any, Callable, Generic, Hashable, NamedTuple, Optional,
+                    Protocol, TypeVar)
+
+# Only persisting needs these, see importtime.py
+if TYPE_CHECKING:
+    import sqlite3
+
+_T = TypeVar("_T")
+_T_co = TypeVar("_T_co", covariant=True)
+
+MEMO_DIR_ENV = "AOC_MEMO_DIR"
+
+# Newly computed results are written to the memo file in batches of this size
+MEMO_FLUSH_EVERY = 4096
+
+# Max number of results kept in a memo file; the oldest ones are removed first
+MEMO_MAX_ROWS = 1 << 20
+
+_MISSING = object()
+
+
+def memo_path(name: str) -> Optional[Path]:
+    """Returns the file for persisting the memoized results of `name`,
+    or None if persisting isn't enabled with the AOC_MEMO_DIR environment variable.
+    """
+    directory = os.environ.get(MEMO_DIR_ENV)
+    return Path(directory) / f"{name}.sqlite" if directory else None
+
+
+def _code_key(value: Any) -> Any:
+    """Returns what identifies a code object (or one of its constants) across runs:
+    the bytecode and the names & constants it uses, but not its line numbers or file name
+    """
+    if isinstance(value, CodeType):
+        return value.co_code, _code_key(value.co_consts), value.co_names
+    if isinstance(value, tuple):
+        return tuple(_code_key(i) for i in value)
+    if isinstance(value, frozenset):
+        # Iteration order of sets of strings changes between runs (see PYTHONHASHSEED)
+        return sorted(repr(_code_key(i)) for i in value)
+    return value
+
+
+def code_hash(f: Callable[..., Any]) -> str:
+    """Returns a hash of the function's code (including the functions nested in it),
+    which changes whenever the function is edited - but not when it's only moved
+    """
+    import hashlib
+
+    return hashlib.sha256(repr(_code_key(f.__code__)).encode()).hexdigest()
+
+
+class CacheInfo(NamedTuple):
+    hits: int  # including disk_hits
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+    disk_hits: int = 0
+
+
+class MemoizedFunction(Protocol[_T_co]):
+    """A memoized function - a Memoized one, or one wrapped by functools.lru_cache"""
+
+    def __call__(self, *args: Hashable) -> _T_co: ...
+
+    def cache_info(self) -> Any: ...
+
+    def cache_clear(self) -> None: ...
+
+
+class Memoized(Generic[_T]):
+    """A function with memoized results persisted to a file, see memoize"""
+
+    def __init__(self, f: Callable[..., _T], maxsize: Optional[int], persist: Path,
+                 version: str, max_rows: int) -> None:
+        update_wrapper(self, f)
+        self.f = f
+        self.maxsize = maxsize
+        self.persist = persist
+        self.version = f"{code_hash(f)}:{version}"
+        self.max_rows = max_rows
+
+        self.cache: OrderedDict[Hashable, _T] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+        self.db: "Optional[sqlite3.Connection]" = None
+        self.unsaved: dict[str, _T] = {}
+
+    def __call__(self, *args: Hashable) -> _T:
+        try:
+            value = self.cache[args]
+        except KeyError:
+            pass
+        else:
+            self.cache.move_to_end(args)
+            self.hits += 1
+            return value
+
+        value = self._load(args)
+        if value is _MISSING:
+            self.misses += 1
+            value = self.f(*args)
+            self._save(args, value)
+        else:
+            self.hits += 1
+            self.disk_hits += 1
+
+        self.cache[args] = value
+        if self.maxsize is not None and len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
+        return value
+
+    def _connect(self) -> "sqlite3.Connection":
+        if self.db is None:
+            import sqlite3
+
+            self.persist.parent.mkdir(parents=True, exist_ok=True)
+            self.db = sqlite3.connect(self.persist)
+            with self.db:
+                self.db.execute("CREATE TABLE IF NOT EXISTS results "
+                                "(version TEXT, key TEXT, value BLOB, PRIMARY KEY (version, key))")
+                # Results of other versions can't be used anymore
+                self.db.execute("DELETE FROM results WHERE version != ?", (self.version,))
+            atexit.register(self.cache_close)
+        return self.db
+
+    def _load(self, args: tuple[Hashable, ...]) -> Any:
+        key = repr(args)
+        if key in self.unsaved:
+            return self.unsaved[key]
+
+        row = self._connect().execute("SELECT value FROM results WHERE version = ? AND key = ?",
+                                      (self.version, key)).fetchone()
+        return pickle.loads(row[0]) if row else _MISSING
+
+    def _save(self, args: tuple[Hashable, ...], value: _T) -> None:
+        self.unsaved[repr(args)] = value
+        if len(self.unsaved) >= MEMO_FLUSH_EVERY:
+            self.cache_flush()
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self.cache), self.disk_hits)
+
+    def cache_clear(self) -> None:
+        """Clears the results kept in memory and the statistics; the memo file is kept"""
+        self.cache.clear()
+        self.hits = self.misses = self.disk_hits = 0
+
+    def cache_flush(self) -> None:
+        """Writes the newly computed results to the memo file, removing the oldest ones
+        if there are more than max_rows
+        """
+        if not self.unsaved:
+            return
+
+        with self._connect() as db:
+            db.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                           ((self.version, k, pickle.dumps(v)) for k, v in self.unsaved.items()))
+            # Rows get increasing rowids as they're inserted
+            db.execute("DELETE FROM results WHERE rowid IN (SELECT rowid FROM results "
+                       "ORDER BY rowid DESC LIMIT -1 OFFSET ?)", (self.max_rows,))
+        self.unsaved.clear()
+
+    def cache_close(self) -> None:
+        if self.db is not None:
+            self.cache_flush()
+            self.db.close()
+            self.db = None
+
+
+def memoize(maxsize: Optional[int] = 128, persist: Optional[Path] = None, version: str = "",
+            max_rows: int = MEMO_MAX_ROWS) \
+        -> Callable[[Callable[..., _T]], MemoizedFunction[_T]]:
+    """Memoizes the results of a function of hashable, positional arguments.
+
+    Like functools.lru_cache (which is used when not persisting), at most `maxsize`
+    (None for no limit) least-recently-used results are kept in memory,
+    and cache_info() reports hits & misses.
+    With `persist`, results are also stored in an SQLite file (see memo_path) and reused
+    by later runs. The stored results are only valid for the same code of the function
+    and the same `version` - it should change whenever anything else the results depend on,
+    like a global constant or another function, changes.
+    """
+    def decorator(f: Callable[..., _T]) -> MemoizedFunction[_T]:
+        if persist is None:
+            return lru_cache(maxsize)(f)
+        return Memoized(f, maxsize, persist, version, max_rows)
+
+    return decorator
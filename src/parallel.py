@@ -0,0 +1,105 @@
+"""Spreads the work of solutions over a pool of worker processes.
+
+The pool is started on the first use and shared by all later ones; AOC_WORKERS sets
+its size (1 runs everything serially, in the calling process).
+"""
+import atexit
+import os
+from typing import TYPE_CHECKING, Callable, Generator, Optional, Sequence, TypeVar
+
+# Imported when the pool is started - solutions import this module even for inputs
+# too small to need it (see importtime.py)
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+WORKERS_ENV = "AOC_WORKERS"
+
+# Items are split into about this many chunks per worker, evening out the load of workers
+# while keeping the number of round-trips to them low
+CHUNKS_PER_WORKER = 4
+
+_pool: "Optional[ProcessPoolExecutor]" = None
+_pool_workers = 0
+
+
+def worker_count() -> int:
+    """Returns the number of processes parallel_map should use - AOC_WORKERS,
+    or the number of CPUs by default. It's always 1 within worker processes
+    (of parallel_map, batch.py, ...), so that pools aren't nested.
+    """
+    import multiprocessing
+
+    if multiprocessing.parent_process() is not None:
+        return 1
+
+    workers = os.environ.get(WORKERS_ENV)
+    if not workers:
+        return os.cpu_count() or 1
+    if not workers.isdigit() or int(workers) < 1:
+        raise ValueError(f"{WORKERS_ENV} has to be a positive integer, got {workers!r}")
+    return int(workers)
+
+
+def _shared_pool(workers: int) -> "Optional[ProcessPoolExecutor]":
+    """Returns a pool of the given size, started once and reused by all parallel_map calls;
+    None if processes can't be started here.
+    """
+    global _pool, _pool_workers
+
+    if _pool is not None and _pool_workers != workers:
+        _pool.shutdown(cancel_futures=True)
+        _pool = None
+
+    if _pool is None:
+        from concurrent.futures import ProcessPoolExecutor
+
+        try:
+            _pool = ProcessPoolExecutor(workers)
+        except (OSError, NotImplementedError):
+            return None
+        _pool_workers = workers
+        atexit.register(_pool.shutdown, cancel_futures=True)
+
+    return _pool
+
+
+def parallel_map(f: Callable[[_T], _R], items: Sequence[_T], chunk_size: Optional[int] = None,
+                 workers: Optional[int] = None) -> Generator[_R, None, None]:
+    """Like map(f, items), with the calls spread over a pool of worker processes.
+    Results are yielded in the order of items, so reducing them (max, sum, first_match)
+    gives the same answer regardless of the number of workers.
+
+    f and the items are pickled, so f has to be a module-level function
+    (use functools.partial to bind other arguments). With a single worker or item,
+    or where processes can't be started, it's a plain map.
+    """
+    workers = workers or worker_count()
+    pool = _shared_pool(workers) if workers > 1 and len(items) > 1 else None
+    if pool is None:
+        yield from map(f, items)
+        return
+
+    if chunk_size is None:
+        chunk_size = max(1, len(items) // (workers * CHUNKS_PER_WORKER))
+
+    results = pool.map(f, items, chunksize=chunk_size)
+    try:
+        yield from results
+    finally:
+        # Cancels the calls which haven't started yet, if the caller stops early
+        results.close()  # type: ignore
+
+
+def first_match(f: Callable[[_T], Optional[_R]], items: Sequence[_T],
+                chunk_size: Optional[int] = None, workers: Optional[int] = None) -> Optional[_R]:
+    """Returns the first (in the order of items) result of f which isn't None,
+    None if there's no such result. See parallel_map.
+    """
+    results = parallel_map(f, items, chunk_size, workers)
+    try:
+        return next((i for i in results if i is not None), None)
+    finally:
+        results.close()
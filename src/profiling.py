@@ -0,0 +1,149 @@
+"""Opt-in profiling of solutions, see `python src/runner.py --profile`.
+
+Every profiled solve writes its reports to the profile directory:
+- `dayNNx.cpu.txt` - functions sorted by own & cumulative time, from cProfile,
+  with the raw stats in `dayNNx.cpu.prof` (for pstats, snakeviz, etc.);
+- `dayNNx.mem.txt` - peak memory, and the allocation sites (source lines)
+  of memory held at the peak, from tracemalloc.
+
+The AOC_PROFILE environment variable (e.g. AOC_PROFILE=cpu,mem) selects the profilers
+when there's no --profile option.
+"""
+import cProfile
+import os
+import pstats
+import threading
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+PROFILE_ENV = "AOC_PROFILE"
+PROFILE_DIR = Path(__file__).parent.parent / "profiles"
+
+MODES = ("cpu", "mem")
+
+# Number of functions / allocation sites in the reports
+TOP = 30
+
+# How often the memory profiler checks whether a new peak was reached, in seconds
+POLL_INTERVAL = 0.05
+
+# Snapshots are expensive - a new one is only taken once traced memory grows by this factor
+SNAPSHOT_GROWTH = 1.1
+
+
+def modes_from_env() -> list[str]:
+    return parse_modes([os.environ.get(PROFILE_ENV, "")])
+
+
+def parse_modes(values: Iterable[str]) -> list[str]:
+    """Parses profiling modes given as (possibly comma-separated) strings"""
+    modes: list[str] = []
+
+    for value in values:
+        for mode in filter(None, (i.strip() for i in value.split(","))):
+            if mode not in MODES:
+                raise ValueError(f"unknown profiling mode: {mode!r} (expected one of {MODES})")
+            if mode not in modes:
+                modes.append(mode)
+
+    return modes
+
+
+class _PeakSnapshots(threading.Thread):
+    """Keeps the tracemalloc snapshot taken closest to the peak of traced memory.
+    Memory is polled every POLL_INTERVAL seconds, so short-lived peaks may be missed,
+    and the snapshot may be up to SNAPSHOT_GROWTH times smaller than the peak.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(daemon=True)
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.snapshot_size: int = 0
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self.stopped.wait(POLL_INTERVAL):
+            self.update()
+
+    def update(self) -> None:
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.snapshot_size * SNAPSHOT_GROWTH:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_size = current
+
+    def stop(self) -> None:
+        self.stopped.set()
+        self.join()
+        self.update()
+
+
+def write_cpu_report(profile: cProfile.Profile, path: Path) -> None:
+    profile.dump_stats(path.with_suffix(".prof"))
+
+    with path.open("w") as f:
+        stats = pstats.Stats(profile, stream=f).strip_dirs()
+        print("Sorted by own time:", file=f)
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(TOP)
+        print("Sorted by cumulative time:", file=f)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP)
+
+
+def write_mem_report(snapshot: Optional[tracemalloc.Snapshot], peak: int, path: Path) -> None:
+    with path.open("w") as f:
+        print(f"Peak memory: {peak / 1024 / 1024:.1f} MiB", file=f)
+        if snapshot is None:
+            return
+
+        snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, threading.__file__),
+        ])
+        stats = snapshot.statistics("lineno")
+        total = sum(stat.size for stat in stats)
+
+        print(f"Memory held at the peak, by allocation site "
+              f"({total / 1024 / 1024:.1f} MiB traced):", file=f)
+        for stat in stats[:TOP]:
+            frame = stat.traceback[0]
+            print(f"{stat.size / 1024:>12.1f} KiB {stat.count:>10} blocks  "
+                  f"{frame.filename}:{frame.lineno}", file=f)
+
+
+def profiled(module: str, solve: Callable[[Any], Any], modes: Iterable[str],
+             directory: Path = PROFILE_DIR) -> Callable[[Any], Any]:
+    """Wraps a solve function, so that it's run under the given profilers,
+    with their reports written to the given directory.
+    """
+    modes = list(modes)
+    if not modes:
+        return solve
+
+    def profiled_solve(parsed: Any) -> Any:
+        directory.mkdir(parents=True, exist_ok=True)
+        profile = cProfile.Profile() if "cpu" in modes else None
+        snapshots = _PeakSnapshots() if "mem" in modes else None
+
+        if snapshots:
+            tracemalloc.start()
+            snapshots.start()
+
+        try:
+            if profile:
+                answer = profile.runcall(solve, parsed)
+            else:
+                answer = solve(parsed)
+
+        finally:
+            if snapshots:
+                snapshots.stop()
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                write_mem_report(snapshots.snapshot, peak, directory / f"{module}.mem.txt")
+
+            if profile:
+                write_cpu_report(profile, directory / f"{module}.cpu.txt")
+
+        return answer
+
+    return profiled_solve
@@ -0,0 +1,284 @@
+"""Runs the solutions in a single process, without paying for the interpreter startup
+(and re-imports of shared modules) for every single day.
+
+Every dayNNx module exposes a `parse(lines) -> parsed` and a `solve(parsed) -> answer` pair;
+the runner times both phases separately and prints a table with the results.
+Modules which can read their input file directly (e.g. by memory-mapping it)
+also expose `load(path) -> parsed`, which the runner then uses instead of parse.
+With --cache, answers are stored on disk and reused for unchanged inputs & code.
+With --profile cpu/mem, solve runs under cProfile/tracemalloc, see profiling.py.
+With --backend python/numpy, solutions with vectorized implementations use (or don't use)
+NumPy, see core.numpy_backend; --compare-backends runs both and checks their answers match.
+With --resume, slow solutions continue from their checkpoints, see checkpoint.py.
+
+Usage: python src/runner.py [--test] [--no-trace-memory] [--cache] [--profile cpu,mem]
+                            [--backend auto|numpy|python] [--compare-backends] [--resume]
+                            [day01a day15b ...]
+"""
+import argparse
+import importlib
+import os
+import re
+import sys
+import time
+import tracemalloc
+import traceback
+from contextlib import nullcontext
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterable, NamedTuple, Optional, Sequence
+
+from cache import CACHE_DIR, MAX_ENTRIES, ResultCache
+from checkpoint import RESUME_ENV
+from core import BACKENDS, NUMPY_ENV, backend, numpy_backend
+from profiling import PROFILE_DIR, modes_from_env, parse_modes, profiled
+
+SRC_DIR = Path(__file__).parent
+INPUT_DIR = SRC_DIR.parent / "input"
+
+MODULE_NAME = re.compile(r"^day(\d\d)([ab])$")
+
+
+class Result(NamedTuple):
+    module: str
+    answer: Any
+    parse_time: float
+    solve_time: float
+    peak_memory: Optional[int] = None  # in bytes, None if memory wasn't traced
+    cached: bool = False
+
+
+def all_modules() -> list[str]:
+    """Returns names of all solution modules, in order"""
+    return sorted(p.stem for p in SRC_DIR.glob("day*.py") if MODULE_NAME.match(p.stem))
+
+
+def input_path(module: str, input_dir: Path = INPUT_DIR, test: bool = False) -> Path:
+    """Finds the input file for a given solution module.
+    Some days have separate inputs for both parts (input/23-a), some days
+    have multiple test inputs (input/12test-1) - in that case the first one is used.
+    """
+    m = MODULE_NAME.match(module)
+    if not m:
+        raise ValueError(f"not a solution module: {module!r}")
+
+    day, part = m[1], m[2]
+    stem = day + "test" if test else day
+    candidates = [f"{stem}-{part}", stem, f"{stem}-1"]
+
+    for candidate in candidates:
+        path = input_dir / candidate
+        if path.exists():
+            return path
+
+    # Some days (like day24) don't need any input - those have to
+    # work with an empty one, as would happen with `python src/day24a.py /dev/null`.
+    return Path("/dev/null")
+
+
+def load(module: str) -> ModuleType:
+    """Imports a solution module, ensuring it has the parse-solve interface"""
+    m = importlib.import_module(module)
+    if not callable(getattr(m, "parse", None)) or not callable(getattr(m, "solve", None)):
+        raise TypeError(f"{module} doesn't provide the parse & solve functions")
+    return m
+
+
+def _timed(module: str, parse: Callable[[], Any], solve: Callable[[Any], Any],
+           trace_memory: bool) -> Result:
+    if trace_memory:
+        tracemalloc.start()
+
+    try:
+        start = time.perf_counter()
+        parsed = parse()
+        parsed_at = time.perf_counter()
+        answer = solve(parsed)
+        solved_at = time.perf_counter()
+
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+
+    return Result(module, answer, parsed_at - start, solved_at - parsed_at, peak)
+
+
+def run(module: str, lines: Iterable[str], trace_memory: bool = True,
+        profile: Sequence[str] = (), profile_dir: Path = PROFILE_DIR) -> Result:
+    """Runs a single solution on the provided input lines.
+    Solve can be profiled, see profiling.profiled; memory profiling replaces trace_memory.
+    """
+    m = load(module)
+    solve = profiled(module, m.solve, profile, profile_dir)
+    return _timed(module, lambda: m.parse(lines), solve, trace_memory and "mem" not in profile)
+
+
+def run_file(module: str, path: Path, trace_memory: bool = True,
+             cache: Optional[ResultCache] = None, profile: Sequence[str] = (),
+             profile_dir: Path = PROFILE_DIR) -> Result:
+    """Runs a single solution on the provided input file.
+    If a cache is provided, answers are reused for unchanged inputs & solutions
+    (unless the solution is profiled).
+    """
+    if cache:
+        key = cache.key(module, path)
+        answer = cache.get(key) if not profile else None
+        if answer is not None:
+            return Result(module, answer, 0.0, 0.0, cached=True)
+
+    m = load(module)
+    if callable(getattr(m, "load", None)):
+        solve = profiled(module, m.solve, profile, profile_dir)
+        result = _timed(module, lambda: m.load(path), solve,
+                        trace_memory and "mem" not in profile)
+    else:
+        with path.open() as f:
+            result = run(module, f, trace_memory, profile, profile_dir)
+
+    if cache:
+        cache.put(key, result.answer)
+
+    return result
+
+
+def compare_backends(module: str, path: Path) -> tuple[Result, Result]:
+    """Runs a single solution with the pure-Python and the NumPy backend"""
+    with backend("python"):
+        python = run_file(module, path, trace_memory=False)
+    with backend("numpy"):
+        vectorized = run_file(module, path, trace_memory=False)
+    return python, vectorized
+
+
+def format_memory(size: Optional[int]) -> str:
+    if size is None:
+        return "-"
+    return f"{size / 1024 / 1024:.1f}"
+
+
+def format_answer(answer: Any) -> str:
+    # Some answers (like day13b) are ASCII-art, those are printed below the table
+    text = str(answer)
+    return "(see below)" if "\n" in text.strip() else text
+
+
+def print_table(results: list[Result], file=sys.stdout) -> None:
+    print(f"{'module':<8} {'parse [s]':>10} {'solve [s]':>10} {'peak [MiB]':>10}  answer",
+          file=file)
+
+    for r in results:
+        if r.cached:
+            print(f"{r.module:<8} {'cached':>10} {'cached':>10} {'-':>10}  "
+                  f"{format_answer(r.answer)}", file=file)
+        else:
+            print(f"{r.module:<8} {r.parse_time:>10.4f} {r.solve_time:>10.4f} "
+                  f"{format_memory(r.peak_memory):>10}  {format_answer(r.answer)}", file=file)
+
+    for r in results:
+        if "\n" in str(r.answer).strip():
+            print(f"\n{r.module}:\n{r.answer}", file=file)
+
+
+def print_comparison(results: list[tuple[Result, Result]], file=sys.stdout) -> None:
+    print(f"{'module':<8} {'python [s]':>10} {'numpy [s]':>10} {'speedup':>8}  answers",
+          file=file)
+
+    for python, vectorized in results:
+        speedup = python.solve_time / vectorized.solve_time if vectorized.solve_time else 0.0
+        answers = "same" if python.answer == vectorized.answer else \
+            f"DIFFERENT: {format_answer(python.answer)} vs {format_answer(vectorized.answer)}"
+        print(f"{python.module:<8} {python.solve_time:>10.4f} {vectorized.solve_time:>10.4f} "
+              f"{speedup:>7.1f}x  {answers}", file=file)
+
+
+def run_comparison(modules: Iterable[str], input_dir: Path, test: bool) -> int:
+    results: list[tuple[Result, Result]] = []
+    failed: bool = False
+
+    for module in modules:
+        path = input_path(module, input_dir, test)
+
+        try:
+            results.append(compare_backends(module, path))
+        except Exception:
+            print(f"{module} failed on {path}:", file=sys.stderr)
+            traceback.print_exc()
+            failed = True
+
+    print_comparison(results)
+    return 1 if failed or any(p.answer != v.answer for p, v in results) else 0
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.partition("\n\n")[0])
+    arg_parser.add_argument("modules", nargs="*", help="modules to run (default: all)")
+    arg_parser.add_argument("--test", action="store_true", help="use the test inputs")
+    arg_parser.add_argument("--input-dir", type=Path, default=INPUT_DIR)
+    arg_parser.add_argument("--no-trace-memory", action="store_false", dest="trace_memory",
+                            help="don't measure peak memory (tracemalloc slows solutions down)")
+    arg_parser.add_argument("--cache", action="store_true",
+                            help="reuse answers for unchanged inputs and solutions")
+    arg_parser.add_argument("--cache-dir", type=Path, default=CACHE_DIR)
+    arg_parser.add_argument("--cache-size", type=int, default=MAX_ENTRIES,
+                            help="max number of cached answers")
+    arg_parser.add_argument("--profile", action="append", metavar="cpu,mem",
+                            help="profile solve with cProfile (cpu) and/or tracemalloc (mem); "
+                                 "defaults to the AOC_PROFILE environment variable")
+    arg_parser.add_argument("--profile-dir", type=Path, default=PROFILE_DIR,
+                            help="directory for the profiling reports")
+    arg_parser.add_argument("--backend", choices=BACKENDS,
+                            help="use NumPy in solutions which can (auto: if it's installed); "
+                                 "defaults to the AOC_NUMPY environment variable")
+    arg_parser.add_argument("--compare-backends", action="store_true",
+                            help="solve with both backends, comparing their answers & times")
+    arg_parser.add_argument("--resume", action="store_true",
+                            help="continue long solutions from their checkpoints "
+                                 "(saved to AOC_CHECKPOINT_DIR)")
+    args = arg_parser.parse_args(argv)
+
+    try:
+        profile = parse_modes(args.profile) if args.profile else modes_from_env()
+    except ValueError as e:
+        arg_parser.error(str(e))
+
+    if args.backend:
+        os.environ[NUMPY_ENV] = args.backend
+    if args.resume:
+        os.environ[RESUME_ENV] = "1"
+
+    # Validates the backend, and imports NumPy outside of the timed solves
+    try:
+        with backend("numpy") if args.compare_backends else nullcontext():
+            numpy_backend()
+    except (ValueError, ImportError) as e:
+        arg_parser.error(str(e))
+
+    if args.compare_backends:
+        return run_comparison(args.modules or all_modules(), args.input_dir, args.test)
+
+    cache = ResultCache(args.cache_dir, args.cache_size) if args.cache else None
+
+    results: list[Result] = []
+    failed: bool = False
+
+    for module in args.modules or all_modules():
+        path = input_path(module, args.input_dir, args.test)
+
+        try:
+            results.append(run_file(module, path, args.trace_memory, cache, profile,
+                                    args.profile_dir))
+        except Exception:
+            print(f"{module} failed on {path}:", file=sys.stderr)
+            traceback.print_exc()
+            failed = True
+
+    print_table(results)
+    if profile:
+        print(f"\nProfiling reports written to {args.profile_dir}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Solutions import their shared modules (core, ...) from src, like the scripts in it do
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -0,0 +1,50 @@
+import random
+from importlib import import_module
+
+import pytest
+
+import core
+from core import backend, extract_ints
+from generators import generate
+
+pytest.importorskip("numpy")
+
+# Solutions with vectorized implementations, and sizes of their generated inputs
+MODULES = [
+    ("day02a", 500), ("day02b", 500), ("day03a", 300), ("day03b", 300), ("day05a", 100),
+    ("day05b", 100), ("day07a", 300), ("day07b", 300), ("day09a", 400), ("day20a", 400),
+    ("day25a", 400),
+]
+
+
+def solve_with(module_name: str, lines: list[str], name: str) -> object:
+    module = import_module(module_name)
+    with backend(name):
+        return module.solve(module.parse(lines))
+
+
+@pytest.mark.parametrize("module_name, size", MODULES)
+def test_backends_agree(module_name: str, size: int):
+    lines = [line + "\n" for line in generate(int(module_name[3:5]), size)]
+    assert solve_with(module_name, lines, "numpy") == solve_with(module_name, lines, "python")
+
+
+def test_backends_agree_on_day11():
+    rng = random.Random(0)
+    lines = ["".join(rng.choices("0123456789", k=10)) + "\n" for _ in range(10)]
+    assert solve_with("day11a", lines, "numpy") == solve_with("day11a", lines, "python")
+
+
+def test_backends_agree_on_indented_day02():
+    lines = ["  forward 5\n", "down 5\n", "\tup 2 \n", "\n", "forward 3\n"]
+    assert solve_with("day02a", lines, "numpy") == solve_with("day02a", lines, "python") == 24
+
+
+def test_backends_agree_on_extract_ints(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(core, "NUMPY_MIN_SIZE", 0)
+    text = "x=-5..10, y=3-4\n" * 100 + "1234567890123"
+
+    with backend("numpy"):
+        vectorized = extract_ints(text)
+    with backend("python"):
+        assert list(vectorized) == list(extract_ints(text))
@@ -0,0 +1,42 @@
+import os
+from pathlib import Path
+
+from cache import Key, ResultCache
+
+
+def key(module: str = "day01a", input_hash: str = "input", source_hash: str = "source") -> Key:
+    return Key(module, input_hash.ljust(64, "0"), source_hash.ljust(64, "0"))
+
+
+def test_get_returns_put_answers(tmp_path: Path):
+    cache = ResultCache(tmp_path)
+    assert cache.get(key()) is None
+
+    cache.put(key(), 1395)
+    assert cache.get(key()) == 1395
+    assert cache.get(key(input_hash="other")) is None
+
+
+def test_answers_of_older_code_are_removed(tmp_path: Path):
+    cache = ResultCache(tmp_path)
+    cache.put(key(source_hash="old"), 1)
+    cache.put(key(module="day01b", source_hash="old"), 2)
+
+    cache.put(key(input_hash="other", source_hash="new"), 3)
+    assert cache.get(key(source_hash="old")) is None
+    assert cache.get(key(module="day01b", source_hash="old")) == 2
+
+
+def test_least_recently_used_answers_are_evicted(tmp_path: Path):
+    cache = ResultCache(tmp_path, max_entries=2)
+    for i, module in enumerate(("day01a", "day02a")):
+        cache.put(key(module), i)
+        os.utime(tmp_path / key(module).file_name(), (i, i))
+
+    # Reading day01a makes day02a the least recently used one
+    assert cache.get(key("day01a")) == 0
+    cache.put(key("day03a"), 2)
+
+    assert cache.get(key("day02a")) is None
+    assert cache.get(key("day01a")) == 0
+    assert cache.get(key("day03a")) == 2
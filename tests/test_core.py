@@ -0,0 +1,105 @@
+from itertools import count
+from pathlib import Path
+
+import pytest
+
+import core
+from core import (Cycle, Grid, PointSet, count_by, empty_str, extract_ints, find_cycle,
+                  intersect_by, isplit_on, load_ints, nth, reduce_by, stream_ints)
+
+
+def test_find_cycle():
+    assert find_cycle(lambda x: (x + 1) % 7, 10) == Cycle(1, 7)
+
+
+def test_find_cycle_gives_up_after_limit():
+    assert find_cycle(lambda x: x + 1, 0, limit=100) is None
+
+
+def test_nth_skips_cycles():
+    assert nth(lambda x: (x + 1) % 7, 0, 10 ** 12) == 10 ** 12 % 7
+
+
+def test_nth_of_sequence_that_never_repeats():
+    assert nth(lambda x: x + 1, 0, 2000) == 2000
+
+
+def test_isplit_on_skips_repeated_separators():
+    lines = ["", "a", "b", "", "", "c", ""]
+    assert [list(group) for group in isplit_on(lines, empty_str)] == [["a", "b"], ["c"]]
+
+
+def test_isplit_on_skips_unconsumed_groups():
+    lines = ["a", "b", "", "c", "d"]
+    assert [next(group) for group in isplit_on(lines, empty_str)] == ["a", "c"]
+
+
+def test_isplit_on_is_lazy():
+    groups = isplit_on(count(1), lambda i: i % 3 == 0)
+    assert list(next(groups)) == [1, 2]
+    assert list(next(groups)) == [4, 5]
+
+
+def test_count_by():
+    assert count_by(["a", "bb", "cc", "d", "eee"], len) == {1: 2, 2: 2, 3: 1}
+
+
+def test_reduce_by():
+    assert reduce_by(range(10), lambda i: i % 3, lambda total, i: total + i, 0) \
+        == {0: 18, 1: 12, 2: 15}
+
+
+def test_intersect_by():
+    words = ["abc", "bcd", "xy", "cde", "yz"]
+    assert intersect_by(words, len) == {3: {"c"}, 2: {"y"}}
+
+
+def test_grid_neighbors_stop_at_edges():
+    grid = Grid.filled(3, 3)
+    assert grid.neighbors(0) == [1, 3]
+    assert grid.neighbors(4, diagonal=True) == [5, 7, 3, 1, 8, 6, 0, 2]
+
+
+def test_grid_neighbors_wrap_around():
+    grid = Grid.filled(3, 2, wrap=True)
+    # east, south, west, north - the opposite edges are adjacent
+    assert grid.neighbors(0) == [1, 3, 2, 3]
+    assert grid.neighbors(5, diagonal=True) == [3, 2, 4, 2, 0, 1, 1, 0]
+
+
+def test_extract_ints():
+    assert list(extract_ints("target area: x=-5..10, y=3")) == [-5, 10, 3]
+    # Only base 10 numbers have signs
+    assert list(extract_ints(b"0101,11 -1", 2)) == [5, 3, 1]
+
+
+def test_stream_ints_across_chunks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(core, "CHUNK_SIZE", 4)
+    path = tmp_path / "numbers"
+    path.write_text("123,-45\n6789,-1\n0,77")
+
+    assert list(stream_ints(path)) == [123, -45, 6789, -1, 0, 77]
+    assert list(stream_ints(path)) == list(load_ints(path))
+
+
+def test_point_set_segment():
+    assert PointSet.segment((2, -1), (0, 1)) == PointSet([(2, -1), (1, 0), (0, 1)])
+    assert PointSet.segment((3, 3), (3, 3)) == PointSet([(3, 3)])
+    with pytest.raises(ValueError):
+        PointSet.segment((0, 0), (1, 2))
+
+
+def test_point_set_operations():
+    points = PointSet([(0, 0), (-3, 5)])
+    assert (-3, 5) in points and points.contains(0, 0) and (5, -3) not in points
+    assert points.translated(3, -5) == PointSet([(3, -5), (0, 0)])
+    assert points | PointSet([(1, 1)]) == PointSet([(0, 0), (-3, 5), (1, 1)])
+    assert points - PointSet([(0, 0)]) == PointSet([(-3, 5)])
+    assert sorted(points) == [(-3, 5), (0, 0)]
+
+
+def test_point_set_folded():
+    points = PointSet([(0, 0), (4, 1), (2, 2), (1, 6)])
+    # Points on the fold line are dropped
+    assert points.folded(0, 2) == PointSet([(0, 0), (0, 1), (1, 6)])
+    assert points.folded(1, 4) == PointSet([(0, 0), (4, 1), (2, 2), (1, 2)])
@@ -0,0 +1,68 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from daemon import Server
+
+COURSE = b"forward 5\ndown 5\nforward 8\nup 3\ndown 8\nforward 2\n"
+
+
+def header(**fields: Any) -> bytes:
+    return json.dumps(fields).encode() + b"\n"
+
+
+async def exchange(path: Path, *messages: bytes) -> list[Any]:
+    """Sends the messages over a single connection, returning all responses until it's closed"""
+    server = await asyncio.start_unix_server(Server().handle_connection, path)
+    async with server:
+        reader, writer = await asyncio.open_unix_connection(path)
+        writer.write(b"".join(messages))
+        writer.write_eof()
+        responses = [json.loads(line) async for line in reader]
+        writer.close()
+    return responses
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path) -> Path:
+    return tmp_path / "aoc.sock"
+
+
+def test_solves_requests_on_one_connection(socket_path: Path) -> None:
+    responses = asyncio.run(exchange(
+        socket_path,
+        header(day=2, part="a", size=len(COURSE)), COURSE,
+        header(day=2, part="b", size=len(COURSE)), COURSE,
+    ))
+    assert [r["answer"] for r in responses] == [150, 900]
+
+
+def test_rejected_request_skips_its_input(socket_path: Path) -> None:
+    responses = asyncio.run(exchange(
+        socket_path,
+        header(day=99, part="a", size=len(COURSE)), COURSE,
+        header(day=2, part="a", size=len(COURSE)), COURSE,
+    ))
+    assert responses == [{"error": "no solution for day 99 part a"}, responses[1]]
+    assert responses[1]["answer"] == 150
+
+
+def test_malformed_header_closes_connection(socket_path: Path) -> None:
+    responses = asyncio.run(exchange(
+        socket_path,
+        b"not json\n",
+        header(day=2, part="a", size=len(COURSE)), COURSE,
+    ))
+    assert len(responses) == 1 and "error" in responses[0]
+
+
+def test_invalid_size_closes_connection(socket_path: Path) -> None:
+    responses = asyncio.run(exchange(
+        socket_path,
+        header(day=2, part="a", size=-1),
+        header(day=2, part="a", size=len(COURSE)), COURSE,
+    ))
+    assert len(responses) == 1 and "size" in responses[0]["error"]
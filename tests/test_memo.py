@@ -0,0 +1,67 @@
+from pathlib import Path
+from typing import Any, Callable
+
+from memo import Memoized, code_hash, memoize
+
+SOURCE = '''
+def f(x):
+    def g(y):
+        return y in {"a", "b", "c"}
+    return g(x) + 1
+'''
+
+
+def compiled(source: str, filename: str = "memo_test.py") -> Callable[..., Any]:
+    namespace: dict[str, Any] = {}
+    exec(compile(source, filename, "exec"), namespace)
+    return namespace["f"]
+
+
+def test_code_hash_ignores_where_the_code_is():
+    assert code_hash(compiled(SOURCE)) == code_hash(compiled("\n\n" + SOURCE, "moved.py"))
+
+
+def test_code_hash_covers_nested_functions():
+    assert code_hash(compiled(SOURCE)) != code_hash(compiled(SOURCE.replace('"c"', '"d"')))
+
+
+def test_memoize_without_persisting():
+    calls: list[int] = []
+
+    @memoize(maxsize=None)
+    def square(x: int) -> int:
+        calls.append(x)
+        return x * x
+
+    assert [square(2), square(3), square(2)] == [4, 9, 4]
+    assert calls == [2, 3]
+    assert square.cache_info().hits == 1
+
+
+def test_memoize_persists_results(tmp_path: Path):
+    path = tmp_path / "square.sqlite"
+    calls: list[int] = []
+
+    def square(x: int) -> int:
+        calls.append(x)
+        return x * x
+
+    first = memoize(persist=path)(square)
+    assert isinstance(first, Memoized)
+    assert first(3) == 9
+    first.cache_close()
+
+    # A later run reads the result from the file
+    second = memoize(persist=path)(square)
+    assert isinstance(second, Memoized)
+    assert second(3) == 9
+    assert calls == [3]
+    assert second.cache_info().disk_hits == 1
+    second.cache_close()
+
+    # ...unless the version of the function changed
+    third = memoize(persist=path, version="2")(square)
+    assert isinstance(third, Memoized)
+    assert third(3) == 9
+    assert calls == [3, 3]
+    third.cache_close()